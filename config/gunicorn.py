@@ -0,0 +1,51 @@
+import multiprocessing
+from os import getenv
+
+bind = getenv("GUNICORN_BIND", "0.0.0.0:8000")
+
+workers = int(getenv("GUNICORN_WORKERS", str(multiprocessing.cpu_count() * 2 + 1)))
+
+threads = int(getenv("GUNICORN_THREADS", "1"))
+
+worker_class = "gthread" if threads > 1 else "sync"
+
+keepalive = int(getenv("GUNICORN_KEEPALIVE", "5"))
+
+timeout = int(getenv("GUNICORN_TIMEOUT", "30"))
+
+graceful_timeout = int(getenv("GUNICORN_GRACEFUL_TIMEOUT", "30"))
+
+max_requests = int(getenv("GUNICORN_MAX_REQUESTS", "1000"))
+
+max_requests_jitter = int(getenv("GUNICORN_MAX_REQUESTS_JITTER", "100"))
+
+# Preloaded workers fork from the master's copy of the code, so a HUP reload
+# keeps serving the old code; deploy with a full restart when this is on
+preload_app = getenv("GUNICORN_PRELOAD", "False") == "True"
+
+pidfile = getenv("GUNICORN_PIDFILE", "/tmp/gunicorn.pid")
+
+accesslog = "-"
+
+errorlog = "-"
+
+
+def when_ready(server):
+    # Runs in the master after the app is preloaded, so workers fork warm
+    if preload_app:
+        from core_apps.common.warmup import warm_up
+
+        warm_up()
+
+
+def post_worker_init(worker):
+    if not preload_app:
+        from core_apps.common.warmup import warm_up
+
+        warm_up()
+
+
+def post_fork(server, worker):
+    from django.db import connections
+
+    connections.close_all()
@@ -0,0 +1,211 @@
+import atexit
+import json
+import logging
+import os
+import queue
+import sys
+import threading
+import time
+import traceback
+from pathlib import Path
+from typing import Any, Dict, Optional, TextIO, Tuple
+
+from loguru import logger
+
+from interceptor import InterceptHandler
+
+TEXT_FORMAT = (
+    "{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}"
+)
+
+COLOR_FORMAT = "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>"
+
+
+def parse_levels(spec: str) -> Dict[str, str]:
+    levels = {}
+    for item in spec.split(","):
+        if "=" in item:
+            name, level = item.split("=", 1)
+            levels[name.strip()] = level.strip().upper()
+    return levels
+
+
+def json_format(record: Dict[str, Any]) -> str:
+    payload = {
+        "time": record["time"].isoformat(),
+        "level": record["level"].name,
+        "logger": record["name"],
+        "function": record["function"],
+        "line": record["line"],
+        "message": record["message"],
+    }
+    extra = {
+        key: value for key, value in record["extra"].items() if key != "serialized"
+    }
+    if extra:
+        payload["extra"] = extra
+    if record["exception"] is not None:
+        exc_type, exc_value, exc_traceback = record["exception"]
+        payload["exception"] = "".join(
+            traceback.format_exception(exc_type, exc_value, exc_traceback)
+        )
+    record["extra"]["serialized"] = json.dumps(payload, default=str)
+    return "{extra[serialized]}\n"
+
+
+class LogFilter:
+    # Per-logger minimum levels plus a per call site rate limit below WARNING
+    def __init__(
+        self, default_level: str, levels: Dict[str, str], sample_rate: int
+    ) -> None:
+        self.default_level = logger.level(default_level).no
+        self.levels = sorted(
+            ((name, logger.level(level).no) for name, level in levels.items()),
+            key=lambda item: len(item[0]),
+            reverse=True,
+        )
+        self.sample_rate = sample_rate
+        self.warning_level = logger.level("WARNING").no
+        self._level_cache: Dict[Optional[str], int] = {}
+        self._windows: Dict[Tuple[Optional[str], int], list] = {}
+        self._lock = threading.Lock()
+
+    def min_level(self) -> int:
+        return min([self.default_level, *(level for _, level in self.levels)])
+
+    def level_for(self, name: Optional[str]) -> int:
+        try:
+            return self._level_cache[name]
+        except KeyError:
+            pass
+        level = self.default_level
+        for prefix, prefix_level in self.levels:
+            if name == prefix or (name or "").startswith(prefix + "."):
+                level = prefix_level
+                break
+        self._level_cache[name] = level
+        return level
+
+    def __call__(self, record: Dict[str, Any]) -> bool:
+        levelno = record["level"].no
+        if levelno < self.level_for(record["name"]):
+            return False
+        if not self.sample_rate or levelno >= self.warning_level:
+            return True
+
+        key = (record["name"], record["line"])
+        second = int(time.monotonic())
+        with self._lock:
+            window = self._windows.get(key)
+            if window is None or window[0] != second:
+                dropped = window[2] if window else 0
+                self._windows[key] = [second, 1, 0]
+                if dropped:
+                    record["extra"]["sampled_out"] = dropped
+                return True
+            if window[1] < self.sample_rate:
+                window[1] += 1
+                return True
+            window[2] += 1
+            return False
+
+
+class BackgroundWriter:
+    # Hands formatted records to a writer thread so log I/O never blocks a request
+    def __init__(self, stream: TextIO, max_size: int) -> None:
+        self.stream = stream
+        self.max_size = max_size
+        self.dropped = 0
+        self.stopped = False
+        self._start()
+        os.register_at_fork(after_in_child=self._restart)
+        atexit.register(self.stop)
+
+    def _restart(self) -> None:
+        # Forked workers inherit the queue but not the thread draining it
+        if not self.stopped:
+            self._start()
+
+    def _start(self) -> None:
+        self._queue: queue.Queue = queue.Queue(maxsize=self.max_size)
+        self._thread = threading.Thread(
+            target=self._run, name="log-writer", daemon=True
+        )
+        self._thread.start()
+
+    def write(self, message: str) -> None:
+        try:
+            self._queue.put_nowait(message)
+        except queue.Full:
+            self.dropped += 1
+
+    def _run(self) -> None:
+        while True:
+            message = self._queue.get()
+            if message is None:
+                break
+            self.stream.write(message)
+            if self._queue.empty():
+                self.stream.flush()
+                if self.dropped:
+                    dropped, self.dropped = self.dropped, 0
+                    logger.warning(f"Log queue full, dropped {dropped} records")
+
+    def stop(self) -> None:
+        if self.stopped:
+            return
+        self.stopped = True
+        try:
+            self._queue.put(None, timeout=1)
+        except queue.Full:
+            return
+        self._thread.join(timeout=5)
+
+
+def configure_logging(
+    log_dir: Path,
+    log_format: str = "text",
+    level: str = "INFO",
+    levels: Optional[Dict[str, str]] = None,
+    sample_rate: int = 0,
+    enqueue: bool = True,
+    queue_size: int = 10000,
+    log_files: bool = True,
+) -> None:
+    levels = levels or {}
+    sink_level = LogFilter(level, levels, sample_rate).min_level()
+    serialize = log_format == "json"
+
+    logger.remove()
+    logger.add(
+        BackgroundWriter(sys.stderr, queue_size) if enqueue else sys.stderr,
+        format=json_format if serialize else COLOR_FORMAT,
+        level=sink_level,
+        filter=LogFilter(level, levels, sample_rate),
+        colorize=not serialize and sys.stderr.isatty(),
+    )
+    if log_files:
+        # File sinks keep loguru's rotation, so they use its own queue instead
+        log_dir.mkdir(exist_ok=True)
+        logger.add(
+            log_dir / "debug.log",
+            rotation="500 MB",
+            retention="10 days",
+            format=json_format if serialize else TEXT_FORMAT,
+            level=sink_level,
+            filter=LogFilter(level, levels, sample_rate),
+            enqueue=enqueue,
+        )
+        logger.add(
+            log_dir / "error.log",
+            rotation="500 MB",
+            retention="10 days",
+            format=json_format if serialize else TEXT_FORMAT,
+            level="ERROR",
+            enqueue=enqueue,
+        )
+
+    # Route stdlib logging (Django, Celery, libraries) through loguru
+    logging.basicConfig(handlers=[InterceptHandler()], level=sink_level, force=True)
+    for name, logger_level in levels.items():
+        logging.getLogger(name).setLevel(logger.level(logger_level).no)
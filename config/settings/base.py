@@ -1,10 +1,10 @@
+from copy import deepcopy
 from pathlib import Path
+from celery.schedules import crontab
 from dotenv import load_dotenv
 from os import getenv, path
-from loguru import logger
-import cloudinary
+from config.logging_config import configure_logging, parse_levels
 from datetime import timedelta, date
-import sys
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve(strict=True).parent.parent.parent
@@ -27,6 +27,7 @@ DJANGO_APPS = [
     "django.contrib.staticfiles",
     "django.contrib.sites",
     "django.contrib.humanize",
+    "django.contrib.postgres",
 ]
 
 THIRD_PARTY_APPS = [
@@ -61,6 +62,7 @@ MIDDLEWARE = [
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "core_apps.user_auth.middleware.CustomHeaderMiddleware",
+    "core_apps.common.db.routers.PrimaryStickinessMiddleware",
 ]
 
 ROOT_URLCONF = "config.urls"
@@ -86,15 +88,81 @@ WSGI_APPLICATION = "config.wsgi.application"
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
+# Set by the uvicorn entrypoint; switches URLs to the async views. These win
+# when requests wait on I/O (login, OTP email) but the fast, DB-bound
+# transaction list runs at about half its WSGI throughput, since every ORM call
+# hops to a thread. Compare both with `manage.py benchasgi`
+ASYNC_VIEWS = getenv("ASYNC_VIEWS", "False") == "True"
+
+ASYNC_PASSWORD_CHECKS = int(getenv("ASYNC_PASSWORD_CHECKS", "4"))
+
+DATABASE_POOL = getenv("DATABASE_POOL", "False") == "True"
+
+DATABASE_PGBOUNCER = getenv("DATABASE_PGBOUNCER", "False") == "True"
+
 DATABASES = {
     "default": {
-        "ENGINE": "django.db.backends.postgresql",
+        "ENGINE": "core_apps.common.db.postgresql",
         "NAME": getenv("POSTGRES_DB"),
         "USER": getenv("POSTGRES_USER"),
         "PASSWORD": getenv("POSTGRES_PASSWORD"),
         "HOST": getenv("POSTGRES_HOST"),
         "PORT": getenv("POSTGRES_PORT"),
+        # Django's pool keeps its own connections, so it replaces CONN_MAX_AGE.
+        # Under ASGI each request's sync code may run on a different thread, so
+        # persistent connections would pile up; use DATABASE_POOL there instead
+        "CONN_MAX_AGE": (
+            0 if DATABASE_POOL or ASYNC_VIEWS else int(getenv("CONN_MAX_AGE", "60"))
+        ),
+        "CONN_HEALTH_CHECKS": True,
+        # Server-side cursors don't survive PgBouncer transaction pooling
+        "DISABLE_SERVER_SIDE_CURSORS": DATABASE_PGBOUNCER,
+        "OPTIONS": {},
+    }
+}
+
+if DATABASE_POOL:
+    # Needs psycopg 3 with the pool extra (psycopg[pool])
+    DATABASES["default"]["OPTIONS"]["pool"] = {
+        "min_size": int(getenv("DATABASE_POOL_MIN_SIZE", "2")),
+        "max_size": int(getenv("DATABASE_POOL_MAX_SIZE", "10")),
+        "timeout": int(getenv("DATABASE_POOL_TIMEOUT", "10")),
+    }
+
+DATABASE_REPLICAS = []
+
+# Comma separated host[:port] of read replicas, reachable as replica_1, replica_2...
+for index, replica in enumerate(
+    filter(None, getenv("DATABASE_REPLICA_HOSTS", "").split(",")), start=1
+):
+    replica_host, _, replica_port = replica.strip().partition(":")
+    DATABASES[f"replica_{index}"] = {
+        **deepcopy(DATABASES["default"]),
+        "HOST": replica_host,
+        "PORT": replica_port or DATABASES["default"]["PORT"],
+        "TEST": {"MIRROR": "default"},
     }
+    DATABASE_REPLICAS.append(f"replica_{index}")
+
+DATABASE_ROUTERS = ["core_apps.common.db.routers.PrimaryReplicaRouter"]
+
+REPLICA_STICKY_SECONDS = int(getenv("REPLICA_STICKY_SECONDS", "15"))
+
+DB_CONNECT_SLOW_MS = int(getenv("DB_CONNECT_SLOW_MS", "100"))
+
+CACHE_URL = getenv("CACHE_URL")
+
+# Shared across workers; the local-memory stand-in is for tests and offline work
+CACHES = {
+    "default": (
+        {
+            "BACKEND": "django_redis.cache.RedisCache",
+            "LOCATION": CACHE_URL,
+            "KEY_PREFIX": "banker",
+        }
+        if CACHE_URL
+        else {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+    )
 }
 
 PASSWORD_HASHERS = [
@@ -144,6 +212,9 @@ SITE_ID = 1
 STATIC_URL = "/static/"
 STATIC_ROOT = str(BASE_DIR / "staticfiles")
 
+MEDIA_URL = "/mediafiles/"
+MEDIA_ROOT = str(BASE_DIR / "mediafiles")
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
@@ -185,6 +256,7 @@ SIMPLE_JWT = {
     "ROTATE_REFRESH_TOKENS": True,
     "USER_ID_FIELD": "id",
     "USER_ID_CLAIM": "user_id",
+    "TOKEN_REFRESH_SERIALIZER": "core_apps.user_auth.tokens.ClaimsTokenRefreshSerializer",
 }
 
 DJOSER = {
@@ -230,25 +302,80 @@ CELERY_TASK_SOFT_TIME_LIMIT = 60
 CELERY_BEAT_SCHEDULER = "django_celery_beat.schedulers:DatabaseScheduler"
 CELERY_WORKER_SEND_TASK_EVENTS = True
 
+# daily, monthly or quarterly; accrual itself always runs daily
+INTEREST_POSTING_FREQUENCY = getenv("INTEREST_POSTING_FREQUENCY", "monthly")
+
+# Verified transfers are queued as pending and posted by the settlement task
+ASYNC_TRANSFER_SETTLEMENT = getenv("ASYNC_TRANSFER_SETTLEMENT", "False") == "True"
+
+TRANSFER_SETTLEMENT_INTERVAL = int(getenv("TRANSFER_SETTLEMENT_INTERVAL", "5"))
+
+TRANSFER_SETTLEMENT_BATCH_SIZE = int(getenv("TRANSFER_SETTLEMENT_BATCH_SIZE", "500"))
+
+# Holds stop counting when they expire; this only sweeps their status
+BALANCE_HOLD_SWEEP_INTERVAL = int(getenv("BALANCE_HOLD_SWEEP_INTERVAL", "60"))
+
 CELERY_BEAT_SCHEDULE = {
     "apply-daily-interest": {
         "task": "apply_daily_interest",
+        "schedule": crontab(minute=5, hour=0),
     },
     "detect-suspicious-activities": {
         "task": "detect_suspicious_activities",
     },
+    "settle-pending-transfers": {
+        "task": "settle_pending_transfers",
+        "schedule": TRANSFER_SETTLEMENT_INTERVAL,
+    },
+    "expire-balance-holds": {
+        "task": "expire_balance_holds",
+        "schedule": BALANCE_HOLD_SWEEP_INTERVAL,
+    },
 }
 
+CONTENT_VIEW_FLUSH_INTERVAL = int(getenv("CONTENT_VIEW_FLUSH_INTERVAL", "30"))
+
+CONTENT_VIEW_BUFFER_SIZE = int(getenv("CONTENT_VIEW_BUFFER_SIZE", "500"))
+
+JSON_RENDERER_BACKEND = getenv("JSON_RENDERER_BACKEND", "orjson")
+
+JSON_STREAM_MIN_ITEMS = int(getenv("JSON_STREAM_MIN_ITEMS", "100"))
+
+JSON_STREAM_CHUNK_SIZE = int(getenv("JSON_STREAM_CHUNK_SIZE", "50"))
+
+CUSTOMER_SEARCH_MIN_LENGTH = int(getenv("CUSTOMER_SEARCH_MIN_LENGTH", "3"))
+
 CLOUDINARY_CLOUD_NAME = getenv("CLOUDINARY_CLOUD_NAME")
 CLOUDINARY_API_KEY = getenv("CLOUDINARY_API_KEY")
 CLOUDINARY_API_SECRET = getenv("CLOUDINARY_API_SECRET")
 
-cloudinary.config(
-    cloud_name=CLOUDINARY_CLOUD_NAME,
-    api_key=CLOUDINARY_API_KEY,
-    api_secret=CLOUDINARY_API_SECRET,
+# Read by cloudinary when it is first imported, so settings don't import it
+CLOUDINARY = {
+    "cloud_name": CLOUDINARY_CLOUD_NAME,
+    "api_key": CLOUDINARY_API_KEY,
+    "api_secret": CLOUDINARY_API_SECRET,
+}
+
+PHOTO_UPLOADER = getenv(
+    "PHOTO_UPLOADER", "core_apps.user_profile.uploads.CloudinaryUploader"
 )
 
+PHOTO_STAGING_ROOT = getenv(
+    "PHOTO_STAGING_ROOT", str(BASE_DIR / "mediafiles" / "staging")
+)
+
+PHOTO_UPLOAD_WORKERS = int(getenv("PHOTO_UPLOAD_WORKERS", "3"))
+
+PHOTO_UPLOAD_MAX_RETRIES = int(getenv("PHOTO_UPLOAD_MAX_RETRIES", "3"))
+
+PHOTO_UPLOAD_RETRY_BACKOFF = float(getenv("PHOTO_UPLOAD_RETRY_BACKOFF", "1"))
+
+PHOTO_MAX_DIMENSION = int(getenv("PHOTO_MAX_DIMENSION", "1600"))
+
+PHOTO_THUMBNAIL_SIZE = int(getenv("PHOTO_THUMBNAIL_SIZE", "200"))
+
+PHOTO_JPEG_QUALITY = int(getenv("PHOTO_JPEG_QUALITY", "85"))
+
 COOKIE_NAME = "access"
 
 COOKIE_SAMESITE = "Lax"
@@ -259,52 +386,46 @@ COOKIE_HTTPONLY = True
 
 COOKIE_SECURE = getenv("COOKIE_SECURE", "True") == "True"
 
+AUTH_TOKEN_CLAIMS = getenv("AUTH_TOKEN_CLAIMS", "True") == "True"
 
-LOGGING_CONFIG = None
+AUTH_TOKEN_CACHE_TTL = int(getenv("AUTH_TOKEN_CACHE_TTL", "60"))
 
-# Configure loguru
-logger.remove()  # Remove default handler
-logger.add(
-    sys.stderr,
-    format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
-    level="DEBUG",
-)
-logger.add(
-    BASE_DIR / "logs" / "debug.log",
-    rotation="500 MB",
-    retention="10 days",
-    format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
-    level="DEBUG",
-)
-logger.add(
-    BASE_DIR / "logs" / "error.log",
-    rotation="500 MB",
-    retention="10 days",
-    format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
-    level="ERROR",
+AUTH_TOKEN_CACHE_SIZE = int(getenv("AUTH_TOKEN_CACHE_SIZE", "10000"))
+
+TIERED_CACHE_TIMEOUT = int(getenv("TIERED_CACHE_TIMEOUT", "300"))
+
+TIERED_CACHE_L1_TIMEOUT = float(getenv("TIERED_CACHE_L1_TIMEOUT", "5"))
+
+TIERED_CACHE_L1_MAX_ENTRIES = int(getenv("TIERED_CACHE_L1_MAX_ENTRIES", "1024"))
+
+SPENDING_ANALYTICS_CACHE_TIMEOUT = int(
+    getenv("SPENDING_ANALYTICS_CACHE_TIMEOUT", str(60 * 60 * 24))
 )
 
-# Create logs directory if it doesn't exist
-(BASE_DIR / "logs").mkdir(exist_ok=True)
 
-LOGGING = {
-    "version": 1,
-    "disable_existing_loggers": False,
-    "handlers": {
-        "loguru": {
-            "class": "interceptor.InterceptHandler",
-            "level": "DEBUG",
-        }
-    },
-    "root": {
-        "handlers": ["loguru"],
-        "level": "DEBUG",
-    },
-    "loggers": {
-        "": {  # Root logger
-            "handlers": ["loguru"],
-            "level": "DEBUG",
-            "propagate": True,
-        },
-    },
-}
+LOGGING_CONFIG = None
+
+LOG_FORMAT = getenv("LOG_FORMAT", "text")
+
+LOG_LEVEL = getenv("LOG_LEVEL", "INFO")
+
+LOG_LEVELS = parse_levels(getenv("LOG_LEVELS", "django.db.backends=WARNING"))
+
+LOG_SAMPLE_RATE = int(getenv("LOG_SAMPLE_RATE", "20"))
+
+LOG_ENQUEUE = getenv("LOG_ENQUEUE", "True") == "True"
+
+LOG_QUEUE_SIZE = int(getenv("LOG_QUEUE_SIZE", "10000"))
+
+LOG_FILES = getenv("LOG_FILES", "True") == "True"
+
+configure_logging(
+    BASE_DIR / "logs",
+    log_format=LOG_FORMAT,
+    level=LOG_LEVEL,
+    levels=LOG_LEVELS,
+    sample_rate=LOG_SAMPLE_RATE,
+    enqueue=LOG_ENQUEUE,
+    queue_size=LOG_QUEUE_SIZE,
+    log_files=LOG_FILES,
+)
@@ -29,8 +29,6 @@ DEFAULT_FROM_EMAIL = getenv("DEFAULT_FROM_EMAIL")
 DOMAIN = getenv("DOMAIN")
 ADMIN_EMAIL = getenv("ADMIN_EMAIL")
 
-MAX_UPLOAD_SIZE = 1 * 1024 * 1024
-
 CSRF_TRUSTED_ORIGINS = ["http://localhost:8080"]
 
 LOCKOUT_DURATION = timedelta(minutes=1)
@@ -38,3 +36,5 @@ LOCKOUT_DURATION = timedelta(minutes=1)
 LOGIN_ATTEMPTS = 3
 
 OTP_EXPIRATION = timedelta(minutes=1)
+
+PENDING_OPERATION_EXPIRATION = timedelta(minutes=5)
@@ -0,0 +1,184 @@
+from typing import Any, Dict
+
+import numpy as np
+from django.contrib.auth import get_user_model
+from django.db.models import (
+    BigIntegerField,
+    BooleanField,
+    Case,
+    ExpressionWrapper,
+    F,
+    Q,
+    TextField,
+    When,
+)
+from django.db.models.functions import Cast, TruncDate
+from django.utils import timezone
+
+from core_apps.common.read_serializers import full_name
+from .caches import analytics_cache
+from .models import Transaction
+
+User = get_user_model()
+
+WEEKDAYS = [
+    "monday",
+    "tuesday",
+    "wednesday",
+    "thursday",
+    "friday",
+    "saturday",
+    "sunday",
+]
+
+TOP_COUNTERPARTIES = 5
+
+
+def load_history(user_id: Any) -> Dict[str, np.ndarray]:
+    # The whole history in one query, one array per column
+    rows = list(
+        Transaction.objects.filter(
+            Q(sender_id=user_id) | Q(receiver_id=user_id),
+            status=Transaction.TransactionStatus.COMPLETED,
+        )
+        .annotate(
+            cents=Cast(F("amount") * 100, BigIntegerField()),
+            day=TruncDate("created_at"),
+            outgoing=ExpressionWrapper(Q(sender_id=user_id), BooleanField()),
+            # As text, which skips building a UUID object per row
+            counterparty=Cast(
+                Case(
+                    When(sender_id=user_id, then=F("receiver_id")),
+                    default=F("sender_id"),
+                ),
+                TextField(),
+            ),
+            currency=Case(
+                When(sender_id=user_id, then=F("sender_account__currency")),
+                default=F("receiver_account__currency"),
+            ),
+        )
+        .order_by()
+        .values_list(
+            "cents", "day", "transaction_type", "outgoing", "counterparty", "currency"
+        )
+    )
+    cents, days, types, outgoing, counterparties, currencies = (
+        zip(*rows) if rows else ([],) * 6
+    )
+    return {
+        "cents": np.array(cents, dtype=np.int64),
+        "day": np.array(days, dtype="datetime64[D]"),
+        "type": np.array(types, dtype=str),
+        "outgoing": np.array(outgoing, dtype=bool),
+        "counterparty": np.array(
+            ["" if party is None else party for party in counterparties],
+            dtype=str,
+        ),
+        "currency": np.array(
+            ["unknown" if currency is None else currency for currency in currencies],
+            dtype=str,
+        ),
+    }
+
+
+def to_amount(cents: Any) -> float:
+    return round(float(cents) / 100, 2)
+
+
+def spending_metrics(
+    history: Dict[str, np.ndarray], spend: np.ndarray
+) -> Dict[str, Any]:
+    days = history["day"]
+    today = np.datetime64(timezone.localdate(), "D")
+    first_day = days.min()
+    day_index = (days - first_day).astype(np.int64)
+    period_days = int((today - first_day).astype(np.int64)) + 1
+
+    spend_cents = np.where(spend, history["cents"], 0)
+    daily_spend = np.bincount(day_index, weights=spend_cents, minlength=period_days)
+    inflow = ~history["outgoing"]
+
+    # 1970-01-01 was a Thursday, so shifting by 3 makes Monday weekday 0
+    weekdays = (days.astype(np.int64) + 3) % 7
+    weekday_spend = np.bincount(weekdays, weights=spend_cents, minlength=7)
+    weekday_count = np.bincount(weekdays[spend], minlength=7)
+
+    # Only transfers have a counterparty; withdrawals have none
+    parties = history["counterparty"]
+    named = spend & (parties != "")
+    party_ids, party_index = np.unique(parties[named], return_inverse=True)
+    party_totals = np.bincount(party_index, weights=history["cents"][named])
+    party_counts = np.bincount(party_index)
+    top = np.argsort(party_totals)[::-1][:TOP_COUNTERPARTIES]
+
+    types, type_index = np.unique(history["type"][spend], return_inverse=True)
+    type_totals = np.bincount(type_index, weights=history["cents"][spend])
+
+    return {
+        "first_transaction": str(first_day),
+        "period_days": period_days,
+        "transaction_count": int(len(days)),
+        "total_spend": to_amount(spend_cents.sum()),
+        "total_inflow": to_amount(history["cents"][inflow].sum()),
+        "average_daily_spend": to_amount(daily_spend.mean()),
+        "daily_spend_volatility": to_amount(daily_spend.std()),
+        "largest_daily_spend": to_amount(daily_spend.max()),
+        "spend_by_type": {
+            str(name): to_amount(total) for name, total in zip(types, type_totals)
+        },
+        "largest_counterparties": [
+            {
+                "user_id": str(party_ids[index]),
+                "total": to_amount(party_totals[index]),
+                "count": int(party_counts[index]),
+            }
+            for index in top
+        ],
+        "weekdays": [
+            {
+                "weekday": WEEKDAYS[weekday],
+                "total_spend": to_amount(weekday_spend[weekday]),
+                "count": int(weekday_count[weekday]),
+            }
+            for weekday in range(7)
+        ],
+    }
+
+
+def add_counterparty_names(currencies: Dict[str, Dict[str, Any]]) -> None:
+    parties = [
+        party
+        for metrics in currencies.values()
+        for party in metrics["largest_counterparties"]
+    ]
+    names = {
+        str(user["id"]): full_name(user["first_name"], user["last_name"])
+        for user in User.objects.filter(
+            id__in={party["user_id"] for party in parties}
+        ).values("id", "first_name", "last_name")
+    }
+    for party in parties:
+        party["name"] = names.get(party["user_id"])
+
+
+def compute_spending_analytics(user_id: Any) -> Dict[str, Any]:
+    history = load_history(user_id)
+    # Money leaving the user, other than moves between their own accounts and cards
+    spend = history["outgoing"] & (history["counterparty"] != str(user_id))
+
+    currencies = {}
+    for currency in np.unique(history["currency"]):
+        in_currency = history["currency"] == currency
+        currencies[str(currency)] = spending_metrics(
+            {column: values[in_currency] for column, values in history.items()},
+            spend[in_currency],
+        )
+    add_counterparty_names(currencies)
+    return {"generated_at": timezone.now().isoformat(), "currencies": currencies}
+
+
+def get_spending_analytics(user_id: Any) -> Dict[str, Any]:
+    return analytics_cache.get_or_set(
+        user_id, lambda: compute_spending_analytics(user_id)
+    )
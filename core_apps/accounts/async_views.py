@@ -0,0 +1,16 @@
+from typing import Any
+
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from core_apps.common.async_views import AsyncAPIView, AsyncValuesListMixin
+from .views import TransactionListAPIView
+
+
+class AsyncTransactionListAPIView(
+    AsyncAPIView, AsyncValuesListMixin, TransactionListAPIView
+):
+    async def get(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        response = await self.alist(request, *args, **kwargs)
+        self.log_retrieval(request)
+        return response
@@ -0,0 +1,201 @@
+import random
+from typing import Optional
+from decimal import Decimal
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, Sum
+from django.utils import timezone
+
+from .models import BalanceHold, BalanceShard, BankAccount, Transaction
+
+
+class InsufficientFunds(Exception):
+    pass
+
+
+class HoldExpired(Exception):
+    pass
+
+
+def lock_order(account: BankAccount) -> str:
+    # Every path that locks several accounts takes them in this order
+    return str(account.pk)
+
+
+def lock_balance(account: BankAccount) -> Decimal:
+    # Locks the account row and then every shard in slot order, and folds the
+    # shards back into account_balance so the locked total is in one place
+    locked = BankAccount.objects.select_for_update().get(pk=account.pk)
+    account.account_balance = locked.account_balance
+    account.balance_shards = locked.balance_shards
+    shards = list(
+        BalanceShard.objects.select_for_update()
+        .filter(account_id=account.pk)
+        .order_by("slot")
+        .values_list("balance", flat=True)
+    )
+    shard_total = sum(shards, Decimal("0.00"))
+    if shard_total:
+        BalanceShard.objects.filter(account_id=account.pk).update(balance=0)
+        account.account_balance += shard_total
+        BankAccount.objects.filter(pk=account.pk).update(
+            account_balance=account.account_balance, updated_at=timezone.now()
+        )
+    return account.account_balance
+
+
+def pending_outflow(account_id) -> Decimal:
+    # Queued transfers hold their amount until settlement posts them
+    total = Transaction.objects.filter(
+        sender_account_id=account_id, status=Transaction.TransactionStatus.PENDING
+    ).aggregate(total=Sum("amount"))["total"]
+    return total or Decimal("0.00")
+
+
+def active_holds():
+    # Expired holds stop counting at once; the sweep only tidies their status
+    return BalanceHold.objects.filter(
+        status=BalanceHold.HoldStatus.ACTIVE, expires_at__gt=timezone.now()
+    )
+
+
+def held_amount(account_id) -> Decimal:
+    total = (
+        active_holds()
+        .filter(account_id=account_id)
+        .aggregate(total=Sum("amount"))["total"]
+    )
+    return (total or Decimal("0.00")) + pending_outflow(account_id)
+
+
+def available_balance(account: BankAccount) -> Decimal:
+    return account.get_total_balance() - held_amount(account.pk)
+
+
+def reserve(account: BankAccount, amount: Decimal, hold_id: Optional[str]) -> None:
+    # Must run in a transaction: locks the balance, captures the operation's own
+    # hold and checks the amount against what the other holds leave available
+    balance = lock_balance(account)
+    if hold_id is not None and not active_holds().filter(
+        pk=hold_id, account_id=account.pk
+    ).update(status=BalanceHold.HoldStatus.CAPTURED, updated_at=timezone.now()):
+        raise HoldExpired(f"Hold {hold_id} is no longer active")
+    if balance - held_amount(account.pk) < amount:
+        raise InsufficientFunds(
+            f"Insufficient funds in account {account.account_number}"
+        )
+
+
+def place_hold(account: BankAccount, amount: Decimal, hold_type: str) -> BalanceHold:
+    with transaction.atomic():
+        reserve(account, amount, None)
+        return BalanceHold.objects.create(
+            account=account,
+            amount=amount,
+            hold_type=hold_type,
+            expires_at=timezone.now() + settings.PENDING_OPERATION_EXPIRATION,
+        )
+
+
+def extend_hold(hold_id: Optional[str]) -> bool:
+    # Re-issuing an operation's token gives it a fresh window; its hold follows
+    if hold_id is None:
+        return True
+    return bool(
+        active_holds()
+        .filter(pk=hold_id)
+        .update(
+            expires_at=timezone.now() + settings.PENDING_OPERATION_EXPIRATION,
+            updated_at=timezone.now(),
+        )
+    )
+
+
+def release_hold(hold_id: Optional[str]) -> None:
+    if hold_id is not None:
+        BalanceHold.objects.filter(
+            pk=hold_id, status=BalanceHold.HoldStatus.ACTIVE
+        ).update(status=BalanceHold.HoldStatus.RELEASED, updated_at=timezone.now())
+
+
+def expire_holds() -> int:
+    return BalanceHold.objects.filter(
+        status=BalanceHold.HoldStatus.ACTIVE, expires_at__lte=timezone.now()
+    ).update(status=BalanceHold.HoldStatus.EXPIRED, updated_at=timezone.now())
+
+
+def debit(account: BankAccount, amount: Decimal, hold_id: Optional[str] = None) -> None:
+    with transaction.atomic():
+        reserve(account, amount, hold_id)
+        account.account_balance -= amount
+        BankAccount.objects.filter(pk=account.pk).update(
+            account_balance=F("account_balance") - amount, updated_at=timezone.now()
+        )
+
+
+def credit(account: BankAccount, amount: Decimal) -> None:
+    if account.balance_shards:
+        slot = random.randrange(account.balance_shards)
+        if BalanceShard.objects.filter(account_id=account.pk, slot=slot).update(
+            balance=F("balance") + amount
+        ):
+            return
+        # Sharding was turned off or resized since the account was loaded
+
+    BankAccount.objects.filter(pk=account.pk).update(
+        account_balance=F("account_balance") + amount, updated_at=timezone.now()
+    )
+    account.refresh_from_db(fields=["account_balance"])
+
+
+def transfer(
+    sender: BankAccount,
+    receiver: BankAccount,
+    amount: Decimal,
+    hold_id: Optional[str] = None,
+) -> None:
+    with transaction.atomic():
+        for account in sorted([sender, receiver], key=lock_order):
+            if account is sender:
+                debit(sender, amount, hold_id)
+            else:
+                credit(receiver, amount)
+
+
+def queue_transfer(
+    sender: BankAccount,
+    receiver: BankAccount,
+    amount: Decimal,
+    description: str,
+    hold_id: Optional[str] = None,
+) -> Transaction:
+    # Only the sender is locked; the receiver is credited later by settlement.
+    # The pending row takes over from the hold until then
+    with transaction.atomic():
+        reserve(sender, amount, hold_id)
+        return Transaction.objects.create(
+            user=sender.user,
+            sender=sender.user,
+            sender_account=sender,
+            receiver=receiver.user,
+            receiver_account=receiver,
+            amount=amount,
+            description=description,
+            transaction_type=Transaction.TransactionType.TRANSFER,
+            status=Transaction.TransactionStatus.PENDING,
+        )
+
+
+def set_balance_shards(account: BankAccount, slots: int) -> None:
+    with transaction.atomic():
+        lock_balance(account)
+        BalanceShard.objects.filter(account_id=account.pk, slot__gte=slots).delete()
+        BalanceShard.objects.bulk_create(
+            [BalanceShard(account_id=account.pk, slot=slot) for slot in range(slots)],
+            ignore_conflicts=True,
+        )
+        account.balance_shards = slots
+        BankAccount.objects.filter(pk=account.pk).update(
+            balance_shards=slots, updated_at=timezone.now()
+        )
@@ -0,0 +1,8 @@
+from django.conf import settings
+
+from core_apps.common.cache import get_tiered_cache
+
+# Spending analytics payloads keyed by user id, dropped when a transaction posts
+analytics_cache = get_tiered_cache(
+    "spending_analytics", timeout=settings.SPENDING_ANALYTICS_CACHE_TIMEOUT
+)
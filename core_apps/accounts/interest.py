@@ -0,0 +1,105 @@
+from datetime import date, timedelta
+from decimal import ROUND_HALF_UP, Decimal
+
+from django.db import transaction
+from django.db.models import Case, DecimalField, F, Q, Value, When
+from django.utils import timezone
+from loguru import logger
+
+from .balances import lock_balance, lock_order
+from .models import BankAccount, Transaction
+
+POSTING_FREQUENCIES = {"daily", "monthly", "quarterly"}
+
+
+def annual_rate_expression() -> Case:
+    # BankAccount.annual_interest_rate as SQL, so accrual is a single UPDATE
+    return Case(
+        *(
+            When(account_balance__lt=balance_below, then=Value(rate))
+            for balance_below, rate in BankAccount.INTEREST_TIERS
+        ),
+        default=Value(BankAccount.TOP_INTEREST_RATE),
+        output_field=DecimalField(max_digits=5, decimal_places=4),
+    )
+
+
+def is_posting_day(day: date, frequency: str) -> bool:
+    if frequency not in POSTING_FREQUENCIES:
+        raise ValueError(f"Unknown interest posting frequency: {frequency}")
+    if frequency == "daily":
+        return True
+    month_end = (day + timedelta(days=1)).day == 1
+    if frequency == "monthly":
+        return month_end
+    return month_end and day.month % 3 == 0
+
+
+def accrue_interest(day: date) -> int:
+    # Idempotent per day: accounts already accrued for this day are skipped
+    due = BankAccount.objects.filter(
+        account_type=BankAccount.AccountType.SAVINGS
+    ).filter(Q(interest_accrued_on__lt=day) | Q(interest_accrued_on__isnull=True))
+
+    with transaction.atomic():
+        # Fold sharded balances into account_balance first and keep the shards
+        # locked, so every credit up to now earns interest and none land mid-way
+        for account in sorted(due.filter(balance_shards__gt=0), key=lock_order):
+            lock_balance(account)
+
+        return due.update(
+            accrued_interest=F("accrued_interest")
+            + F("account_balance") * annual_rate_expression() / Value(Decimal("365")),
+            interest_accrued_on=day,
+            updated_at=timezone.now(),
+        )
+
+
+def post_account_interest(account_id, day: date) -> Decimal:
+    with transaction.atomic():
+        account = (
+            BankAccount.objects.select_for_update()
+            .select_related("user")
+            .get(pk=account_id)
+        )
+        interest = account.accrued_interest.quantize(
+            Decimal(".01"), rounding=ROUND_HALF_UP
+        )
+        if interest <= 0:
+            return Decimal("0.00")
+
+        # The sub-cent remainder stays accrued for the next period
+        account.account_balance += interest
+        account.accrued_interest -= interest
+        account.save(
+            update_fields=["account_balance", "accrued_interest", "updated_at"]
+        )
+
+        Transaction.objects.create(
+            user=account.user,
+            amount=interest,
+            transaction_type=Transaction.TransactionType.INTEREST,
+            description=f"Interest to {day:%Y-%m-%d}",
+            receiver=account.user,
+            receiver_account=account,
+            status=Transaction.TransactionStatus.COMPLETED,
+        )
+    return interest
+
+
+def post_interest(day: date) -> int:
+    account_ids = list(
+        BankAccount.objects.filter(
+            account_type=BankAccount.AccountType.SAVINGS,
+            accrued_interest__gte=Decimal("0.005"),
+        ).values_list("pk", flat=True)
+    )
+
+    posted = 0
+    for account_id in account_ids:
+        try:
+            if post_account_interest(account_id, day):
+                posted += 1
+        except Exception as e:
+            logger.error(f"Failed to post interest to account {account_id}: {str(e)}")
+    return posted
@@ -0,0 +1,35 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from core_apps.accounts.models import BankAccount
+from core_apps.accounts.rollups import rebuild_summaries
+
+
+class Command(BaseCommand):
+    help = "Rebuild the monthly account summaries from the transaction history"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("account_numbers", nargs="*")
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        accounts = BankAccount.objects.order_by("pk")
+        if options["account_numbers"]:
+            accounts = accounts.filter(account_number__in=options["account_numbers"])
+        account_ids = list(accounts.values_list("pk", flat=True))
+
+        batch_size = options["batch_size"]
+        rows = 0
+        for offset in range(0, len(account_ids), batch_size):
+            # One short transaction per batch keeps account locks brief
+            rows += rebuild_summaries(account_ids[offset : offset + batch_size])
+            self.stdout.write(
+                f"{min(offset + batch_size, len(account_ids))}/{len(account_ids)} "
+                f"accounts rebuilt"
+            )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Rebuilt {rows} monthly summaries for {len(account_ids)} accounts"
+            )
+        )
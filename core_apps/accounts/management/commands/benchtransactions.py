@@ -0,0 +1,125 @@
+import time
+from decimal import Decimal
+from typing import Any, Callable, List
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import transaction
+from django.db.models import QuerySet
+from django.utils.crypto import get_random_string
+
+from core_apps.accounts.models import BankAccount, Transaction
+from core_apps.accounts.serializers import (
+    TransactionSerializer,
+    TransactionValuesSerializer,
+)
+from core_apps.user_auth.models import User
+
+
+class Rollback(Exception):
+    pass
+
+
+def create_transfers(rows: int) -> QuerySet:
+    # Callers run this inside a transaction they roll back
+    sender_account, receiver_account = create_accounts()
+    Transaction.objects.bulk_create(
+        Transaction(
+            user=sender_account.user,
+            sender=sender_account.user,
+            receiver=receiver_account.user,
+            sender_account=sender_account,
+            receiver_account=receiver_account,
+            amount=Decimal("100.00") + index,
+            description=f"Benchmark transfer #{index}",
+            status=Transaction.TransactionStatus.COMPLETED,
+            transaction_type=Transaction.TransactionType.TRANSFER,
+        )
+        for index in range(rows)
+    )
+    return Transaction.objects.filter(sender_account=sender_account)
+
+
+def create_accounts() -> List[BankAccount]:
+    accounts = []
+    for index in (1, 2):
+        user = User.objects.create_user(
+            email=f"benchmark{index}@example.com",
+            password=get_random_string(32),
+            first_name="Benchmark",
+            last_name=f"User {index}",
+            id_no=900000000 + index,
+            security_question="maiden_name",
+            security_answer="benchmark",
+        )
+        accounts.append(
+            BankAccount.objects.create(
+                user=user,
+                account_number=f"99990000000000{index:02d}",
+                currency=BankAccount.AccountCurrency.DOLLAR,
+                account_type=BankAccount.AccountType.CURRENT,
+            )
+        )
+    return accounts
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the model and .values() transaction serializers on throwaway "
+        "rows; nothing is kept in the database"
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--rows", type=int, default=5000)
+        parser.add_argument("--repeat", type=int, default=5)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        try:
+            with transaction.atomic():
+                self.run(options["rows"], options["repeat"])
+                raise Rollback
+        except Rollback:
+            pass
+
+    def run(self, rows: int, repeat: int) -> None:
+        queryset = create_transfers(rows)
+
+        def model_rows() -> List[Any]:
+            return TransactionSerializer(queryset.all(), many=True).data
+
+        def joined_model_rows() -> List[Any]:
+            return TransactionSerializer(
+                queryset.select_related(
+                    "sender",
+                    "receiver",
+                    "sender_account__user",
+                    "receiver_account__user",
+                ),
+                many=True,
+            ).data
+
+        def values_rows() -> List[Any]:
+            return TransactionValuesSerializer(
+                TransactionValuesSerializer.get_values_queryset(queryset)
+            ).data
+
+        if [dict(row) for row in joined_model_rows()] != values_rows():
+            raise CommandError("The two serializers rendered different rows")
+
+        self.stdout.write(f"{rows} rows, best of {repeat}, including the query")
+        for name, serialize in (
+            ("model", model_rows),
+            ("joined", joined_model_rows),
+            ("values", values_rows),
+        ):
+            seconds = self.best_of(serialize, repeat)
+            self.stdout.write(
+                f"{name:>8}: {seconds * 1000:>8.1f}ms {rows / seconds:>10,.0f} rows/s"
+            )
+
+    def best_of(self, serialize: Callable[[], List[Any]], repeat: int) -> float:
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            serialize()
+            timings.append(time.perf_counter() - started)
+        return min(timings)
@@ -0,0 +1,30 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from core_apps.accounts.balances import set_balance_shards
+from core_apps.accounts.models import BankAccount
+
+
+class Command(BaseCommand):
+    help = "Spread a hot account's balance over several rows, or fold it back with 0"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("account_number")
+        parser.add_argument("--slots", type=int, required=True)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        slots = options["slots"]
+        if not 0 <= slots <= 64:
+            raise CommandError("--slots must be between 0 and 64")
+        try:
+            account = BankAccount.objects.get(account_number=options["account_number"])
+        except BankAccount.DoesNotExist:
+            raise CommandError(f"Account {options['account_number']} does not exist")
+
+        set_balance_shards(account, slots)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Account {account.account_number} now has {slots} balance shards"
+            )
+        )
@@ -0,0 +1,49 @@
+# Generated by Django 5.2.1 on 2026-10-19 13:03
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def demote_duplicate_primary_accounts(apps, schema_editor):
+    BankAccount = apps.get_model("accounts", "BankAccount")
+
+    users_with_duplicates = (
+        BankAccount.objects.filter(is_primary=True)
+        .values("user")
+        .annotate(total=Count("id"))
+        .filter(total__gt=1)
+        .values_list("user", flat=True)
+    )
+    for user_id in users_with_duplicates:
+        keep = (
+            BankAccount.objects.filter(user_id=user_id, is_primary=True)
+            .order_by("created_at")
+            .values_list("pk", flat=True)
+            .first()
+        )
+        BankAccount.objects.filter(user_id=user_id, is_primary=True).exclude(
+            pk=keep
+        ).update(is_primary=False)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            demote_duplicate_primary_accounts, migrations.RunPython.noop
+        ),
+        migrations.AddConstraint(
+            model_name="bankaccount",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("is_primary", True)),
+                fields=("user",),
+                name="unique_primary_bank_account",
+            ),
+        ),
+    ]
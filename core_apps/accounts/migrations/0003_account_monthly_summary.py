@@ -0,0 +1,88 @@
+# Generated by Django 5.2.1 on 2026-10-19 13:37
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0002_unique_primary_bank_account"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AccountMonthlySummary",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "month",
+                    models.DateField(
+                        help_text="First day of the month", verbose_name="Month"
+                    ),
+                ),
+                (
+                    "inflow",
+                    models.DecimalField(
+                        decimal_places=2,
+                        default=0.0,
+                        max_digits=16,
+                        verbose_name="Inflow",
+                    ),
+                ),
+                (
+                    "outflow",
+                    models.DecimalField(
+                        decimal_places=2,
+                        default=0.0,
+                        max_digits=16,
+                        verbose_name="Outflow",
+                    ),
+                ),
+                (
+                    "interest",
+                    models.DecimalField(
+                        decimal_places=2,
+                        default=0.0,
+                        max_digits=16,
+                        verbose_name="Interest",
+                    ),
+                ),
+                (
+                    "transaction_count",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="Transaction Count"
+                    ),
+                ),
+                (
+                    "account",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="monthly_summaries",
+                        to="accounts.bankaccount",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Account Monthly Summary",
+                "verbose_name_plural": "Account Monthly Summaries",
+                "ordering": ["-month"],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("account", "month"), name="unique_account_month_summary"
+                    )
+                ],
+            },
+        ),
+    ]
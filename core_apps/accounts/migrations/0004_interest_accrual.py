@@ -0,0 +1,31 @@
+# Generated by Django 5.2.1 on 2026-10-19 13:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0003_account_monthly_summary"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="bankaccount",
+            name="accrued_interest",
+            field=models.DecimalField(
+                decimal_places=6,
+                default=0,
+                help_text="Interest earned since the last posting, not yet in the balance",
+                max_digits=16,
+                verbose_name="Accrued Interest",
+            ),
+        ),
+        migrations.AddField(
+            model_name="bankaccount",
+            name="interest_accrued_on",
+            field=models.DateField(
+                blank=True, null=True, verbose_name="Interest Accrued On"
+            ),
+        ),
+    ]
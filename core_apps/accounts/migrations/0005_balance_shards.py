@@ -0,0 +1,85 @@
+# Generated by Django 5.2.1 on 2026-10-19 13:48
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0004_interest_accrual"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="BalanceShard",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("slot", models.PositiveSmallIntegerField(verbose_name="Slot")),
+                (
+                    "balance",
+                    models.DecimalField(
+                        decimal_places=2,
+                        default=0.0,
+                        max_digits=12,
+                        verbose_name="Balance",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Balance Shard",
+                "verbose_name_plural": "Balance Shards",
+            },
+        ),
+        migrations.RemoveConstraint(
+            model_name="accountmonthlysummary",
+            name="unique_account_month_summary",
+        ),
+        migrations.AddField(
+            model_name="accountmonthlysummary",
+            name="slot",
+            field=models.PositiveSmallIntegerField(default=0, verbose_name="Slot"),
+        ),
+        migrations.AddField(
+            model_name="bankaccount",
+            name="balance_shards",
+            field=models.PositiveSmallIntegerField(
+                default=0,
+                help_text="Spread incoming credits over this many balance slots (0 disables)",
+                verbose_name="Balance Shards",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="accountmonthlysummary",
+            constraint=models.UniqueConstraint(
+                fields=("account", "month", "slot"),
+                name="unique_account_month_slot_summary",
+            ),
+        ),
+        migrations.AddField(
+            model_name="balanceshard",
+            name="account",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="shards",
+                to="accounts.bankaccount",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="balanceshard",
+            constraint=models.UniqueConstraint(
+                fields=("account", "slot"), name="unique_balance_shard_slot"
+            ),
+        ),
+    ]
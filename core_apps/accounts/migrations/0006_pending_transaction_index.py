@@ -0,0 +1,23 @@
+# Generated by Django 5.2.1 on 2026-10-19 13:53
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0005_balance_shards"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="transaction",
+            index=models.Index(
+                condition=models.Q(("status", "pending")),
+                fields=["sender_account", "created_at"],
+                name="transaction_pending_idx",
+            ),
+        ),
+    ]
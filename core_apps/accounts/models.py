@@ -1,16 +1,16 @@
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError
-from django.db import models
+from django.db import models, transaction
 from django.utils.translation import gettext_lazy as _
 
+from core_apps.common.mixins import DirtyFieldsMixin
 from core_apps.common.models import TimeStampedModel
-from decimal import Decimal, ROUND_HALF_UP
-from loguru import logger
+from decimal import Decimal
 
 User = get_user_model()
 
 
-class BankAccount(TimeStampedModel):
+class BankAccount(DirtyFieldsMixin, TimeStampedModel):
     class AccountType(models.TextChoices):
         CURRENT = ("current", _("Current"))
         SAVINGS = ("savings", _("Savings"))
@@ -70,6 +70,30 @@ class BankAccount(TimeStampedModel):
         default=0.00,
         help_text=_("Annual interest rate as a decimal (e.g 0.0150 for 1.50%)"),
     )
+    accrued_interest = models.DecimalField(
+        _("Accrued Interest"),
+        max_digits=16,
+        decimal_places=6,
+        default=0,
+        help_text=_("Interest earned since the last posting, not yet in the balance"),
+    )
+    interest_accrued_on = models.DateField(
+        _("Interest Accrued On"), null=True, blank=True
+    )
+    balance_shards = models.PositiveSmallIntegerField(
+        _("Balance Shards"),
+        default=0,
+        help_text=_(
+            "Spread incoming credits over this many balance slots (0 disables)"
+        ),
+    )
+
+    # Savings balance tiers: (balance below, annual rate)
+    INTEREST_TIERS = [
+        (Decimal("100000"), Decimal("0.0050")),
+        (Decimal("500000"), Decimal("0.0100")),
+    ]
+    TOP_INTEREST_RATE = Decimal("0.0150")
 
     def __str__(self) -> str:
         return (
@@ -82,51 +106,127 @@ class BankAccount(TimeStampedModel):
         if self.account_type != self.AccountType.SAVINGS:
             return Decimal("0.0000")
 
-        balance = self.account_balance
-        if balance < Decimal("100000"):
-            return Decimal("0.0050")
-        elif Decimal("100000") <= balance < Decimal("500000"):
-            return Decimal("0.0100")
-        else:
-            return Decimal("0.0150")
-
-    def apply_daily_interest(self):
-        if self.account_type == self.AccountType.SAVINGS:
-            daily_rate = self.annual_interest_rate / Decimal("365")
-            interest = (Decimal(self.account_balance) * daily_rate).quantize(
-                Decimal(".01"), rounding=ROUND_HALF_UP
-            )
-            logger.info(
-                f"Applying daily interest {interest} to account {self.account_number}"
-            )
-            self.account_balance += interest
-            self.save()
-
-            Transaction.objects.create(
-                user=self.user,
-                amount=interest,
-                transaction_type=Transaction.TransactionType.INTEREST,
-                description="Daily interest applied",
-                receiver=self.user,
-                receiver_account=self,
-                status=Transaction.TransactionStatus.COMPLETED,
-            )
-            return interest
-        return Decimal("0.00")
+        for balance_below, rate in self.INTEREST_TIERS:
+            if self.account_balance < balance_below:
+                return rate
+        return self.TOP_INTEREST_RATE
 
     class Meta:
         verbose_name = _("Bank Account")
         verbose_name_plural = _("Bank Accounts")
         unique_together = ["user", "currency", "account_type"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user"],
+                condition=models.Q(is_primary=True),
+                name="unique_primary_bank_account",
+            )
+        ]
+
+    def get_total_balance(self) -> Decimal:
+        if not self.balance_shards:
+            return self.account_balance
+        shard_total = self.shards.aggregate(total=models.Sum("balance"))["total"]
+        return self.account_balance + (shard_total or 0)
 
     def clean(self) -> None:
         if self.account_balance < 0:
             raise ValidationError(_("Account balance cannot be negative."))
 
-    def save(self, *args, **kwargs) -> None:
+    def validate_constraints(self, exclude=None) -> None:
+        # Saving a new primary account demotes the old one, so it never conflicts
+        super().validate_constraints(exclude={*(exclude or ()), "is_primary"})
+
+    def set_primary(self) -> None:
         if self.is_primary:
-            BankAccount.objects.filter(user=self.user).update(is_primary=False)
-        super().save(*args, **kwargs)
+            return
+        self.is_primary = True
+        self.save(update_fields=["is_primary", "updated_at"])
+
+    def save(self, *args, **kwargs) -> None:
+        if not (self.is_primary and "is_primary" in self.get_dirty_fields()):
+            super().save(*args, **kwargs)
+            return
+
+        with transaction.atomic(using=kwargs.get("using")):
+            BankAccount.objects.filter(user_id=self.user_id, is_primary=True).exclude(
+                pk=self.pk
+            ).update(is_primary=False)
+            super().save(*args, **kwargs)
+
+
+class BalanceShard(TimeStampedModel):
+    # Part of a hot account's balance; credits pick a slot at random so they
+    # don't all queue on the BankAccount row
+    account = models.ForeignKey(
+        BankAccount, on_delete=models.CASCADE, related_name="shards"
+    )
+    slot = models.PositiveSmallIntegerField(_("Slot"))
+    balance = models.DecimalField(
+        _("Balance"), decimal_places=2, max_digits=12, default=0.00
+    )
+
+    def __str__(self) -> str:
+        return f"{self.account.account_number} - slot {self.slot}"
+
+    class Meta:
+        verbose_name = _("Balance Shard")
+        verbose_name_plural = _("Balance Shards")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["account", "slot"], name="unique_balance_shard_slot"
+            )
+        ]
+
+
+class BalanceHold(TimeStampedModel):
+    # Reserves part of the available balance between initiating an operation and
+    # confirming it; the ledger balance only moves when the hold is captured
+    class HoldType(models.TextChoices):
+        WITHDRAWAL = ("withdrawal", _("Withdrawal"))
+        TRANSFER = ("transfer", _("Transfer"))
+
+    class HoldStatus(models.TextChoices):
+        ACTIVE = ("active", _("Active"))
+        CAPTURED = ("captured", _("Captured"))
+        RELEASED = ("released", _("Released"))
+        EXPIRED = ("expired", _("Expired"))
+
+    account = models.ForeignKey(
+        BankAccount, on_delete=models.CASCADE, related_name="holds"
+    )
+    amount = models.DecimalField(_("Amount"), decimal_places=2, max_digits=12)
+    hold_type = models.CharField(
+        _("Hold Type"), max_length=20, choices=HoldType.choices
+    )
+    status = models.CharField(
+        _("Status"),
+        max_length=20,
+        choices=HoldStatus.choices,
+        default=HoldStatus.ACTIVE,
+    )
+    expires_at = models.DateTimeField(_("Expires At"))
+
+    def __str__(self) -> str:
+        return (
+            f"{self.hold_type} hold of {self.amount} on {self.account.account_number}"
+        )
+
+    class Meta:
+        verbose_name = _("Balance Hold")
+        verbose_name_plural = _("Balance Holds")
+        indexes = [
+            models.Index(
+                fields=["account", "expires_at"],
+                condition=models.Q(status="active"),
+                name="balance_hold_active_idx",
+            ),
+            models.Index(
+                fields=["expires_at"],
+                condition=models.Q(status="active"),
+                name="balance_hold_expiry_idx",
+            ),
+        ]
 
 
 class Transaction(TimeStampedModel):
@@ -184,4 +284,45 @@ class Transaction(TimeStampedModel):
 
     class Meta:
         ordering = ["-created_at"]
-        indexes = [models.Index(fields=["created_at"])]
+        indexes = [
+            models.Index(fields=["created_at"]),
+            # Pending rows are few, so this stays small however long the ledger grows
+            models.Index(
+                fields=["sender_account", "created_at"],
+                condition=models.Q(status="pending"),
+                name="transaction_pending_idx",
+            ),
+        ]
+
+
+class AccountMonthlySummary(TimeStampedModel):
+    account = models.ForeignKey(
+        BankAccount, on_delete=models.CASCADE, related_name="monthly_summaries"
+    )
+    month = models.DateField(_("Month"), help_text=_("First day of the month"))
+    inflow = models.DecimalField(
+        _("Inflow"), decimal_places=2, max_digits=16, default=0.00
+    )
+    outflow = models.DecimalField(
+        _("Outflow"), decimal_places=2, max_digits=16, default=0.00
+    )
+    interest = models.DecimalField(
+        _("Interest"), decimal_places=2, max_digits=16, default=0.00
+    )
+    transaction_count = models.PositiveIntegerField(_("Transaction Count"), default=0)
+    # Sharded accounts spread their monthly totals over slots as well
+    slot = models.PositiveSmallIntegerField(_("Slot"), default=0)
+
+    def __str__(self) -> str:
+        return f"{self.account.account_number} - {self.month:%Y-%m}"
+
+    class Meta:
+        verbose_name = _("Account Monthly Summary")
+        verbose_name_plural = _("Account Monthly Summaries")
+        ordering = ["-month"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["account", "month", "slot"],
+                name="unique_account_month_slot_summary",
+            )
+        ]
@@ -0,0 +1,76 @@
+import secrets
+from typing import Optional
+
+from django.conf import settings
+from django.core import signing
+from django.core.cache import cache
+from django.utils.translation import gettext_lazy as _
+
+PENDING_OPERATION_SALT = "core_apps.accounts.pending"
+
+
+class PendingOperation:
+    WITHDRAWAL = "withdrawal"
+    TRANSFER = "transfer"
+
+
+class PendingOperationError(Exception):
+    pass
+
+
+def issue_pending_token(
+    user, operation: str, data: dict, stage: Optional[str] = None
+) -> str:
+    payload = {
+        "user": str(user.pk),
+        "operation": operation,
+        "stage": stage,
+        "nonce": secrets.token_urlsafe(12),
+        "data": data,
+    }
+    return signing.dumps(payload, salt=PENDING_OPERATION_SALT, compress=True)
+
+
+def load_pending_token(
+    token: Optional[str], user, operation: str, stage: Optional[str] = None
+) -> dict:
+    if not token:
+        raise PendingOperationError(
+            _("No pending %(operation)s found. Please start the process again.")
+            % {"operation": operation}
+        )
+    try:
+        payload = signing.loads(
+            token,
+            salt=PENDING_OPERATION_SALT,
+            max_age=settings.PENDING_OPERATION_EXPIRATION,
+        )
+    except signing.SignatureExpired:
+        raise PendingOperationError(
+            _("Your pending %(operation)s has expired. Please start the process again.")
+            % {"operation": operation}
+        )
+    except signing.BadSignature:
+        raise PendingOperationError(
+            _("Invalid %(operation)s token.") % {"operation": operation}
+        )
+
+    if (
+        payload.get("user") != str(user.pk)
+        or payload.get("operation") != operation
+        or payload.get("stage") != stage
+    ):
+        raise PendingOperationError(
+            _("Invalid %(operation)s token.") % {"operation": operation}
+        )
+    return payload
+
+
+def consume_pending_token(payload: dict) -> None:
+    # Tokens are stateless, so only the nonce is remembered to stop replays
+    timeout = settings.PENDING_OPERATION_EXPIRATION.total_seconds()
+    if not cache.add(f"accounts:pending:{payload['nonce']}", True, timeout=timeout):
+        raise PendingOperationError(
+            _("This %(operation)s has already been processed.")
+            % {"operation": payload["operation"]}
+        )
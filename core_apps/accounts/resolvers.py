@@ -0,0 +1,51 @@
+from typing import Any, Dict, Optional
+
+from rest_framework.request import Request
+
+from core_apps.common.cache import get_tiered_cache
+from .models import BankAccount
+
+# Account number -> id and owner, for read paths that only filter by account
+account_cache = get_tiered_cache("account")
+
+
+class AccountResolver:
+    # Identity map of bank accounts fetched while serving a single request
+    def __init__(self) -> None:
+        self._accounts: Dict[str, BankAccount] = {}
+
+    def get(self, account_number: str, user=None) -> BankAccount:
+        account = self._accounts.get(account_number)
+        if account is None:
+            account = BankAccount.objects.select_related("user").get(
+                account_number=account_number
+            )
+            self._accounts[account_number] = account
+        if user is not None and account.user_id != user.pk:
+            raise BankAccount.DoesNotExist(
+                f"Account {account_number} does not belong to this user"
+            )
+        return account
+
+    def add(self, account: BankAccount) -> BankAccount:
+        self._accounts[account.account_number] = account
+        return account
+
+
+def get_account_resolver(request: Optional[Request]) -> AccountResolver:
+    if request is None:
+        return AccountResolver()
+    resolver = getattr(request, "_account_resolver", None)
+    if resolver is None:
+        resolver = AccountResolver()
+        request._account_resolver = resolver
+    return resolver
+
+
+def get_account_reference(account_number: str) -> Optional[Dict[str, Any]]:
+    return account_cache.get_or_set(
+        account_number,
+        lambda: BankAccount.objects.filter(account_number=account_number)
+        .values("id", "user_id")
+        .first(),
+    )
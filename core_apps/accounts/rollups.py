@@ -0,0 +1,208 @@
+import random
+from collections import defaultdict
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Tuple
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, DateField, F, Q, Sum
+from django.db.models.functions import TruncMonth
+from django.utils import timezone
+
+from .models import AccountMonthlySummary, BalanceShard, BankAccount, Transaction
+
+SUMMARY_FIELDS = ("inflow", "outflow", "interest")
+
+
+def month_start(value: datetime) -> date:
+    return timezone.localdate(value).replace(day=1)
+
+
+def add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def summary_slot(txn: Transaction, relation: str) -> int:
+    # Sharded accounts spread their summary rows like their balance; this is
+    # only known without a query when the posting passed the account instance
+    field = Transaction._meta.get_field(relation)
+    account = field.get_cached_value(txn) if field.is_cached(txn) else None
+    if account is None or not account.balance_shards:
+        return 0
+    return random.randrange(account.balance_shards)
+
+
+def transaction_postings(txn: Transaction) -> List[Tuple[Any, str, int]]:
+    # (account id, summary field, slot) a completed transaction adds its amount to
+    if txn.transaction_type == Transaction.TransactionType.INTEREST:
+        if not txn.receiver_account_id:
+            return []
+        return [
+            (
+                txn.receiver_account_id,
+                "interest",
+                summary_slot(txn, "receiver_account"),
+            )
+        ]
+
+    postings = []
+    if txn.sender_account_id:
+        postings.append(
+            (txn.sender_account_id, "outflow", summary_slot(txn, "sender_account"))
+        )
+    # Card top-ups name the same account on both sides; money only leaves it
+    if txn.receiver_account_id and txn.receiver_account_id != txn.sender_account_id:
+        postings.append(
+            (txn.receiver_account_id, "inflow", summary_slot(txn, "receiver_account"))
+        )
+    return postings
+
+
+def add_to_summary(
+    account_id: Any,
+    month: date,
+    field: str,
+    amount: Decimal,
+    slot: int = 0,
+    count: int = 1,
+) -> None:
+    summaries = AccountMonthlySummary.objects.filter(
+        account_id=account_id, month=month, slot=slot
+    )
+    changes = {
+        field: F(field) + amount,
+        "transaction_count": F("transaction_count") + count,
+        "updated_at": timezone.now(),
+    }
+    if summaries.update(**changes):
+        return
+    try:
+        with transaction.atomic():
+            AccountMonthlySummary.objects.create(
+                account_id=account_id,
+                month=month,
+                slot=slot,
+                transaction_count=count,
+                **{field: amount}
+            )
+    except IntegrityError:
+        # A concurrent posting created this month's row first
+        summaries.update(**changes)
+
+
+def record_transactions(txns: Iterable[Transaction]) -> None:
+    # One update per summary row and field, however many transactions it covers
+    totals: Dict[Tuple[Any, date, int, str], List[Any]] = defaultdict(
+        lambda: [Decimal("0.00"), 0]
+    )
+    for txn in txns:
+        if txn.status != Transaction.TransactionStatus.COMPLETED:
+            continue
+        month = month_start(txn.created_at)
+        for account_id, field, slot in transaction_postings(txn):
+            total = totals[(account_id, month, slot, field)]
+            total[0] += txn.amount
+            total[1] += 1
+
+    # Sorted so concurrent postings touch summary rows in the same order
+    for (account_id, month, slot, field), (amount, count) in sorted(
+        totals.items(), key=lambda item: (str(item[0][0]), *item[0][1:])
+    ):
+        add_to_summary(account_id, month, field, amount, slot, count)
+
+
+def record_transaction(txn: Transaction) -> None:
+    record_transactions([txn])
+
+
+def rebuild_summaries(account_ids: Iterable[Any]) -> int:
+    account_ids = list(account_ids)
+    completed = Transaction.objects.filter(
+        status=Transaction.TransactionStatus.COMPLETED
+    ).annotate(month=TruncMonth("created_at", output_field=DateField()))
+    interest = Q(transaction_type=Transaction.TransactionType.INTEREST)
+    sources = [
+        (
+            "outflow",
+            "sender_account_id",
+            completed.filter(sender_account_id__in=account_ids).exclude(interest),
+        ),
+        (
+            "inflow",
+            "receiver_account_id",
+            completed.filter(receiver_account_id__in=account_ids)
+            .exclude(interest)
+            .exclude(sender_account_id=F("receiver_account_id")),
+        ),
+        (
+            "interest",
+            "receiver_account_id",
+            completed.filter(interest, receiver_account_id__in=account_ids),
+        ),
+    ]
+
+    with transaction.atomic():
+        # Postings update the account row (or, for credits to a sharded account,
+        # one of its shards) before writing the ledger, so holding these locks
+        # keeps the rebuilt totals and live increments consistent
+        list(
+            BankAccount.objects.select_for_update()
+            .filter(pk__in=account_ids)
+            .values_list("pk", flat=True)
+        )
+        list(
+            BalanceShard.objects.select_for_update()
+            .filter(account_id__in=account_ids)
+            .order_by("account_id", "slot")
+            .values_list("pk", flat=True)
+        )
+        AccountMonthlySummary.objects.filter(account_id__in=account_ids).delete()
+
+        totals: Dict[Tuple[Any, date], Dict[str, Any]] = defaultdict(
+            lambda: {"transaction_count": 0}
+        )
+        for field, column, queryset in sources:
+            rows = queryset.values(column, "month").annotate(
+                total=Sum("amount"), count=Count("id")
+            )
+            for row in rows:
+                summary = totals[(row[column], row["month"])]
+                summary[field] = row["total"]
+                summary["transaction_count"] += row["count"]
+
+        AccountMonthlySummary.objects.bulk_create(
+            [
+                AccountMonthlySummary(account_id=account_id, month=month, **values)
+                for (account_id, month), values in totals.items()
+            ],
+            batch_size=1000,
+        )
+    return len(totals)
+
+
+def summarize_months(rows: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    totals = {field: Decimal("0.00") for field in SUMMARY_FIELDS}
+    totals["transaction_count"] = 0
+    months = []
+    for row in rows:
+        row["net"] = row["inflow"] + row["interest"] - row["outflow"]
+        months.append(row)
+        for field in (*SUMMARY_FIELDS, "transaction_count"):
+            totals[field] += row[field]
+    totals["net"] = totals["inflow"] + totals["interest"] - totals["outflow"]
+    return {"months": months, "totals": totals}
+
+
+def get_account_summary(account_id: Any, start: date, end: date) -> Dict[str, Any]:
+    rows = (
+        AccountMonthlySummary.objects.filter(
+            account_id=account_id, month__range=(start, end)
+        )
+        .values("month")
+        .annotate(
+            **{field: Sum(field) for field in (*SUMMARY_FIELDS, "transaction_count")}
+        )
+        .order_by("month")
+    )
+    return summarize_months(rows)
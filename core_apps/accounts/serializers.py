@@ -1,8 +1,14 @@
 from decimal import Decimal
 
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from rest_framework import serializers
+
+from core_apps.common.read_serializers import ValuesSerializer, full_name
+from .balances import available_balance
 from .models import BankAccount, Transaction
+from .resolvers import get_account_resolver
+from .rollups import add_months, month_start
 
 
 class AccountVerificationSerializer(serializers.ModelSerializer):
@@ -59,22 +65,20 @@ class DepositSerializer(serializers.ModelSerializer):
 
     def validate_account_number(self, value: str) -> str:
         try:
-            account = BankAccount.objects.get(account_number=value)
+            account = get_account_resolver(self.context.get("request")).get(value)
             self.context["account"] = account
         except BankAccount.DoesNotExist:
             raise serializers.ValidationError(_("Invalid account number."))
         return value
 
-    def to_representation(self, instance: BankAccount) -> str:
-        representation = super().to_representation(instance)
-        representation["amount"] = str(representation["amount"])
-        return representation
-
 
 class CustomerInfoSerializer(serializers.ModelSerializer):
     full_name = serializers.CharField(source="user.full_name")
     email = serializers.EmailField(source="user.email")
     photo_url = serializers.SerializerMethodField()
+    account_balance = serializers.DecimalField(
+        source="get_total_balance", max_digits=12, decimal_places=2, read_only=True
+    )
 
     class Meta:
         model = BankAccount
@@ -89,18 +93,13 @@ class CustomerInfoSerializer(serializers.ModelSerializer):
         ]
 
     def get_photo_url(self, obj) -> None:
-        if hasattr(obj.user, "profile") and obj.user.profile.photo_url:
-            return obj.user.profile.photo_url
+        if hasattr(obj.user, "profile"):
+            profile = obj.user.profile
+            return profile.photo_thumbnail_url or profile.photo_url
         return None
 
 
-class UUIDField(serializers.Field):
-    def to_representation(self, value) -> str:
-        return str(value)
-
-
 class TransactionSerializer(serializers.ModelSerializer):
-    id = UUIDField(read_only=True)
     sender_account = serializers.CharField(max_length=20, required=False)
     receiver_account = serializers.CharField(max_length=20, required=False)
     amount = serializers.DecimalField(
@@ -125,7 +124,6 @@ class TransactionSerializer(serializers.ModelSerializer):
 
     def to_representation(self, instance: Transaction) -> str:
         representation = super().to_representation(instance)
-        representation["amount"] = str(representation["amount"])
         representation["sender"] = (
             instance.sender.full_name if instance.sender else None
         )
@@ -147,29 +145,24 @@ class TransactionSerializer(serializers.ModelSerializer):
         sender_account_number = data.get("sender_account")
         receiver_account_number = data.get("receiver_account")
         amount = data.get("amount")
+        resolver = get_account_resolver(self.context.get("request"))
 
         try:
             if transaction_type == Transaction.TransactionType.WITHDRAWAL:
-                account = BankAccount.objects.get(account_number=sender_account_number)
+                account = resolver.get(sender_account_number)
                 data["sender_account"] = account
                 data["receiver_account"] = None
-                if account.account_balance < amount:
+                if available_balance(account) < amount:
                     raise serializers.ValidationError(
                         "Insufficient funds for withdrawal"
                     )
             elif transaction_type == Transaction.TransactionType.DEPOSIT:
-                account = BankAccount.objects.get(
-                    account_number=receiver_account_number
-                )
+                account = resolver.get(receiver_account_number)
                 data["sender_account"] = None
                 data["receiver_account"] = account
             else:
-                sender_account = BankAccount.objects.get(
-                    account_number=sender_account_number
-                )
-                receiver_account = BankAccount.objects.get(
-                    account_number=receiver_account_number
-                )
+                sender_account = resolver.get(sender_account_number)
+                receiver_account = resolver.get(receiver_account_number)
                 data["sender_account"] = sender_account
                 data["receiver_account"] = receiver_account
 
@@ -181,7 +174,7 @@ class TransactionSerializer(serializers.ModelSerializer):
                     raise serializers.ValidationError(
                         "Transfers are only allowed between accounts with the same currency"
                     )
-                if sender_account.account_balance < amount:
+                if available_balance(sender_account) < amount:
                     raise serializers.ValidationError("Insufficient funds for transfer")
         except BankAccount.DoesNotExist:
             raise serializers.ValidationError("One or both accounts not found")
@@ -216,3 +209,35 @@ class UsernameVerificationSerializer(serializers.Serializer):
         if user.username != value:
             raise serializers.ValidationError("Invalid username.")
         return value
+
+
+class AccountSummaryQuerySerializer(serializers.Serializer):
+    account_number = serializers.CharField(max_length=20)
+    start_month = serializers.DateField(input_formats=["%Y-%m"], required=False)
+    end_month = serializers.DateField(input_formats=["%Y-%m"], required=False)
+
+    def validate(self, data: dict) -> dict:
+        data.setdefault("end_month", month_start(timezone.now()))
+        # Defaults to the twelve months ending with end_month
+        data.setdefault("start_month", add_months(data["end_month"], -11))
+        if data["start_month"] > data["end_month"]:
+            raise serializers.ValidationError(
+                _("start_month must not be after end_month.")
+            )
+        return data
+
+
+class TransactionValuesSerializer(ValuesSerializer):
+    serializer_class = TransactionSerializer
+    computed_fields = {
+        "sender": (("sender__first_name", "sender__last_name"), full_name),
+        "receiver": (("receiver__first_name", "receiver__last_name"), full_name),
+        "sender_account": (
+            ("sender_account__account_number",),
+            lambda account_number: account_number,
+        ),
+        "receiver_account": (
+            ("receiver_account__account_number",),
+            lambda account_number: account_number,
+        ),
+    }
@@ -0,0 +1,132 @@
+from collections import defaultdict
+from decimal import Decimal
+from typing import Any, Dict, List
+
+from django.db import transaction
+from django.utils import timezone
+from loguru import logger
+
+from .balances import credit, lock_balance
+from .caches import analytics_cache
+from .emails import send_transfer_email
+from .models import BankAccount, Transaction
+from .rollups import record_transactions
+
+PENDING = Transaction.TransactionStatus.PENDING
+
+
+def pending_transfers():
+    return Transaction.objects.filter(
+        status=PENDING,
+        transaction_type=Transaction.TransactionType.TRANSFER,
+        sender_account__isnull=False,
+    )
+
+
+def notify(transfers: List[Transaction], accounts: Dict[Any, BankAccount]) -> None:
+    balances = {pk: account.get_total_balance() for pk, account in accounts.items()}
+    for txn in transfers:
+        sender = accounts[txn.sender_account_id]
+        receiver = accounts[txn.receiver_account_id]
+        send_transfer_email(
+            sender_name=sender.user.full_name,
+            sender_email=sender.user.email,
+            receiver_name=receiver.user.full_name,
+            receiver_email=receiver.user.email,
+            amount=txn.amount,
+            currency=sender.currency,
+            sender_new_balance=balances[sender.pk],
+            receiver_new_balance=balances[receiver.pk],
+            sender_account_number=sender.account_number,
+            receiver_account_number=receiver.account_number,
+        )
+
+
+def settle_account(account_id: Any, limit: int) -> int:
+    # Posts up to `limit` of one sender's queued transfers under a single set of
+    # locks, crediting each receiver once for the whole batch
+    with transaction.atomic():
+        transfers = list(
+            pending_transfers()
+            .filter(sender_account_id=account_id)
+            .select_for_update(skip_locked=True)
+            .order_by("created_at")[:limit]
+        )
+        if not transfers:
+            return 0
+
+        # Same order as balances.transfer, so the two can't deadlock
+        accounts = {
+            account.pk: account
+            for account in BankAccount.objects.select_related("user")
+            .select_for_update(of=("self",))
+            .filter(pk__in={account_id, *(t.receiver_account_id for t in transfers)})
+            .order_by("pk")
+        }
+        sender = accounts[account_id]
+        balance = lock_balance(sender)
+
+        completed, failed = [], []
+        credits: Dict[Any, Decimal] = defaultdict(Decimal)
+        for txn in transfers:
+            if txn.receiver_account_id not in accounts or txn.amount > balance:
+                failed.append(txn)
+                continue
+            balance -= txn.amount
+            credits[txn.receiver_account_id] += txn.amount
+            completed.append(txn)
+
+        now = timezone.now()
+        sender.account_balance = balance
+        BankAccount.objects.filter(pk=account_id).update(
+            account_balance=balance, updated_at=now
+        )
+        for receiver_id in sorted(credits, key=str):
+            credit(accounts[receiver_id], credits[receiver_id])
+
+        for status, txns in (
+            (Transaction.TransactionStatus.COMPLETED, completed),
+            (Transaction.TransactionStatus.FAILED, failed),
+        ):
+            Transaction.objects.filter(pk__in=[t.pk for t in txns]).update(
+                status=status, updated_at=now
+            )
+            for txn in txns:
+                txn.status = status
+        for txn in completed:
+            txn.sender_account = sender
+            txn.receiver_account = accounts[txn.receiver_account_id]
+        record_transactions(completed)
+
+        user_ids = {t.sender_id for t in transfers} | {t.receiver_id for t in completed}
+        for user_id in user_ids - {None}:
+            transaction.on_commit(
+                lambda user_id=user_id: analytics_cache.invalidate(user_id)
+            )
+        if completed:
+            transaction.on_commit(lambda: notify(completed, accounts))
+
+    if failed:
+        logger.warning(
+            f"{len(failed)} queued transfers from account {sender.account_number} failed"
+        )
+    return len(completed)
+
+
+def settle_transfers(batch_size: int) -> int:
+    account_ids = list(
+        pending_transfers()
+        .order_by("sender_account_id")
+        .values_list("sender_account_id", flat=True)
+        .distinct()
+    )
+
+    settled = 0
+    for account_id in account_ids:
+        try:
+            settled += settle_account(account_id, batch_size)
+        except Exception as e:
+            logger.error(
+                f"Failed to settle transfers from account {account_id}: {str(e)}"
+            )
+    return settled
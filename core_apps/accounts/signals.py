@@ -0,0 +1,50 @@
+from typing import Any, Type
+
+from django.db import transaction
+from django.db.models.base import Model
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .caches import analytics_cache
+from .models import BankAccount, Transaction
+from .resolvers import account_cache
+from .rollups import record_transaction
+
+
+def schedule_account_cache_invalidation(account_number: str) -> None:
+    transaction.on_commit(lambda: account_cache.invalidate(account_number))
+
+
+@receiver(post_save, sender=BankAccount)
+def invalidate_created_account_cache(
+    sender: Type[Model], instance: BankAccount, created: bool, **kwargs: Any
+) -> None:
+    # Only the id and owner are cached, and balance postings change neither
+    if created:
+        schedule_account_cache_invalidation(instance.account_number)
+
+
+@receiver(post_delete, sender=BankAccount)
+def invalidate_deleted_account_cache(
+    sender: Type[Model], instance: BankAccount, **kwargs: Any
+) -> None:
+    schedule_account_cache_invalidation(instance.account_number)
+
+
+@receiver(post_save, sender=Transaction)
+def update_monthly_summary(
+    sender: Type[Model], instance: Transaction, created: bool, **kwargs: Any
+) -> None:
+    # Runs inside the posting's database transaction, so both commit together
+    if created:
+        record_transaction(instance)
+
+
+@receiver(post_save, sender=Transaction)
+def invalidate_spending_analytics(
+    sender: Type[Model], instance: Transaction, **kwargs: Any
+) -> None:
+    for user_id in {instance.sender_id, instance.receiver_id} - {None}:
+        transaction.on_commit(
+            lambda user_id=user_id: analytics_cache.invalidate(user_id)
+        )
@@ -4,23 +4,20 @@ from io import BytesIO
 from os import getenv
 
 from celery import shared_task
-from dateutil import parser
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.core.mail import EmailMessage
-from django.db import transaction
 from django.utils import timezone
 
 from django.utils.translation import gettext_lazy as _
 from loguru import logger
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import landscape, letter
-from reportlab.lib.styles import getSampleStyleSheet
-from reportlab.lib.units import inch
-from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
 
+from core_apps.common.db.routers import get_read_alias
+from .balances import expire_holds
 from .emails import send_suspicious_activity_alert
+from .interest import accrue_interest, is_posting_day, post_interest
 from .models import BankAccount, Transaction
+from .settlement import settle_transfers
 from django.db.models import Q, Sum
 
 User = get_user_model()
@@ -28,19 +25,40 @@ User = get_user_model()
 
 @shared_task
 def generate_transaction_pdf(user_id, start_date, end_date, account_number=None):
+    # reportlab is only needed by this task, so API processes never import it
+    from dateutil import parser
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import landscape, letter
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.lib.units import inch
+    from reportlab.platypus import (
+        Paragraph,
+        SimpleDocTemplate,
+        Spacer,
+        Table,
+        TableStyle,
+    )
+
+    db = get_read_alias(user_id)
     try:
-        user = User.objects.get(id=user_id)
+        user = User.objects.using(db).get(id=user_id)
 
         start_date = parser.parse(start_date).date()
         end_date = parser.parse(end_date).date()
 
-        transactions = Transaction.objects.filter(
-            Q(sender=user) | Q(receiver=user),
-            created_at__date__range=[start_date, end_date],
-        ).order_by("-created_at")
+        transactions = (
+            Transaction.objects.using(db)
+            .filter(
+                Q(sender=user) | Q(receiver=user),
+                created_at__date__range=[start_date, end_date],
+            )
+            .order_by("-created_at")
+        )
 
         if account_number:
-            account = BankAccount.objects.get(account_number=account_number, user=user)
+            account = BankAccount.objects.using(db).get(
+                account_number=account_number, user=user
+            )
             transactions = transactions.filter(
                 Q(sender_account=account) | Q(receiver_account=account)
             )
@@ -146,19 +164,35 @@ def generate_transaction_pdf(user_id, start_date, end_date, account_number=None)
         return f"Error generating PDF: {str(e)}"
 
 
-@shared_task
+@shared_task(name="apply_daily_interest")
 def apply_daily_interest():
-    savings_account = BankAccount.objects.filter(
-        account_type=BankAccount.AccountType.SAVINGS
-    )
-
-    for account in savings_account:
-        with transaction.atomic():
-            account.apply_daily_interest()
+    # Interest accrues daily but only reaches the ledger on posting days
+    today = timezone.localdate()
+    accrued = accrue_interest(today)
+    posted = 0
+    if is_posting_day(today, settings.INTEREST_POSTING_FREQUENCY):
+        posted = post_interest(today)
     logger.info(
-        f"Done applying daily interest to {savings_account.count()} savings accounts"
+        f"Accrued daily interest on {accrued} savings accounts, posted interest "
+        f"to {posted}"
     )
-    return f"Applied daily interest to {savings_account.count()} savings accounts"
+    return f"Accrued interest on {accrued} savings accounts, posted to {posted}"
+
+
+@shared_task(name="settle_pending_transfers")
+def settle_pending_transfers():
+    settled = settle_transfers(settings.TRANSFER_SETTLEMENT_BATCH_SIZE)
+    if settled:
+        logger.info(f"Settled {settled} queued transfers")
+    return f"Settled {settled} queued transfers"
+
+
+@shared_task(name="expire_balance_holds")
+def expire_balance_holds():
+    expired = expire_holds()
+    if expired:
+        logger.info(f"Expired {expired} balance holds")
+    return f"Expired {expired} balance holds"
 
 
 @shared_task
@@ -177,7 +211,9 @@ def detect_suspicious_activities():
 
     suspicious_activities = []
 
-    large_transactions = Transaction.objects.filter(
+    db = get_read_alias()
+
+    large_transactions = Transaction.objects.using(db).filter(
         amount__gte=LARGE_TRANSACTION_THRESHOLD, created_at__lte=time_threshold
     )
 
@@ -186,26 +222,32 @@ def detect_suspicious_activities():
             f"Large transaction detected: {transaction.amount} by user {transaction.user.email}"
         )
 
-    users = User.objects.all()
+    users = User.objects.using(db).all()
     for user in users:
-        transaction_count = Transaction.objects.filter(
-            user=user, created_at__gte=time_threshold
-        ).count()
+        transaction_count = (
+            Transaction.objects.using(db)
+            .filter(user=user, created_at__gte=time_threshold)
+            .count()
+        )
 
         if transaction_count >= FREQUENT_TRANSACTION_THRESHOLD:
             suspicious_activities.append(
                 f"Frequent transactions detected: {transaction_count} by user {user.email}"
             )
 
-    accounts = BankAccount.objects.all()
+    accounts = BankAccount.objects.using(db).all()
 
     for account in accounts:
-        balance_change = Transaction.objects.filter(
-            Q(sender_account=account) | Q(receiver_account=account),
-            created_at__gte=time_threshold,
-        ).aggregate(
-            total_sent=Sum("amount", filter=Q(sender_account=account)),
-            total_received=Sum("amount", filter=Q(receiver_account=account)),
+        balance_change = (
+            Transaction.objects.using(db)
+            .filter(
+                Q(sender_account=account) | Q(receiver_account=account),
+                created_at__gte=time_threshold,
+            )
+            .aggregate(
+                total_sent=Sum("amount", filter=Q(sender_account=account)),
+                total_received=Sum("amount", filter=Q(receiver_account=account)),
+            )
         )
         total_change = (balance_change["total_received"] or Decimal("0")) - (
             balance_change["total_sent"] or Decimal("0")
@@ -0,0 +1,52 @@
+from decimal import Decimal
+
+from django.urls import reverse
+
+from core_apps.accounts.models import BankAccount
+from core_apps.user_auth.models import User
+from core_apps.user_auth.tokens import ClaimsRefreshToken
+
+LOCMEM_CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+}
+
+
+class AccountsTestMixin:
+    def create_user(self, email: str, username: str, id_no: int, **extra) -> User:
+        user = User.objects.create_user(
+            email=email,
+            password="pass12345!",
+            first_name="Test",
+            last_name="User",
+            id_no=id_no,
+            security_question="maiden_name",
+            security_answer="answer",
+            **extra,
+        )
+        User.objects.filter(pk=user.pk).update(username=username)
+        user.username = username
+        return user
+
+    def create_account(
+        self, user: User, number: str, balance: Decimal, **extra
+    ) -> BankAccount:
+        extra.setdefault("account_type", BankAccount.AccountType.CURRENT)
+        return BankAccount.objects.create(
+            user=user,
+            account_number=number,
+            account_balance=balance,
+            currency=BankAccount.AccountCurrency.DOLLAR,
+            account_status=BankAccount.AccountStatus.ACTIVE,
+            kyc_verified=True,
+            fully_activated=True,
+            **extra,
+        )
+
+    def authenticate(self, user: User) -> None:
+        token = ClaimsRefreshToken.for_user(user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+    def post(self, name: str, data: dict, label: str) -> dict:
+        response = self.client.post(reverse(name), data, format="json")
+        self.assertLess(response.status_code, 300, response.content)
+        return response.json()[label]
@@ -0,0 +1,194 @@
+import threading
+from datetime import timedelta
+from decimal import Decimal
+
+from django.core.cache import caches
+from django.db import connection
+from django.test import TransactionTestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+from core_apps.accounts.balances import (
+    HoldExpired,
+    InsufficientFunds,
+    available_balance,
+    debit,
+    expire_holds,
+    place_hold,
+    transfer,
+)
+from core_apps.accounts.models import BalanceHold, BankAccount
+from core_apps.accounts.tests.base import LOCMEM_CACHES, AccountsTestMixin
+
+TRANSFER = BalanceHold.HoldType.TRANSFER
+
+
+@override_settings(CACHES=LOCMEM_CACHES, AUTH_TOKEN_CLAIMS=True)
+class BalanceHoldTests(AccountsTestMixin, APITestCase):
+    def setUp(self) -> None:
+        caches["default"].clear()
+        self.customer = self.create_user("customer@example.com", "customer1", 1)
+        self.payee = self.create_user("payee@example.com", "payee1", 2)
+        self.account = self.create_account(
+            self.customer, "1234100000000001", Decimal("100.00")
+        )
+        self.payee_account = self.create_account(
+            self.payee, "1234100000000002", Decimal("0.00")
+        )
+
+    def refresh(self, hold: BalanceHold) -> BalanceHold:
+        hold.refresh_from_db()
+        return hold
+
+    def test_hold_reduces_available_balance(self) -> None:
+        place_hold(self.account, Decimal("80.00"), TRANSFER)
+
+        self.assertEqual(available_balance(self.account), Decimal("20.00"))
+        with self.assertRaises(InsufficientFunds):
+            place_hold(self.account, Decimal("30.00"), TRANSFER)
+        with self.assertRaises(InsufficientFunds):
+            debit(self.account, Decimal("30.00"))
+
+    def test_capture_spends_the_operations_own_hold(self) -> None:
+        hold = place_hold(self.account, Decimal("100.00"), TRANSFER)
+
+        transfer(self.account, self.payee_account, Decimal("100.00"), str(hold.pk))
+
+        self.assertEqual(self.refresh(hold).status, BalanceHold.HoldStatus.CAPTURED)
+        self.account.refresh_from_db()
+        self.assertEqual(self.account.account_balance, Decimal("0.00"))
+        self.assertEqual(available_balance(self.account), Decimal("0.00"))
+
+    def test_hold_is_captured_once(self) -> None:
+        hold = place_hold(self.account, Decimal("10.00"), TRANSFER)
+        debit(self.account, Decimal("10.00"), str(hold.pk))
+
+        with self.assertRaises(HoldExpired):
+            debit(self.account, Decimal("10.00"), str(hold.pk))
+        self.account.refresh_from_db()
+        self.assertEqual(self.account.account_balance, Decimal("90.00"))
+
+    def test_expired_hold_stops_counting(self) -> None:
+        hold = place_hold(self.account, Decimal("80.00"), TRANSFER)
+        BalanceHold.objects.filter(pk=hold.pk).update(
+            expires_at=timezone.now() - timedelta(seconds=1)
+        )
+
+        self.assertEqual(available_balance(self.account), Decimal("100.00"))
+        with self.assertRaises(HoldExpired):
+            debit(self.account, Decimal("80.00"), str(hold.pk))
+        self.account.refresh_from_db()
+        self.assertEqual(self.account.account_balance, Decimal("100.00"))
+
+    def test_sweep_marks_only_expired_holds(self) -> None:
+        expired = place_hold(self.account, Decimal("10.00"), TRANSFER)
+        active = place_hold(self.account, Decimal("10.00"), TRANSFER)
+        BalanceHold.objects.filter(pk=expired.pk).update(
+            expires_at=timezone.now() - timedelta(seconds=1)
+        )
+
+        self.assertEqual(expire_holds(), 1)
+
+        self.assertEqual(self.refresh(expired).status, BalanceHold.HoldStatus.EXPIRED)
+        self.assertEqual(self.refresh(active).status, BalanceHold.HoldStatus.ACTIVE)
+
+    def initiate_transfer(self, amount: str = "60.00") -> str:
+        self.authenticate(self.customer)
+        return self.post(
+            "initiate_transfer",
+            {
+                "sender_account": "1234100000000001",
+                "receiver_account": "1234100000000002",
+                "amount": amount,
+                "description": "Rent",
+            },
+            "initiate_transfer",
+        )["transfer_token"]
+
+    def verify_security_question(self, token: str):
+        return self.client.post(
+            reverse("verify_security_question"),
+            {"transfer_token": token, "security_answer": "answer"},
+            format="json",
+        )
+
+    def verify_otp(self, token: str):
+        self.customer.refresh_from_db()
+        return self.client.post(
+            reverse("verify_otp"),
+            {"transfer_token": token, "otp": self.customer.otp},
+            format="json",
+        )
+
+    def test_security_question_extends_the_hold(self) -> None:
+        token = self.initiate_transfer()
+        hold = BalanceHold.objects.get()
+        # Most of the window has gone by the time the answer arrives
+        BalanceHold.objects.filter(pk=hold.pk).update(
+            expires_at=timezone.now() + timedelta(seconds=30)
+        )
+
+        response = self.verify_security_question(token)
+        self.assertEqual(response.status_code, 200, response.content)
+        token = response.json()["verification_answer"]["transfer_token"]
+
+        self.assertGreater(
+            self.refresh(hold).expires_at, timezone.now() + timedelta(minutes=4)
+        )
+        response = self.verify_otp(token)
+        self.assertEqual(response.status_code, 201, response.content)
+        self.assertEqual(self.refresh(hold).status, BalanceHold.HoldStatus.CAPTURED)
+
+    def test_security_question_refuses_an_expired_hold(self) -> None:
+        token = self.initiate_transfer()
+        BalanceHold.objects.update(expires_at=timezone.now() - timedelta(seconds=1))
+
+        response = self.verify_security_question(token)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("expired", response.json()["verification_answer"]["error"])
+
+    def test_missing_account_releases_the_hold(self) -> None:
+        token = self.initiate_transfer()
+        response = self.verify_security_question(token)
+        token = response.json()["verification_answer"]["transfer_token"]
+        BankAccount.objects.filter(pk=self.payee_account.pk).delete()
+        caches["default"].clear()
+
+        response = self.verify_otp(token)
+
+        self.assertEqual(response.status_code, 404, response.content)
+        self.assertEqual(
+            BalanceHold.objects.get().status, BalanceHold.HoldStatus.RELEASED
+        )
+        self.assertEqual(available_balance(self.account), Decimal("100.00"))
+
+
+class ConcurrentHoldTests(AccountsTestMixin, TransactionTestCase):
+    def test_concurrent_holds_cannot_over_reserve(self) -> None:
+        customer = self.create_user("customer@example.com", "customer1", 1)
+        account = self.create_account(customer, "1234100000000001", Decimal("100.00"))
+        barrier = threading.Barrier(4)
+        outcomes = []
+
+        def reserve() -> None:
+            barrier.wait()
+            try:
+                place_hold(
+                    BankAccount.objects.get(pk=account.pk), Decimal("60.00"), TRANSFER
+                )
+                outcomes.append("held")
+            except InsufficientFunds:
+                outcomes.append("refused")
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=reserve) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(sorted(outcomes), ["held", "refused", "refused", "refused"])
+        self.assertEqual(available_balance(account), Decimal("40.00"))
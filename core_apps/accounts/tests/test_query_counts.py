@@ -0,0 +1,96 @@
+from decimal import Decimal
+
+from django.core.cache import caches
+from django.test import override_settings
+from rest_framework.test import APITestCase
+
+from core_apps.accounts.tests.base import LOCMEM_CACHES, AccountsTestMixin
+from core_apps.user_auth.models import User
+
+
+@override_settings(CACHES=LOCMEM_CACHES, AUTH_TOKEN_CLAIMS=True)
+class PostingQueryCountTests(AccountsTestMixin, APITestCase):
+    # Pins the queries behind each posting endpoint, so a view or serializer
+    # that reloads an account the request already resolved fails here
+
+    def setUp(self) -> None:
+        caches["default"].clear()
+        self.customer = self.create_user("customer@example.com", "customer1", 1)
+        self.payee = self.create_user("payee@example.com", "payee1", 2)
+        self.sender_account = self.create_account(
+            self.customer, "1234100000000001", Decimal("1000.00")
+        )
+        self.receiver_account = self.create_account(
+            self.payee, "1234100000000002", Decimal("0.00")
+        )
+
+    def test_deposit(self) -> None:
+        teller = self.create_user(
+            "teller@example.com", "teller1", 3, role=User.RoleChoices.TELLER
+        )
+        self.authenticate(teller)
+
+        with self.assertNumQueries(6):
+            self.post(
+                "account_deposit",
+                {"account_number": "1234100000000002", "amount": "50.00"},
+                "deposit",
+            )
+
+        self.receiver_account.refresh_from_db()
+        self.assertEqual(self.receiver_account.account_balance, Decimal("50.00"))
+
+    def test_withdrawal(self) -> None:
+        self.authenticate(self.customer)
+
+        with self.assertNumQueries(11):
+            token = self.post(
+                "initiate_withdrawal",
+                {"account_number": "1234100000000001", "amount": "100.00"},
+                "initiate_withdrawal",
+            )["withdrawal_token"]
+
+        with self.assertNumQueries(17):
+            self.post(
+                "verify_username_and_withdraw",
+                {"withdrawal_token": token, "username": "customer1"},
+                "verify_username_and_withdraw",
+            )
+
+        self.sender_account.refresh_from_db()
+        self.assertEqual(self.sender_account.account_balance, Decimal("900.00"))
+
+    def test_transfer(self) -> None:
+        self.authenticate(self.customer)
+
+        with self.assertNumQueries(12):
+            token = self.post(
+                "initiate_transfer",
+                {
+                    "sender_account": "1234100000000001",
+                    "receiver_account": "1234100000000002",
+                    "amount": "100.00",
+                    "description": "Rent",
+                },
+                "initiate_transfer",
+            )["transfer_token"]
+
+        with self.assertNumQueries(3):
+            token = self.post(
+                "verify_security_question",
+                {"transfer_token": token, "security_answer": "answer"},
+                "verification_answer",
+            )["transfer_token"]
+
+        self.customer.refresh_from_db()
+        with self.assertNumQueries(27):
+            self.post(
+                "verify_otp",
+                {"transfer_token": token, "otp": self.customer.otp},
+                "verify_otp",
+            )
+
+        self.sender_account.refresh_from_db()
+        self.receiver_account.refresh_from_db()
+        self.assertEqual(self.sender_account.account_balance, Decimal("900.00"))
+        self.assertEqual(self.receiver_account.account_balance, Decimal("100.00"))
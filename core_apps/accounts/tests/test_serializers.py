@@ -0,0 +1,121 @@
+from decimal import Decimal
+
+from django.test import TestCase
+
+from core_apps.accounts.models import BankAccount, Transaction
+from core_apps.accounts.serializers import (
+    TransactionSerializer,
+    TransactionValuesSerializer,
+)
+from core_apps.user_auth.models import User
+
+
+class TransactionValuesSerializerTests(TestCase):
+    # The transaction list renders .values() rows; every shape of transaction
+    # must come out exactly as the model serializer would render it
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.customer = cls.create_user("customer@example.com", 1, "jane", "doe")
+        cls.payee = cls.create_user("payee@example.com", 2, "JOHN", "o'neil")
+        cls.sender_account = cls.create_account(cls.customer, "1234100000000001")
+        cls.receiver_account = cls.create_account(cls.payee, "1234100000000002")
+        closed_account = cls.create_account(
+            cls.payee, "1234100000000003", BankAccount.AccountCurrency.POUND_STERLING
+        )
+
+        types = Transaction.TransactionType
+        cls.create_transaction(
+            types.DEPOSIT,
+            receiver=cls.customer,
+            receiver_account=cls.sender_account,
+            description=None,
+        )
+        cls.create_transaction(
+            types.WITHDRAWAL,
+            sender=cls.customer,
+            sender_account=cls.sender_account,
+            status=Transaction.TransactionStatus.FAILED,
+        )
+        cls.create_transaction(
+            types.TRANSFER,
+            sender=cls.customer,
+            receiver=cls.payee,
+            sender_account=cls.sender_account,
+            receiver_account=cls.receiver_account,
+            status=Transaction.TransactionStatus.PENDING,
+        )
+        cls.create_transaction(
+            types.INTEREST,
+            receiver=cls.customer,
+            receiver_account=cls.sender_account,
+            amount=Decimal("0.01"),
+        )
+        cls.create_transaction(
+            types.TRANSFER,
+            sender=cls.customer,
+            receiver=cls.payee,
+            sender_account=cls.sender_account,
+            receiver_account=closed_account,
+            description="Rent — März",
+        )
+        closed_account.delete()
+
+    @classmethod
+    def create_user(
+        cls, email: str, id_no: int, first_name: str, last_name: str
+    ) -> User:
+        return User.objects.create_user(
+            email=email,
+            password="pass12345!",
+            first_name=first_name,
+            last_name=last_name,
+            id_no=id_no,
+            security_question="maiden_name",
+            security_answer="answer",
+        )
+
+    @classmethod
+    def create_account(
+        cls,
+        user: User,
+        number: str,
+        currency: str = BankAccount.AccountCurrency.DOLLAR,
+    ) -> BankAccount:
+        return BankAccount.objects.create(
+            user=user,
+            account_number=number,
+            currency=currency,
+            account_type=BankAccount.AccountType.CURRENT,
+        )
+
+    @classmethod
+    def create_transaction(cls, transaction_type: str, **fields) -> Transaction:
+        fields.setdefault("amount", Decimal("1250.50"))
+        fields.setdefault("description", f"{transaction_type} test")
+        fields.setdefault("status", Transaction.TransactionStatus.COMPLETED)
+        return Transaction.objects.create(transaction_type=transaction_type, **fields)
+
+    def test_matches_model_serializer(self) -> None:
+        queryset = Transaction.objects.order_by("created_at")
+        expected = TransactionSerializer(
+            queryset.select_related(
+                "sender", "receiver", "sender_account", "receiver_account"
+            ),
+            many=True,
+        ).data
+        actual = TransactionValuesSerializer(
+            TransactionValuesSerializer.get_values_queryset(queryset)
+        ).data
+
+        self.assertEqual(len(actual), 5)
+        for expected_row, actual_row in zip(expected, actual):
+            self.assertEqual(list(actual_row), list(expected_row))
+            self.assertEqual(actual_row, dict(expected_row))
+
+    def test_reads_rows_in_one_query(self) -> None:
+        queryset = TransactionValuesSerializer.get_values_queryset(
+            Transaction.objects.all()
+        )
+        with self.assertNumQueries(1):
+            TransactionValuesSerializer(queryset).data
@@ -0,0 +1,122 @@
+from decimal import Decimal
+
+from django.core.cache import caches
+from django.test import TestCase, override_settings
+
+from core_apps.accounts.balances import (
+    InsufficientFunds,
+    debit,
+    held_amount,
+    queue_transfer,
+)
+from core_apps.accounts.models import AccountMonthlySummary, Transaction
+from core_apps.accounts.rollups import month_start
+from core_apps.accounts.settlement import settle_transfers
+from core_apps.accounts.tests.base import LOCMEM_CACHES, AccountsTestMixin
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class SettlementTests(AccountsTestMixin, TestCase):
+    def setUp(self) -> None:
+        caches["default"].clear()
+        self.customer = self.create_user("customer@example.com", "customer1", 1)
+        self.payee = self.create_user("payee@example.com", "payee1", 2)
+        self.other_payee = self.create_user("other@example.com", "payee2", 3)
+        self.sender = self.create_account(
+            self.customer, "1234100000000001", Decimal("100.00")
+        )
+        self.receiver = self.create_account(
+            self.payee, "1234100000000002", Decimal("10.00")
+        )
+        self.other_receiver = self.create_account(
+            self.other_payee, "1234100000000003", Decimal("0.00")
+        )
+
+    def queue(self, receiver, amount: str) -> Transaction:
+        return queue_transfer(self.sender, receiver, Decimal(amount), "Rent")
+
+    def balance(self, account) -> Decimal:
+        account.refresh_from_db()
+        return account.get_total_balance()
+
+    def summary(self, account) -> AccountMonthlySummary:
+        return AccountMonthlySummary.objects.get(account=account)
+
+    def test_queued_transfers_settle_in_one_batch(self) -> None:
+        first = self.queue(self.receiver, "30.00")
+        self.queue(self.receiver, "20.00")
+        self.queue(self.other_receiver, "25.00")
+        self.assertEqual(self.balance(self.sender), Decimal("100.00"))
+
+        self.assertEqual(settle_transfers(batch_size=500), 3)
+
+        self.assertEqual(self.balance(self.sender), Decimal("25.00"))
+        self.assertEqual(self.balance(self.receiver), Decimal("60.00"))
+        self.assertEqual(self.balance(self.other_receiver), Decimal("25.00"))
+        self.assertFalse(
+            Transaction.objects.filter(
+                status=Transaction.TransactionStatus.PENDING
+            ).exists()
+        )
+
+        sender_summary = self.summary(self.sender)
+        self.assertEqual(sender_summary.month, month_start(first.created_at))
+        self.assertEqual(sender_summary.outflow, Decimal("75.00"))
+        self.assertEqual(sender_summary.inflow, Decimal("0.00"))
+        self.assertEqual(sender_summary.transaction_count, 3)
+        self.assertEqual(self.summary(self.receiver).inflow, Decimal("50.00"))
+        self.assertEqual(self.summary(self.receiver).transaction_count, 2)
+        self.assertEqual(self.summary(self.other_receiver).inflow, Decimal("25.00"))
+        self.assertEqual(held_amount(self.sender.pk), Decimal("0.00"))
+
+    def test_batch_size_limits_each_pass(self) -> None:
+        for _ in range(3):
+            self.queue(self.receiver, "10.00")
+
+        self.assertEqual(settle_transfers(batch_size=2), 2)
+        self.assertEqual(settle_transfers(batch_size=2), 1)
+        self.assertEqual(settle_transfers(batch_size=2), 0)
+        self.assertEqual(self.balance(self.sender), Decimal("70.00"))
+
+    def test_unfunded_transfer_fails_without_moving_money(self) -> None:
+        funded = self.queue(self.receiver, "60.00")
+        # Bypasses the funds check queue_transfer makes
+        unfunded = Transaction.objects.create(
+            user=self.customer,
+            sender=self.customer,
+            sender_account=self.sender,
+            receiver=self.other_payee,
+            receiver_account=self.other_receiver,
+            amount=Decimal("70.00"),
+            transaction_type=Transaction.TransactionType.TRANSFER,
+            status=Transaction.TransactionStatus.PENDING,
+        )
+
+        self.assertEqual(settle_transfers(batch_size=500), 1)
+
+        funded.refresh_from_db()
+        unfunded.refresh_from_db()
+        self.assertEqual(funded.status, Transaction.TransactionStatus.COMPLETED)
+        self.assertEqual(unfunded.status, Transaction.TransactionStatus.FAILED)
+        self.assertEqual(self.balance(self.sender), Decimal("40.00"))
+        self.assertEqual(self.balance(self.other_receiver), Decimal("0.00"))
+        self.assertFalse(
+            AccountMonthlySummary.objects.filter(account=self.other_receiver).exists()
+        )
+        self.assertEqual(self.summary(self.sender).outflow, Decimal("60.00"))
+
+    def test_queued_amount_is_held(self) -> None:
+        self.queue(self.receiver, "80.00")
+
+        self.assertEqual(held_amount(self.sender.pk), Decimal("80.00"))
+        with self.assertRaises(InsufficientFunds):
+            debit(self.sender, Decimal("30.00"))
+        with self.assertRaises(InsufficientFunds):
+            self.queue(self.other_receiver, "30.00")
+        self.assertEqual(
+            Transaction.objects.filter(
+                status=Transaction.TransactionStatus.PENDING
+            ).count(),
+            1,
+        )
+        self.assertEqual(self.balance(self.sender), Decimal("100.00"))
@@ -0,0 +1,97 @@
+from datetime import date
+from decimal import Decimal
+
+from django.db import connection
+from django.db.models import Sum
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from core_apps.accounts.balances import credit, set_balance_shards
+from core_apps.accounts.interest import accrue_interest
+from core_apps.accounts.models import (
+    AccountMonthlySummary,
+    BalanceShard,
+    BankAccount,
+    Transaction,
+)
+from core_apps.accounts.rollups import rebuild_summaries
+from core_apps.user_auth.models import User
+
+
+class ShardedBalanceTests(TestCase):
+    def setUp(self) -> None:
+        self.user = User.objects.create_user(
+            email="saver@example.com",
+            password="pass12345!",
+            first_name="Test",
+            last_name="User",
+            id_no=1,
+            security_question="maiden_name",
+            security_answer="answer",
+        )
+        self.account = BankAccount.objects.create(
+            user=self.user,
+            account_number="1234100000000001",
+            account_balance=Decimal("50000.00"),
+            currency=BankAccount.AccountCurrency.DOLLAR,
+            account_type=BankAccount.AccountType.SAVINGS,
+        )
+        set_balance_shards(self.account, 4)
+
+    def summary_totals(self) -> list:
+        # Sharded accounts may spread a month over several slots
+        return list(
+            AccountMonthlySummary.objects.filter(account=self.account)
+            .values("month")
+            .annotate(
+                inflow=Sum("inflow"),
+                outflow=Sum("outflow"),
+                interest=Sum("interest"),
+                transaction_count=Sum("transaction_count"),
+            )
+            .order_by("month")
+        )
+
+    def test_accrual_includes_unfolded_credits(self) -> None:
+        # 50,000 + 60,000 in shards crosses into the second interest tier
+        for _ in range(3):
+            credit(self.account, Decimal("20000.00"))
+
+        self.assertEqual(accrue_interest(date(2026, 1, 1)), 1)
+
+        self.account.refresh_from_db()
+        self.assertEqual(self.account.account_balance, Decimal("110000.00"))
+        self.assertEqual(
+            self.account.accrued_interest,
+            (Decimal("110000.00") * Decimal("0.0100") / 365).quantize(
+                Decimal(".000001")
+            ),
+        )
+        self.assertFalse(BalanceShard.objects.exclude(balance=0).exists())
+
+    def test_rebuild_locks_shards_and_keeps_totals(self) -> None:
+        credit(self.account, Decimal("250.00"))
+        Transaction.objects.create(
+            user=self.user,
+            receiver=self.user,
+            receiver_account=self.account,
+            amount=Decimal("250.00"),
+            transaction_type=Transaction.TransactionType.DEPOSIT,
+            status=Transaction.TransactionStatus.COMPLETED,
+        )
+        live = self.summary_totals()
+        self.assertEqual(len(live), 1)
+        self.assertEqual(live[0]["inflow"], Decimal("250.00"))
+        self.assertEqual(live[0]["transaction_count"], 1)
+
+        with CaptureQueriesContext(connection) as queries:
+            rebuild_summaries([self.account.pk])
+
+        shard_table = BalanceShard._meta.db_table
+        self.assertTrue(
+            any(
+                shard_table in query["sql"] and "FOR UPDATE" in query["sql"]
+                for query in queries
+            )
+        )
+        self.assertEqual(self.summary_totals(), live)
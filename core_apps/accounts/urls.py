@@ -1,6 +1,9 @@
+from django.conf import settings
 from django.urls import path
 
+from .async_views import AsyncTransactionListAPIView
 from .views import (
+    AccountSummaryAPIView,
     AccountVerificationView,
     DepositView,
     InitiateWithdrawalView,
@@ -10,6 +13,11 @@ from .views import (
     VerifyOTPView,
     TransactionListAPIView,
     TransactionPDFView,
+    SpendingAnalyticsAPIView,
+)
+
+TransactionListView = (
+    AsyncTransactionListAPIView if settings.ASYNC_VIEWS else TransactionListAPIView
 )
 
 urlpatterns = [
@@ -38,6 +46,8 @@ urlpatterns = [
         name="verify_security_question",
     ),
     path("transfer/verify-otp/", VerifyOTPView.as_view(), name="verify_otp"),
-    path("transactions/", TransactionListAPIView.as_view(), name="transaction_list"),
+    path("transactions/", TransactionListView.as_view(), name="transaction_list"),
     path("transactions/pdf/", TransactionPDFView.as_view(), name="transaction_pdf"),
+    path("summary/", AccountSummaryAPIView.as_view(), name="account_summary"),
+    path("analytics/", SpendingAnalyticsAPIView.as_view(), name="spending_analytics"),
 ]
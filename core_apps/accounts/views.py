@@ -2,14 +2,28 @@ import random
 from decimal import Decimal
 from typing import Any
 
+from django.conf import settings
 from django.db import transaction
 from rest_framework import generics, serializers
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from core_apps.common.db.routers import ReplicaReadMixin
 from core_apps.common.permissions import IsAccountExecutive, IsTeller
+from core_apps.common.read_serializers import ValuesListMixin
 from core_apps.common.renderers import GenericJSONRenderer
+from .balances import (
+    HoldExpired,
+    InsufficientFunds,
+    credit,
+    debit,
+    extend_hold,
+    place_hold,
+    queue_transfer,
+    release_hold,
+    transfer,
+)
 from .emails import (
     send_full_activation_email,
     send_deposit_email,
@@ -17,12 +31,23 @@ from .emails import (
     send_transfer_otp_email,
     send_transfer_email,
 )
-from .models import BankAccount, Transaction
+from .models import BalanceHold, BankAccount, Transaction
+from .pending import (
+    PendingOperation,
+    PendingOperationError,
+    consume_pending_token,
+    issue_pending_token,
+    load_pending_token,
+)
+from .resolvers import get_account_reference, get_account_resolver
+from .rollups import get_account_summary
 from .serializers import (
+    AccountSummaryQuerySerializer,
     AccountVerificationSerializer,
     DepositSerializer,
     CustomerInfoSerializer,
     TransactionSerializer,
+    TransactionValuesSerializer,
     UsernameVerificationSerializer,
     SecurityQuestionSerializer,
     OTPVerificationSerializer,
@@ -33,7 +58,6 @@ from .tasks import generate_transaction_pdf
 from rest_framework import status
 from .pagination import StandardResultsSetPagination
 from django_filters.rest_framework import DjangoFilterBackend
-from dateutil import parser
 from django.db.models import Q
 from rest_framework.filters import OrderingFilter
 
@@ -113,7 +137,7 @@ class DepositView(generics.CreateAPIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
         try:
-            account = BankAccount.objects.get(account_number=account_number)
+            account = get_account_resolver(request).get(account_number)
             serializer = CustomerInfoSerializer(account)
             return Response(serializer.data)
         except BankAccount.DoesNotExist:
@@ -131,9 +155,8 @@ class DepositView(generics.CreateAPIView):
         amount = serializer.validated_data["amount"]
 
         try:
-            account.account_balance += amount
-            account.full_clean()
-            account.save()
+            credit(account, amount)
+            new_balance = account.get_total_balance()
 
             logger.info(
                 f"Deposit of {amount} made to account {account.account_number} by teller "
@@ -145,14 +168,14 @@ class DepositView(generics.CreateAPIView):
                 user_email=account.user.email,
                 amount=amount,
                 currency=account.currency,
-                new_balance=account.account_balance,
+                new_balance=new_balance,
                 account_number=account.account_number,
             )
             return Response(
                 {
                     "message": f"Successfully deposited {amount} to account "
                     f"{account.account_number}",
-                    "new_balance": str(account.account_balance),
+                    "new_balance": str(new_balance),
                 },
                 status=status.HTTP_200_OK,
             )
@@ -180,8 +203,8 @@ class InitiateWithdrawalView(generics.CreateAPIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
         try:
-            account = BankAccount.objects.get(
-                account_number=account_number, user=request.user
+            account = get_account_resolver(request).get(
+                account_number, user=request.user
             )
 
             if not (account.fully_activated and account.kyc_verified):
@@ -213,23 +236,31 @@ class InitiateWithdrawalView(generics.CreateAPIView):
 
         amount = serializer.validated_data["amount"]
 
-        if account.account_balance < amount:
+        try:
+            hold = place_hold(account, amount, BalanceHold.HoldType.WITHDRAWAL)
+        except InsufficientFunds:
             return Response(
                 {"error": "Insufficient funds for withdrawal"},
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        request.session["withdrawal_data"] = {
-            "account_number": account_number,
-            "amount": str(amount),
-        }
-        logger.info("Withdrawal data stored in session")
+        withdrawal_token = issue_pending_token(
+            request.user,
+            PendingOperation.WITHDRAWAL,
+            {
+                "account_number": account_number,
+                "amount": str(amount),
+                "hold_id": str(hold.pk),
+            },
+        )
+        logger.info("Withdrawal token issued")
 
         return Response(
             {
                 "message": "Withdrawal Initiated. Please verify your username to complete the "
                 "withdrawal",
                 "next_step": "Verify your username to complete the withdrawal",
+                "withdrawal_token": withdrawal_token,
             },
             status=status.HTTP_200_OK,
         )
@@ -247,37 +278,50 @@ class VerifyUsernameAndWithdrawAPIView(generics.CreateAPIView):
         )
         serializer.is_valid(raise_exception=True)
 
-        withdrawal_data = request.session.get("withdrawal_data")
-        if not withdrawal_data:
-            return Response(
-                {
-                    "error": "No pending withdrawal found. Please initiate a withdrawal first"
-                },
-                status=status.HTTP_400_BAD_REQUEST,
+        try:
+            pending = load_pending_token(
+                request.data.get("withdrawal_token"),
+                request.user,
+                PendingOperation.WITHDRAWAL,
             )
+        except PendingOperationError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        withdrawal_data = pending["data"]
         account_number = withdrawal_data["account_number"]
         amount = Decimal(withdrawal_data["amount"])
 
         try:
-            account = BankAccount.objects.get(
-                account_number=account_number, user=request.user
+            account = get_account_resolver(request).get(
+                account_number, user=request.user
             )
         except BankAccount.DoesNotExist:
+            release_hold(withdrawal_data.get("hold_id"))
             return Response(
                 {"error": f"Account number {account_number} does not exist"},
                 status=status.HTTP_404_NOT_FOUND,
             )
-        if account.account_balance < amount:
+        try:
+            debit(account, amount, withdrawal_data.get("hold_id"))
+        except HoldExpired:
+            return Response(
+                {"error": "Your pending withdrawal has expired. Please start again."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        except InsufficientFunds:
             return Response(
                 {"error": "Insufficient funds for withdrawal"},
                 status=status.HTTP_400_BAD_REQUEST,
             )
-        account.account_balance -= amount
-        account.save()
+        try:
+            consume_pending_token(pending)
+        except PendingOperationError as e:
+            transaction.set_rollback(True)
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
         withdraw_transaction = Transaction.objects.create(
-            user=request.user,
-            sender=request.user,
+            user=account.user,
+            sender=account.user,
             sender_account=account,
             amount=amount,
             description=f"Withdrawal from account {account_number}",
@@ -295,8 +339,6 @@ class VerifyUsernameAndWithdrawAPIView(generics.CreateAPIView):
             account_number=account.account_number,
         )
 
-        del request.session["withdrawal_data"]
-
         return Response(
             {
                 "message": "Withdrawal completed successfully",
@@ -319,8 +361,8 @@ class InitiateTransferView(generics.CreateAPIView):
         receiver_account_number = data.get("receiver_account")
 
         try:
-            sender_account = BankAccount.objects.get(
-                account_number=sender_account_number, user=request.user
+            sender_account = get_account_resolver(request).get(
+                sender_account_number, user=request.user
             )
             if not (sender_account.fully_activated and sender_account.kyc_verified):
                 return Response(
@@ -342,16 +384,31 @@ class InitiateTransferView(generics.CreateAPIView):
         serializer = self.get_serializer(data=data)
 
         if serializer.is_valid():
-            request.session["transfer_data"] = {
-                "sender_account": sender_account_number,
-                "receiver_account": receiver_account_number,
-                "amount": str(serializer.validated_data["amount"]),
-                "description": serializer.validated_data.get("description", ""),
-            }
+            amount = serializer.validated_data["amount"]
+            try:
+                hold = place_hold(sender_account, amount, BalanceHold.HoldType.TRANSFER)
+            except InsufficientFunds:
+                return Response(
+                    {"error": "Insufficient funds for transfer"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            transfer_token = issue_pending_token(
+                request.user,
+                PendingOperation.TRANSFER,
+                {
+                    "sender_account": sender_account_number,
+                    "receiver_account": receiver_account_number,
+                    "amount": str(amount),
+                    "description": serializer.validated_data.get("description", ""),
+                    "hold_id": str(hold.pk),
+                },
+                stage=VerifySecurityQuestionView.stage,
+            )
             return Response(
                 {
                     "message": "Please answer your security question to proceed with the transfer",
                     "next_step": "verify security question",
+                    "transfer_token": transfer_token,
                 },
                 status=status.HTTP_200_OK,
             )
@@ -362,19 +419,42 @@ class VerifySecurityQuestionView(generics.CreateAPIView):
     serializer_class = SecurityQuestionSerializer
     renderer_classes = [GenericJSONRenderer]
     object_label = "verification_answer"
+    stage = "security_question"
 
     def create(self, request, *args, **kwargs):
+        try:
+            pending = load_pending_token(
+                request.data.get("transfer_token"),
+                request.user,
+                PendingOperation.TRANSFER,
+                stage=self.stage,
+            )
+        except PendingOperationError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
         serializer = self.get_serializer(
             data=request.data, context={"request": request}
         )
         if serializer.is_valid():
+            if not extend_hold(pending["data"].get("hold_id")):
+                return Response(
+                    {"error": "Your pending transfer has expired. Please start again."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
             otp = "".join([str(random.randint(0, 9)) for _ in range(6)])
             request.user.set_otp(otp)
             send_transfer_otp_email(request.user.email, otp)
+            transfer_token = issue_pending_token(
+                request.user,
+                PendingOperation.TRANSFER,
+                pending["data"],
+                stage=VerifyOTPView.stage,
+            )
             return Response(
                 {
                     "message": "Security question verified. An OTP has been sent to your email",
                     "next_step": "verify otp",
+                    "transfer_token": transfer_token,
                 },
                 status=status.HTTP_200_OK,
             )
@@ -385,30 +465,37 @@ class VerifyOTPView(generics.CreateAPIView):
     serializer_class = OTPVerificationSerializer
     renderer_classes = [GenericJSONRenderer]
     object_label = "verify_otp"
+    stage = "otp"
 
     def create(self, request, *args, **kwargs):
+        try:
+            pending = load_pending_token(
+                request.data.get("transfer_token"),
+                request.user,
+                PendingOperation.TRANSFER,
+                stage=self.stage,
+            )
+        except PendingOperationError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
         serializer = self.get_serializer(
             data=request.data, context={"request": request}
         )
         if serializer.is_valid():
-            return self.process_transfer(request)
+            return self.process_transfer(request, pending)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
-    def process_transfer(self, request) -> Response:
-        transfer_data = request.session.get("transfer_data")
-        if not transfer_data:
-            return Response(
-                {"error": "Transfer data not found. Please start the process again."},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
+    @transaction.atomic
+    def process_transfer(self, request, pending: dict) -> Response:
+        transfer_data = pending["data"]
+        resolver = get_account_resolver(request)
         try:
-            sender_account = BankAccount.objects.get(
-                account_number=transfer_data["sender_account"]
-            )
-            receiver_account = BankAccount.objects.get(
-                account_number=transfer_data["receiver_account"]
+            sender_account = resolver.get(
+                transfer_data["sender_account"], user=request.user
             )
+            receiver_account = resolver.get(transfer_data["receiver_account"])
         except BankAccount.DoesNotExist:
+            release_hold(transfer_data.get("hold_id"))
             return Response(
                 {"error": "One or both accounts not found"},
                 status=status.HTTP_404_NOT_FOUND,
@@ -416,20 +503,34 @@ class VerifyOTPView(generics.CreateAPIView):
 
         amount = Decimal(transfer_data["amount"])
 
-        if sender_account.account_balance < amount:
+        if settings.ASYNC_TRANSFER_SETTLEMENT:
+            return self.queue_transfer(
+                pending, sender_account, receiver_account, amount
+            )
+
+        try:
+            transfer(
+                sender_account, receiver_account, amount, transfer_data.get("hold_id")
+            )
+        except HoldExpired:
+            return Response(
+                {"error": "Your pending transfer has expired. Please start again."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        except InsufficientFunds:
             return Response(
                 {"error": "Insufficient funds for transfer"},
                 status=status.HTTP_400_BAD_REQUEST,
             )
-
-        sender_account.account_balance -= amount
-        receiver_account.account_balance += amount
-        sender_account.save()
-        receiver_account.save()
+        try:
+            consume_pending_token(pending)
+        except PendingOperationError as e:
+            transaction.set_rollback(True)
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
         transfer_transaction = Transaction.objects.create(
-            user=request.user,
-            sender=request.user,
+            user=sender_account.user,
+            sender=sender_account.user,
             sender_account=sender_account,
             receiver=receiver_account.user,
             receiver_account=receiver_account,
@@ -439,8 +540,6 @@ class VerifyOTPView(generics.CreateAPIView):
             status=Transaction.TransactionStatus.COMPLETED,
         )
 
-        del request.session["transfer_data"]
-
         send_transfer_email(
             sender_name=sender_account.user.full_name,
             sender_email=sender_account.user.email,
@@ -449,7 +548,7 @@ class VerifyOTPView(generics.CreateAPIView):
             amount=amount,
             currency=sender_account.currency,
             sender_new_balance=sender_account.account_balance,
-            receiver_new_balance=receiver_account.account_balance,
+            receiver_new_balance=receiver_account.get_total_balance(),
             sender_account_number=sender_account.account_number,
             receiver_account_number=receiver_account.account_number,
         )
@@ -464,17 +563,59 @@ class VerifyOTPView(generics.CreateAPIView):
             status=status.HTTP_201_CREATED,
         )
 
+    def queue_transfer(
+        self, pending: dict, sender_account, receiver_account, amount: Decimal
+    ) -> Response:
+        # The amount is held against the sender until settlement posts it
+        try:
+            transfer_transaction = queue_transfer(
+                sender_account,
+                receiver_account,
+                amount,
+                pending["data"].get("description", ""),
+                pending["data"].get("hold_id"),
+            )
+        except HoldExpired:
+            return Response(
+                {"error": "Your pending transfer has expired. Please start again."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        except InsufficientFunds:
+            return Response(
+                {"error": "Insufficient funds for transfer"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        try:
+            consume_pending_token(pending)
+        except PendingOperationError as e:
+            transaction.set_rollback(True)
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
-class TransactionListAPIView(generics.ListAPIView):
+        logger.info(
+            f"Transfer of {amount} from account {sender_account.account_number} to "
+            f"{receiver_account.account_number} queued for settlement"
+        )
+        return Response(
+            TransactionSerializer(transfer_transaction).data,
+            status=status.HTTP_202_ACCEPTED,
+        )
+
+
+class TransactionListAPIView(ReplicaReadMixin, ValuesListMixin, generics.ListAPIView):
     serializer_class = TransactionSerializer
+    values_serializer_class = TransactionValuesSerializer
     pagination_class = StandardResultsSetPagination
     filter_backends = [DjangoFilterBackend, OrderingFilter]
     ordering_fields = ["created_at", "amount"]
     ordering = ["-created_at"]
 
     def get_queryset(self):
+        from dateutil import parser
+
         user = self.request.user
-        queryset = Transaction.objects.filter(Q(sender=user) | Q(receiver=user))
+        queryset = Transaction.objects.filter(
+            Q(sender_id=user.pk) | Q(receiver_id=user.pk)
+        )
         start_date = self.request.query_params.get("start_date")
         end_date = self.request.query_params.get("end_date")
         account_number = self.request.query_params.get("account_number")
@@ -494,21 +635,23 @@ class TransactionListAPIView(generics.ListAPIView):
                 pass
 
         if account_number:
-            try:
-                account = BankAccount.objects.get(
-                    account_number=account_number, user=user
-                )
+            account = get_account_reference(account_number)
+            if account is None or account["user_id"] != user.pk:
+                queryset = Transaction.objects.none()
+            else:
                 queryset = queryset.filter(
-                    Q(sender_account=account) | Q(receiver_account=account)
+                    Q(sender_account_id=account["id"])
+                    | Q(receiver_account_id=account["id"])
                 )
-            except BankAccount.DoesNotExist:
-                queryset = Transaction.objects.none()
 
         return queryset
 
     def list(self, request, *args, **kwargs) -> Response:
         response = super().list(request, *args, **kwargs)
+        self.log_retrieval(request)
+        return response
 
+    def log_retrieval(self, request: Request) -> None:
         account_number = request.query_params.get("account_number")
         if account_number:
             logger.info(
@@ -518,7 +661,51 @@ class TransactionListAPIView(generics.ListAPIView):
             logger.info(
                 f"User {request.user.email} retrieved transactions(all accounts)"
             )
-        return response
+
+
+class AccountSummaryAPIView(generics.GenericAPIView):
+    serializer_class = AccountSummaryQuerySerializer
+    renderer_classes = [GenericJSONRenderer]
+    object_label = "account_summary"
+    staff_roles = {"account_executive", "teller", "branch_manager"}
+
+    def get(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        serializer = self.get_serializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        account_number = serializer.validated_data["account_number"]
+        start_month = serializer.validated_data["start_month"]
+        end_month = serializer.validated_data["end_month"]
+
+        account = get_account_reference(account_number)
+        if account is None or (
+            account["user_id"] != request.user.pk
+            and request.user.role not in self.staff_roles
+        ):
+            return Response(
+                {"error": f"Account number {account_number} does not exist"},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        summary = get_account_summary(account["id"], start_month, end_month)
+        return Response(
+            {
+                "account_number": account_number,
+                "start_month": start_month,
+                "end_month": end_month,
+                **summary,
+            }
+        )
+
+
+class SpendingAnalyticsAPIView(APIView):
+    renderer_classes = [GenericJSONRenderer]
+    object_label = "spending_analytics"
+
+    def get(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        # numpy is only needed here, so other API paths never import it
+        from .analytics import get_spending_analytics
+
+        return Response(get_spending_analytics(request.user.pk))
 
 
 class TransactionPDFView(APIView):
@@ -526,6 +713,8 @@ class TransactionPDFView(APIView):
     object_label = "transaction_pdf"
 
     def post(self, request) -> Response:
+        from dateutil import parser
+
         user = request.user
         start_date = request.data.get("start_date") or request.query_params.get(
             "start_date"
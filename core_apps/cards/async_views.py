@@ -0,0 +1,18 @@
+from typing import Any
+
+from asgiref.sync import sync_to_async
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from core_apps.common.async_views import AsyncAPIView, AsyncValuesListMixin
+from .views import VirtualCardListCreateAPIView
+
+
+class AsyncVirtualCardListCreateAPIView(
+    AsyncAPIView, AsyncValuesListMixin, VirtualCardListCreateAPIView
+):
+    async def get(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        return await self.alist(request, *args, **kwargs)
+
+    async def post(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        return await sync_to_async(self.create)(request, *args, **kwargs)
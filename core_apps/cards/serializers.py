@@ -3,17 +3,12 @@ from decimal import Decimal
 from django.utils import timezone
 from rest_framework import serializers
 
+from core_apps.common.read_serializers import ValuesSerializer
 from .models import VirtualCard
 from .utils import generate_card_number, generate_cvv
 
 
-class UUIDField(serializers.Field):
-    def to_representation(self, value) -> str:
-        return str(value)
-
-
 class VirtualCardSerializer(serializers.ModelSerializer):
-    id = UUIDField(read_only=True)
     balance = serializers.DecimalField(
         max_digits=10, decimal_places=2, min_value=Decimal("0.1")
     )
@@ -24,6 +19,10 @@ class VirtualCardSerializer(serializers.ModelSerializer):
         read_only_fields = ["id", "card_number", "expiry_date", "cvv"]
 
 
+class VirtualCardValuesSerializer(ValuesSerializer):
+    serializer_class = VirtualCardSerializer
+
+
 class VirtualCardCreateSerializer(serializers.ModelSerializer):
     bank_account_number = serializers.CharField(write_only=True)
 
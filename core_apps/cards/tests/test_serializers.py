@@ -0,0 +1,64 @@
+from datetime import timedelta
+from decimal import Decimal
+
+from django.test import TestCase
+from django.utils import timezone
+
+from core_apps.accounts.models import BankAccount
+from core_apps.cards.models import VirtualCard
+from core_apps.cards.serializers import (
+    VirtualCardSerializer,
+    VirtualCardValuesSerializer,
+)
+from core_apps.user_auth.models import User
+
+
+class VirtualCardValuesSerializerTests(TestCase):
+    # The card list renders .values() rows; they must match the model serializer
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        user = User.objects.create_user(
+            email="customer@example.com",
+            password="pass12345!",
+            first_name="Test",
+            last_name="User",
+            id_no=1,
+            security_question="maiden_name",
+            security_answer="answer",
+        )
+        account = BankAccount.objects.create(
+            user=user,
+            account_number="1234100000000001",
+            currency=BankAccount.AccountCurrency.DOLLAR,
+            account_type=BankAccount.AccountType.CURRENT,
+        )
+        expiry = timezone.now().replace(microsecond=123456) + timedelta(days=1095)
+        for index, (balance, status) in enumerate(
+            [
+                (Decimal("0.00"), VirtualCard.CardStatus.ACTIVE),
+                (Decimal("1250.5"), VirtualCard.CardStatus.INACTIVE),
+                (Decimal("99999999.99"), VirtualCard.CardStatus.BLOCKED),
+            ]
+        ):
+            VirtualCard.objects.create(
+                user=user,
+                bank_account=account,
+                card_number=f"400000000000000{index}",
+                expiry_date=expiry,
+                cvv=f"cvv{index}",
+                balance=balance,
+                status=status,
+            )
+
+    def test_matches_model_serializer(self) -> None:
+        queryset = VirtualCard.objects.order_by("card_number")
+        expected = VirtualCardSerializer(queryset, many=True).data
+        actual = VirtualCardValuesSerializer(
+            VirtualCardValuesSerializer.get_values_queryset(queryset)
+        ).data
+
+        self.assertEqual(len(actual), 3)
+        for expected_row, actual_row in zip(expected, actual):
+            self.assertEqual(list(actual_row), list(expected_row))
+            self.assertEqual(actual_row, dict(expected_row))
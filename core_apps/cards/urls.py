@@ -1,15 +1,23 @@
+from django.conf import settings
 from django.urls import path
 
+from .async_views import AsyncVirtualCardListCreateAPIView
 from .views import (
     VirtualCardDetailAPIView,
     VirtualCardListCreateAPIView,
     VirtualCardTopUpAPIView,
 )
 
+VirtualCardListView = (
+    AsyncVirtualCardListCreateAPIView
+    if settings.ASYNC_VIEWS
+    else VirtualCardListCreateAPIView
+)
+
 urlpatterns = [
     path(
         "virtual-cards/",
-        VirtualCardListCreateAPIView.as_view(),
+        VirtualCardListView.as_view(),
         name="virtual-card-list-create",
     ),
     path(
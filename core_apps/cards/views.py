@@ -4,19 +4,26 @@ from loguru import logger
 from rest_framework import generics, status
 from rest_framework.exceptions import PermissionDenied
 from rest_framework.response import Response
+from core_apps.accounts.balances import InsufficientFunds, debit
 from core_apps.accounts.models import Transaction
+from core_apps.common.read_serializers import ValuesListMixin
 from core_apps.common.renderers import GenericJSONRenderer
 from .emails import send_virtual_card_topup_email
 from .models import VirtualCard
-from .serializers import VirtualCardCreateSerializer, VirtualCardSerializer
+from .serializers import (
+    VirtualCardCreateSerializer,
+    VirtualCardSerializer,
+    VirtualCardValuesSerializer,
+)
 
 
-class VirtualCardListCreateAPIView(generics.ListCreateAPIView):
+class VirtualCardListCreateAPIView(ValuesListMixin, generics.ListCreateAPIView):
     renderer_classes = [GenericJSONRenderer]
     object_label = "visa_card"
+    values_serializer_class = VirtualCardValuesSerializer
 
     def get_queryset(self):
-        return VirtualCard.objects.filter(user=self.request.user)
+        return VirtualCard.objects.filter(user_id=self.request.user.pk)
 
     def get_serializer_class(self):
         if self.request.method == "POST":
@@ -57,7 +64,7 @@ class VirtualCardDetailAPIView(generics.RetrieveUpdateDestroyAPIView):
     object_label = "visa_card"
 
     def get_queryset(self):
-        return VirtualCard.objects.filter(user=self.request.user)
+        return VirtualCard.objects.filter(user_id=self.request.user.pk)
 
     def get_object(self):
         obj = super().get_object()
@@ -103,7 +110,7 @@ class VirtualCardTopUpAPIView(generics.UpdateAPIView):
     object_label = "visa_card"
 
     def get_queryset(self):
-        return VirtualCard.objects.filter(user=self.request.user)
+        return VirtualCard.objects.filter(user_id=self.request.user.pk)
 
     @transaction.atomic
     def update(self, request, *args, **kwargs):
@@ -130,16 +137,15 @@ class VirtualCardTopUpAPIView(generics.UpdateAPIView):
             )
         bank_account = virtual_card.bank_account
 
-        if bank_account.account_balance < amount:
+        try:
+            debit(bank_account, amount)
+        except InsufficientFunds:
             return Response(
                 {"error": "Insufficient funds in the bank account."},
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        bank_account.account_balance -= amount
         virtual_card.balance += amount
-
-        bank_account.save()
         virtual_card.save()
 
         transaction = Transaction.objects.create(
@@ -0,0 +1,79 @@
+import asyncio
+from typing import Any, List, Optional
+
+from asgiref.sync import sync_to_async
+from django.core.paginator import InvalidPage
+from django.db.models import QuerySet
+from django.http import HttpRequest
+from rest_framework.exceptions import NotFound
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+
+class AsyncAPIView(APIView):
+    # Runs coroutine handlers inside the regular DRF request/response cycle
+    async def dispatch(self, request: HttpRequest, *args: Any, **kwargs: Any) -> Any:
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(
+                    self, request.method.lower(), self.http_method_not_allowed
+                )
+            else:
+                handler = self.http_method_not_allowed
+
+            response = handler(request, *args, **kwargs)
+            if asyncio.iscoroutine(response):
+                response = await response
+
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
+
+    async def apaginate_queryset(self, queryset: QuerySet) -> Optional[List[Any]]:
+        paginator = self.paginator
+        if paginator is None:
+            return None
+
+        paginator.request = self.request
+        page_size = paginator.get_page_size(self.request)
+        if not page_size:
+            return None
+
+        django_paginator = paginator.django_paginator_class(queryset, page_size)
+        django_paginator.count = await queryset.acount()
+        page_number = paginator.get_page_number(self.request, django_paginator)
+
+        try:
+            page = django_paginator.page(page_number)
+        except InvalidPage as exc:
+            raise NotFound(
+                paginator.invalid_page_message.format(
+                    page_number=page_number, message=str(exc)
+                )
+            )
+
+        page.object_list = [obj async for obj in page.object_list]
+        paginator.page = page
+        return page.object_list
+
+
+class AsyncValuesListMixin:
+    async def alist(self, request: Any, *args: Any, **kwargs: Any) -> Response:
+        serializer_class = self.values_serializer_class
+        queryset = await sync_to_async(self.get_values_queryset)()
+
+        page = await self.apaginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(serializer_class(page).data)
+
+        return Response(serializer_class([row async for row in queryset]).data)
@@ -0,0 +1,150 @@
+import threading
+import time
+from collections import Counter, OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import caches
+from loguru import logger
+
+MISSING = object()
+
+
+class LocalLRUCache:
+    # Bounded per-process store whose entries expire after a short TTL
+    def __init__(self, max_entries: int, timeout: float) -> None:
+        self.max_entries = max_entries
+        self.timeout = timeout
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return MISSING
+            expires_at, value = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                return MISSING
+            self._entries.move_to_end(key)
+            return value
+
+    def set(
+        self, key: Hashable, value: Any, expires_at: Optional[float] = None
+    ) -> None:
+        if expires_at is None:
+            expires_at = time.time() + self.timeout
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class TieredCache:
+    # In-process LRU (L1) in front of the shared Django cache (L2).
+    # Every key has a version in L2; invalidate() bumps it, so a value loaded
+    # before the bump is written under a dead key and never served.
+    def __init__(
+        self,
+        namespace: str,
+        timeout: Optional[int] = None,
+        alias: str = "default",
+    ) -> None:
+        self.namespace = namespace
+        self.timeout = timeout or settings.TIERED_CACHE_TIMEOUT
+        self.alias = alias
+        self.local = LocalLRUCache(
+            settings.TIERED_CACHE_L1_MAX_ENTRIES, settings.TIERED_CACHE_L1_TIMEOUT
+        )
+        self.counters: Counter = Counter()
+
+    @property
+    def shared(self) -> Any:
+        return caches[self.alias]
+
+    def version_key(self, key: Hashable) -> str:
+        return f"{self.namespace}:version:{key}"
+
+    def data_key(self, key: Hashable, version: int) -> str:
+        return f"{self.namespace}:{key}:{version}"
+
+    def get_version(self, key: Hashable) -> int:
+        return self.shared.get(self.version_key(key)) or 0
+
+    def lookup(self, key: Hashable) -> Tuple[Optional[int], Any]:
+        value = self.local.get(key)
+        if value is not MISSING:
+            self.counters["l1_hits"] += 1
+            return None, value
+
+        try:
+            version = self.get_version(key)
+            value = self.shared.get(self.data_key(key, version), MISSING)
+        except Exception as e:
+            logger.warning(f"Shared cache read failed for {self.namespace}: {str(e)}")
+            return None, MISSING
+        if value is MISSING:
+            self.counters["misses"] += 1
+            return version, MISSING
+
+        self.counters["l2_hits"] += 1
+        self.local.set(key, value)
+        return version, value
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        _, value = self.lookup(key)
+        return default if value is MISSING else value
+
+    def get_or_set(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        version, value = self.lookup(key)
+        if value is not MISSING:
+            return value
+
+        value = loader()
+        if version is None:
+            return value
+        try:
+            self.shared.set(self.data_key(key, version), value, self.timeout)
+        except Exception as e:
+            logger.warning(f"Shared cache write failed for {self.namespace}: {str(e)}")
+            return value
+        self.local.set(key, value)
+        return value
+
+    def invalidate(self, key: Hashable) -> None:
+        self.local.delete(key)
+        version_key = self.version_key(key)
+        try:
+            if not self.shared.add(version_key, 1, None):
+                self.shared.incr(version_key)
+        except ValueError:
+            self.shared.set(version_key, 1, None)
+        except Exception as e:
+            logger.error(f"Failed to invalidate {self.namespace} {key}: {str(e)}")
+        self.counters["invalidations"] += 1
+
+    def stats(self) -> Dict[str, int]:
+        return dict(self.counters)
+
+
+_tiered_caches: Dict[str, TieredCache] = {}
+
+
+def get_tiered_cache(namespace: str, **kwargs: Any) -> TieredCache:
+    if namespace not in _tiered_caches:
+        _tiered_caches[namespace] = TieredCache(namespace, **kwargs)
+    return _tiered_caches[namespace]
+
+
+def tiered_cache_stats() -> Dict[str, Dict[str, int]]:
+    return {namespace: cache.stats() for namespace, cache in _tiered_caches.items()}
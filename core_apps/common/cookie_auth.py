@@ -1,12 +1,88 @@
+import time
 from typing import Optional, Tuple
 
 from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.utils.functional import SimpleLazyObject
+from django.utils.translation import gettext_lazy as _
 from loguru import logger
 from rest_framework.request import Request
 from rest_framework_simplejwt.authentication import AuthUser, JWTAuthentication
-from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+from rest_framework_simplejwt.settings import api_settings
 from rest_framework_simplejwt.tokens import Token
 
+from core_apps.common.cache import MISSING, LocalLRUCache
+from core_apps.user_auth.tokens import AUTH_VERSION_CLAIM, has_user_claims
+from core_apps.user_auth.utils import get_auth_version
+
+
+class VerifiedTokenCache(LocalLRUCache):
+    def get(self, raw_token: str) -> Optional[Token]:
+        token = super().get(raw_token)
+        return None if token is MISSING else token
+
+    def set(self, raw_token: str, token: Token) -> None:
+        super().set(
+            raw_token, token, expires_at=min(time.time() + self.timeout, token["exp"])
+        )
+
+    def discard(self, raw_token: str) -> None:
+        self.delete(raw_token)
+
+
+verified_tokens = VerifiedTokenCache(
+    max_entries=settings.AUTH_TOKEN_CACHE_SIZE, timeout=settings.AUTH_TOKEN_CACHE_TTL
+)
+
+
+class ClaimsUser(SimpleLazyObject):
+    # Answers role, status and email from the token; anything else loads the User row
+
+    def __init__(self, claims: dict) -> None:
+        user_model = get_user_model()
+        user_id = user_model._meta.pk.to_python(claims[api_settings.USER_ID_CLAIM])
+        super().__init__(
+            lambda: user_model.objects.get(**{api_settings.USER_ID_FIELD: user_id})
+        )
+        self.__dict__["_claims"] = claims
+        self.__dict__["_user_id"] = user_id
+
+    def __bool__(self) -> bool:
+        return True
+
+    @property
+    def id(self):
+        return self._user_id
+
+    @property
+    def pk(self):
+        return self._user_id
+
+    @property
+    def role(self) -> str:
+        return self._claims["role"]
+
+    @property
+    def account_status(self) -> str:
+        return self._claims["account_status"]
+
+    @property
+    def email(self) -> str:
+        return self._claims["email"]
+
+    @property
+    def auth_version(self) -> int:
+        return self._claims[AUTH_VERSION_CLAIM]
+
+    @property
+    def is_authenticated(self) -> bool:
+        return True
+
+    @property
+    def is_anonymous(self) -> bool:
+        return False
+
 
 class CookieAuthentication(JWTAuthentication):
     def authenticate(self, request: Request) -> Optional[Tuple[AuthUser, Token]]:
@@ -20,8 +96,30 @@ class CookieAuthentication(JWTAuthentication):
 
         if raw_token is not None:
             try:
+                if settings.AUTH_TOKEN_CLAIMS:
+                    return self.authenticate_from_claims(raw_token)
                 validated_token = self.get_validated_token(raw_token)
                 return self.get_user(validated_token), validated_token
             except TokenError as e:
                 logger.error(f"Token validation error: {str(e)}")
         return None
+
+    def authenticate_from_claims(self, raw_token) -> Tuple[AuthUser, Token]:
+        validated_token = verified_tokens.get(raw_token)
+
+        if validated_token is None:
+            validated_token = self.get_validated_token(raw_token)
+            if not has_user_claims(validated_token):
+                return self.get_user(validated_token), validated_token
+            verified_tokens.set(raw_token, validated_token)
+
+        user_id = validated_token[api_settings.USER_ID_CLAIM]
+        current_version = get_auth_version(user_id)
+        if (
+            current_version is None
+            or current_version > validated_token[AUTH_VERSION_CLAIM]
+        ):
+            verified_tokens.discard(raw_token)
+            raise InvalidToken(_("Token claims are out of date. Please log in again."))
+
+        return ClaimsUser(validated_token.payload), validated_token
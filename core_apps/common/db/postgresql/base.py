@@ -0,0 +1,51 @@
+import threading
+import time
+from typing import Any, Dict
+
+from django.conf import settings
+from django.db.backends.postgresql import base
+from loguru import logger
+
+
+class ConnectionMetrics:
+    # Per-process timings of opening (or checking out from the pool) a connection
+    def __init__(self) -> None:
+        self._stats: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, alias: str, seconds: float) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(
+                alias, {"count": 0, "total_ms": 0.0, "max_ms": 0.0}
+            )
+            stats["count"] += 1
+            stats["total_ms"] += seconds * 1000
+            stats["max_ms"] = max(stats["max_ms"], seconds * 1000)
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            return {alias: dict(stats) for alias, stats in self._stats.items()}
+
+
+connection_metrics = ConnectionMetrics()
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    def get_connection_params(self) -> Dict[str, Any]:
+        params = super().get_connection_params()
+        if settings.DATABASE_PGBOUNCER and base.is_psycopg3:
+            # PgBouncer transaction pooling can't track prepared statements
+            params["prepare_threshold"] = None
+        return params
+
+    def get_new_connection(self, conn_params: Dict[str, Any]) -> Any:
+        started = time.perf_counter()
+        connection = super().get_new_connection(conn_params)
+        elapsed = time.perf_counter() - started
+        connection_metrics.record(self.alias, elapsed)
+        if elapsed * 1000 >= settings.DB_CONNECT_SLOW_MS:
+            logger.warning(
+                f"Acquiring a '{self.alias}' database connection took "
+                f"{elapsed * 1000:.0f}ms"
+            )
+        return connection
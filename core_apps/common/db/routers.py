@@ -0,0 +1,84 @@
+import random
+from typing import Any, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Model, QuerySet
+from loguru import logger
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.request import Request
+
+PRIMARY = "default"
+
+
+def pin_key(user_id: Any) -> str:
+    return f"db:primary-pin:{user_id}"
+
+
+def pin_to_primary(user_id: Any) -> None:
+    try:
+        cache.set(pin_key(user_id), True, settings.REPLICA_STICKY_SECONDS)
+    except Exception as e:
+        logger.warning(f"Failed to pin user {user_id} to the primary: {str(e)}")
+
+
+def is_pinned(user_id: Any) -> bool:
+    try:
+        return bool(cache.get(pin_key(user_id)))
+    except Exception:
+        # Without the pin we can't promise read-your-writes, so stay on the primary
+        return True
+
+
+def get_read_alias(user_id: Optional[Any] = None) -> str:
+    if not settings.DATABASE_REPLICAS:
+        return PRIMARY
+    if user_id is not None and is_pinned(user_id):
+        return PRIMARY
+    return random.choice(settings.DATABASE_REPLICAS)
+
+
+class PrimaryReplicaRouter:
+    # Replicas are only read through an explicit .using(); related objects follow
+    # the instance they were loaded from, and every write goes to the primary
+    def db_for_read(self, model: type, **hints: Any) -> Optional[str]:
+        return None
+
+    def db_for_write(self, model: type, **hints: Any) -> str:
+        return PRIMARY
+
+    def allow_relation(self, obj1: Model, obj2: Model, **hints: Any) -> bool:
+        aliases = {PRIMARY, *settings.DATABASE_REPLICAS}
+        return obj1._state.db in aliases and obj2._state.db in aliases
+
+    def allow_migrate(self, db: str, app_label: str, **hints: Any) -> bool:
+        return db == PRIMARY
+
+
+class ReplicaReadMixin:
+    # For read-only list views; money movement views never use it
+    read_db = PRIMARY
+
+    def initial(self, request: Request, *args: Any, **kwargs: Any) -> None:
+        super().initial(request, *args, **kwargs)
+        self.read_db = get_read_alias(request.user.pk)
+
+    def filter_queryset(self, queryset: QuerySet) -> QuerySet:
+        return super().filter_queryset(queryset).using(self.read_db)
+
+
+class PrimaryStickinessMiddleware:
+    # Keeps a user's reads on the primary for a short while after they write
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        if (
+            settings.DATABASE_REPLICAS
+            and request.method not in SAFE_METHODS
+            and response.status_code < 400
+            and request.user.is_authenticated
+        ):
+            pin_to_primary(request.user.pk)
+        return response
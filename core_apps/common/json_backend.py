@@ -0,0 +1,50 @@
+import datetime
+import json
+import uuid
+from decimal import Decimal
+from typing import Any
+
+from django.conf import settings
+from django.utils.functional import Promise
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_default(obj: Any) -> Any:
+    if isinstance(obj, (Decimal, uuid.UUID, Promise)):
+        return str(obj)
+    if isinstance(obj, datetime.datetime):
+        value = obj.isoformat()
+        return value[:-6] + "Z" if value.endswith("+00:00") else value
+    if isinstance(obj, (datetime.date, datetime.time)):
+        return obj.isoformat()
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def stdlib_dumps(data: Any) -> bytes:
+    return json.dumps(
+        data, default=json_default, ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def orjson_dumps(data: Any) -> bytes:
+    return orjson.dumps(
+        data,
+        default=json_default,
+        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z,
+    )
+
+
+def get_json_dumps():
+    if settings.JSON_RENDERER_BACKEND == "orjson" and orjson is not None:
+        return orjson_dumps
+    return stdlib_dumps
+
+
+def dumps(data: Any) -> bytes:
+    return get_json_dumps()(data)
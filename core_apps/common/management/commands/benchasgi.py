@@ -0,0 +1,217 @@
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from decimal import Decimal
+from typing import Any, Dict, List, Tuple
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.urls import reverse
+from django.utils.crypto import get_random_string
+
+from core_apps.accounts.models import BankAccount, Transaction
+from core_apps.common.json_backend import stdlib_dumps
+from core_apps.user_auth.models import User
+from core_apps.user_auth.tokens import ClaimsRefreshToken
+
+HOST = "127.0.0.1"
+
+
+class Command(BaseCommand):
+    help = (
+        "Serve the API with gunicorn (WSGI) and uvicorn (ASGI) side by side and "
+        "compare them under concurrent clients. Runs against the configured "
+        "database with a throwaway user; raise the DRF throttle rates first"
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--concurrency", type=int, default=200)
+        parser.add_argument("--workers", type=int, default=1)
+        parser.add_argument("--rows", type=int, default=300)
+        parser.add_argument(
+            "--scenario",
+            nargs="*",
+            choices=["login", "transactions"],
+            default=["login", "transactions"],
+        )
+        parser.add_argument("--wsgi-port", type=int, default=8101)
+        parser.add_argument("--asgi-port", type=int, default=8102)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        password = get_random_string(24)
+        user = self.create_user(password, options["rows"])
+        servers = []
+        try:
+            servers = [
+                ("WSGI", options["wsgi_port"], self.start_wsgi(options)),
+                ("ASGI", options["asgi_port"], self.start_asgi(options)),
+            ]
+            requests = {
+                "login": self.build_request(
+                    "POST",
+                    reverse("login"),
+                    body=stdlib_dumps({"email": user.email, "password": password}),
+                ),
+                "transactions": self.build_request(
+                    "GET",
+                    f"{reverse('transaction_list')}?page_size=20",
+                    token=str(ClaimsRefreshToken.for_user(user).access_token),
+                ),
+            }
+
+            self.stdout.write(
+                f"{options['concurrency']} concurrent clients, "
+                f"{options['workers']} worker(s) per server"
+            )
+            for scenario in options["scenario"]:
+                for name, port, process in servers:
+                    self.wait_until_ready(port, process)
+                    seconds, latencies, codes = asyncio.run(
+                        self.run_clients(
+                            port, requests[scenario], options["concurrency"]
+                        )
+                    )
+                    latencies.sort()
+                    self.stdout.write(
+                        f"{scenario:>12} {name}: {seconds:>6.2f}s "
+                        f"{len(latencies) / seconds:>7.1f} req/s "
+                        f"p50 {latencies[len(latencies) // 2] * 1000:>6.0f}ms "
+                        f"p95 {latencies[int(len(latencies) * 0.95)] * 1000:>6.0f}ms "
+                        f"status {dict(sorted(codes.items()))}"
+                    )
+                    if 429 in codes:
+                        self.stderr.write("Throttled: raise DEFAULT_THROTTLE_RATES")
+        finally:
+            for _, _, process in servers:
+                process.terminate()
+                process.wait(timeout=30)
+            Transaction.objects.filter(receiver=user).delete()
+            user.delete()
+
+    def create_user(self, password: str, rows: int) -> User:
+        suffix = get_random_string(8, "0123456789")
+        user = User.objects.create_user(
+            email=f"benchmark{suffix}@example.com",
+            password=password,
+            first_name="Benchmark",
+            last_name="User",
+            id_no=int(f"9{suffix}"),
+            security_question="maiden_name",
+            security_answer="benchmark",
+        )
+        account = BankAccount.objects.create(
+            user=user,
+            account_number=f"9999{suffix}0000",
+            account_balance=Decimal("1000.00"),
+            currency=BankAccount.AccountCurrency.DOLLAR,
+            account_type=BankAccount.AccountType.CURRENT,
+        )
+        Transaction.objects.bulk_create(
+            Transaction(
+                user=user,
+                receiver=user,
+                receiver_account=account,
+                amount=Decimal("10.00") + index,
+                description=f"Benchmark deposit #{index}",
+                status=Transaction.TransactionStatus.COMPLETED,
+                transaction_type=Transaction.TransactionType.DEPOSIT,
+            )
+            for index in range(rows)
+        )
+        return user
+
+    def start_wsgi(self, options: Dict[str, Any]) -> subprocess.Popen:
+        env = os.environ.copy()
+        env.update(
+            ASYNC_VIEWS="False",
+            GUNICORN_BIND=f"{HOST}:{options['wsgi_port']}",
+            GUNICORN_WORKERS=str(options["workers"]),
+            GUNICORN_PIDFILE=os.path.join(tempfile.gettempdir(), "benchasgi.pid"),
+        )
+        return self.start(
+            ["gunicorn", "config.wsgi:application", "--config", "config/gunicorn.py"],
+            env,
+        )
+
+    def start_asgi(self, options: Dict[str, Any]) -> subprocess.Popen:
+        env = os.environ.copy()
+        env["ASYNC_VIEWS"] = "True"
+        return self.start(
+            [
+                "uvicorn",
+                "config.asgi:application",
+                "--host",
+                HOST,
+                "--port",
+                str(options["asgi_port"]),
+                "--workers",
+                str(options["workers"]),
+                "--no-access-log",
+            ],
+            env,
+        )
+
+    def start(self, command: List[str], env: Dict[str, str]) -> subprocess.Popen:
+        return subprocess.Popen(
+            [sys.executable, "-m", *command],
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+
+    def wait_until_ready(self, port: int, process: subprocess.Popen) -> None:
+        deadline = time.monotonic() + 60
+        while time.monotonic() < deadline:
+            if process.poll() is not None:
+                raise CommandError(f"The server on port {port} exited at startup")
+            try:
+                socket.create_connection((HOST, port), timeout=1).close()
+                return
+            except OSError:
+                time.sleep(0.2)
+        raise CommandError(f"The server on port {port} did not start")
+
+    def build_request(
+        self, method: str, path: str, body: bytes = b"", token: str = ""
+    ) -> bytes:
+        headers = [
+            f"{method} {path} HTTP/1.1",
+            f"Host: {HOST}",
+            "Connection: close",
+            "Content-Type: application/json",
+            f"Content-Length: {len(body)}",
+        ]
+        if token:
+            headers.append(f"Authorization: Bearer {token}")
+        return "\r\n".join(headers).encode() + b"\r\n\r\n" + body
+
+    async def run_clients(
+        self, port: int, request: bytes, concurrency: int
+    ) -> Tuple[float, List[float], Counter]:
+        async def fetch() -> Tuple[int, float]:
+            started = time.perf_counter()
+            try:
+                reader, writer = await asyncio.open_connection(HOST, port)
+                writer.write(request)
+                await writer.drain()
+                status_line = await reader.readline()
+                await reader.read()
+                writer.close()
+            except OSError:
+                status_line = b""
+            # 0 counts connections the server dropped without a response
+            status = status_line.split()[1] if status_line else b"0"
+            return int(status), time.perf_counter() - started
+
+        started = time.perf_counter()
+        results = await asyncio.gather(*(fetch() for _ in range(concurrency)))
+        seconds = time.perf_counter() - started
+        return (
+            seconds,
+            [latency for _, latency in results],
+            Counter(code for code, _ in results),
+        )
@@ -0,0 +1,74 @@
+import timeit
+from typing import Any, Callable, Dict
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import transaction
+from django.test import override_settings
+from rest_framework.response import Response
+
+from core_apps.accounts.management.commands.benchtransactions import (
+    Rollback,
+    create_transfers,
+)
+from core_apps.accounts.serializers import TransactionValuesSerializer
+from core_apps.common.json_backend import orjson
+from core_apps.common.renderers import GenericJSONRenderer
+
+
+class Command(BaseCommand):
+    help = (
+        "Render a page of transactions through GenericJSONRenderer with the "
+        "stdlib and orjson backends, buffered and streamed; nothing is kept in "
+        "the database"
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--rows", type=int, default=100)
+        parser.add_argument("--repeat", type=int, default=200)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if orjson is None:
+            raise CommandError("orjson is not installed")
+        try:
+            with transaction.atomic():
+                self.run(options["rows"], options["repeat"])
+                raise Rollback
+        except Rollback:
+            pass
+
+    def run(self, rows: int, repeat: int) -> None:
+        queryset = create_transfers(rows)
+        page = {
+            "count": rows,
+            "next": None,
+            "previous": None,
+            "results": TransactionValuesSerializer(
+                TransactionValuesSerializer.get_values_queryset(queryset)
+            ).data,
+        }
+        renderer = GenericJSONRenderer()
+        context = {"response": Response(status=200), "view": None}
+        renders: Dict[str, Callable[[], bytes]] = {
+            "render": lambda: renderer.render(page, renderer_context=context),
+            "stream": lambda: b"".join(renderer.iter_render(page, 200, context)),
+        }
+
+        outputs = set()
+        timings = {}
+        for backend in ("stdlib", "orjson"):
+            with override_settings(JSON_RENDERER_BACKEND=backend):
+                for mode, render in renders.items():
+                    outputs.add(render())
+                    timings[(mode, backend)] = min(
+                        timeit.repeat(render, number=1, repeat=repeat)
+                    )
+        if len(outputs) != 1:
+            raise CommandError("The backends or render modes produced different bytes")
+
+        size_kb = len(outputs.pop()) / 1024
+        self.stdout.write(f"{rows} transactions, {size_kb:.1f}KB per page")
+        for (mode, backend), seconds in timings.items():
+            self.stdout.write(
+                f"{mode:>7} {backend:>7}: {seconds * 1000:>7.3f}ms "
+                f"{rows / seconds:>12,.0f} rows/s"
+            )
@@ -0,0 +1,73 @@
+import os
+import resource
+import subprocess
+import sys
+from typing import Any, List, Tuple
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+# Heavy dependencies that only tasks or specific code paths may import
+LAZY_MODULES = ["reportlab", "PIL.Image", "numpy"]
+
+
+class Command(BaseCommand):
+    help = "Profile the imports of a fresh API process with python -X importtime"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--module", default=settings.ROOT_URLCONF)
+        parser.add_argument("--top", type=int, default=15)
+        parser.add_argument(
+            "--budget-ms",
+            type=float,
+            help="Fail when the total import time exceeds this many milliseconds",
+        )
+        parser.add_argument("--forbid", nargs="*", default=LAZY_MODULES)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        code = f"import django; django.setup(); import {options['module']}"
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            capture_output=True,
+            text=True,
+            env=os.environ.copy(),
+        )
+        if result.returncode != 0:
+            raise CommandError(result.stderr.strip().splitlines()[-1])
+
+        imports = self.parse_importtime(result.stderr)
+        total_ms = sum(self_us for _, self_us, _ in imports) / 1000
+        rss_mb = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024
+
+        self.stdout.write(
+            f"{len(imports)} modules imported in {total_ms:.0f}ms, "
+            f"peak RSS {rss_mb:.1f}MB"
+        )
+        self.stdout.write(f"{'cumulative':>12} {'self':>9}  module")
+        for name, self_us, cumulative_us in sorted(
+            imports, key=lambda row: row[1], reverse=True
+        )[: options["top"]]:
+            self.stdout.write(
+                f"{cumulative_us / 1000:>10.1f}ms {self_us / 1000:>7.1f}ms  {name}"
+            )
+
+        loaded = {name for name, _, _ in imports}
+        eager = [name for name in options["forbid"] if name in loaded]
+        if eager:
+            raise CommandError(f"Imported at startup: {', '.join(eager)}")
+        if options["budget_ms"] and total_ms > options["budget_ms"]:
+            raise CommandError(
+                f"Import time {total_ms:.0f}ms exceeds the "
+                f"{options['budget_ms']:.0f}ms budget"
+            )
+
+    def parse_importtime(self, output: str) -> List[Tuple[str, int, int]]:
+        imports = []
+        for line in output.splitlines():
+            if not line.startswith("import time:"):
+                continue
+            self_us, cumulative_us, name = line[len("import time:") :].split("|")
+            if not self_us.strip().isdigit():
+                continue
+            imports.append((name.strip(), int(self_us), int(cumulative_us)))
+        return imports
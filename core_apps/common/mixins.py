@@ -0,0 +1,49 @@
+from typing import Any, Set
+
+
+class DirtyFieldsMixin:
+    # Remembers the values loaded from the database so saves only write changes
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._reset_loaded_values()
+        return instance
+
+    def _reset_loaded_values(self) -> None:
+        self._loaded_values = {
+            field.attname: self.__dict__[field.attname]
+            for field in self._meta.concrete_fields
+            if field.attname in self.__dict__
+        }
+
+    def get_dirty_fields(self) -> Set[str]:
+        loaded_values = getattr(self, "_loaded_values", None)
+        if loaded_values is None:
+            return {field.name for field in self._meta.concrete_fields}
+        return {
+            field.name
+            for field in self._meta.concrete_fields
+            if field.attname in self.__dict__
+            and (
+                field.attname not in loaded_values
+                or self.__dict__[field.attname] != loaded_values[field.attname]
+            )
+        }
+
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        if (
+            not self._state.adding
+            and kwargs.get("update_fields") is None
+            and hasattr(self, "_loaded_values")
+        ):
+            dirty_fields = self.get_dirty_fields()
+            if not dirty_fields:
+                return
+            auto_now_fields = {
+                field.name
+                for field in self._meta.concrete_fields
+                if getattr(field, "auto_now", False)
+            }
+            kwargs["update_fields"] = dirty_fields | auto_now_fields
+        super().save(*args, **kwargs)
+        self._reset_loaded_values()
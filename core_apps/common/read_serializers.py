@@ -0,0 +1,104 @@
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db.models import QuerySet
+from rest_framework import serializers
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+Accessor = Callable[[Dict[str, Any]], Any]
+
+
+def full_name(first_name: Optional[str], last_name: Optional[str]) -> Optional[str]:
+    if first_name is None and last_name is None:
+        return None
+    return f"{first_name} {last_name}".title().strip()
+
+
+def field_accessor(path: str, convert: Callable[[Any], Any]) -> Accessor:
+    def access(row: Dict[str, Any]) -> Any:
+        value = row[path]
+        return None if value is None else convert(value)
+
+    return access
+
+
+def computed_accessor(paths: Sequence[str], compute: Callable[..., Any]) -> Accessor:
+    def access(row: Dict[str, Any]) -> Any:
+        return compute(*(row[path] for path in paths))
+
+    return access
+
+
+class ValuesSerializer:
+    # Read-only counterpart of a ModelSerializer that renders .values() rows
+    serializer_class = None
+    computed_fields: Dict[str, Tuple[Sequence[str], Callable[..., Any]]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._compiled = None
+
+    def __init__(self, rows: Iterable[Dict[str, Any]]) -> None:
+        self.rows = rows
+
+    @classmethod
+    def compile(cls) -> Tuple[List[str], List[Tuple[str, Accessor]]]:
+        if cls._compiled is not None:
+            return cls._compiled
+
+        paths = []
+        accessors = []
+        for name, field in cls.serializer_class().fields.items():
+            if field.write_only:
+                continue
+            if name in cls.computed_fields:
+                field_paths, compute = cls.computed_fields[name]
+                paths.extend(field_paths)
+                accessors.append((name, computed_accessor(field_paths, compute)))
+                continue
+            if (
+                isinstance(
+                    field,
+                    (serializers.BaseSerializer, serializers.SerializerMethodField),
+                )
+                or field.source == "*"
+            ):
+                raise ImproperlyConfigured(
+                    f"{cls.__name__} needs a computed field for '{name}'"
+                )
+            path = field.source.replace(".", "__")
+            paths.append(path)
+            accessors.append((name, field_accessor(path, field.to_representation)))
+
+        cls._compiled = (list(dict.fromkeys(paths)), accessors)
+        return cls._compiled
+
+    @classmethod
+    def get_values_queryset(cls, queryset: QuerySet) -> QuerySet:
+        paths, _ = cls.compile()
+        return queryset.values(*paths)
+
+    @property
+    def data(self) -> List[Dict[str, Any]]:
+        _, accessors = self.compile()
+        return [{name: access(row) for name, access in accessors} for row in self.rows]
+
+
+class ValuesListMixin:
+    values_serializer_class = None
+
+    def get_values_queryset(self) -> QuerySet:
+        return self.values_serializer_class.get_values_queryset(
+            self.filter_queryset(self.get_queryset())
+        )
+
+    def list(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        serializer_class = self.values_serializer_class
+        queryset = self.get_values_queryset()
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(serializer_class(page).data)
+
+        return Response(serializer_class(queryset).data)
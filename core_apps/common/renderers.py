@@ -1,14 +1,26 @@
-import json
-from typing import Any, Optional, Union
+from typing import Any, Iterable, Iterator, Optional, Union
 
+from django.conf import settings
+from django.http import StreamingHttpResponse
 from django.utils.translation import gettext_lazy as _
 from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from .json_backend import dumps
 
 
 class GenericJSONRenderer(JSONRenderer):
     charset = "utf-8"
     object_label = "object"
 
+    def get_object_label(self, renderer_context: dict) -> str:
+        view = renderer_context.get("view")
+
+        if hasattr(view, "object_label"):
+            return view.object_label
+        return self.object_label
+
     def render(
         self,
         data: Any,
@@ -19,12 +31,7 @@ class GenericJSONRenderer(JSONRenderer):
         if renderer_context is None:
             renderer_context = {}
 
-        view = renderer_context.get("view")
-
-        if hasattr(view, "object_label"):
-            object_label = view.object_label
-        else:
-            object_label = self.object_label
+        object_label = self.get_object_label(renderer_context)
 
         response = renderer_context.get("response")
         if not response:
@@ -32,11 +39,73 @@ class GenericJSONRenderer(JSONRenderer):
 
         status_code = response.status_code
 
-        errors = data.get("errors", None)
+        errors = data.get("errors", None) if isinstance(data, dict) else None
 
         if errors is not None:
             return super(GenericJSONRenderer, self).render(data)
 
-        return json.dumps({"status_code": status_code, object_label: data}).encode(
-            self.charset
+        return dumps({"status_code": status_code, object_label: data})
+
+    def iter_render(
+        self, data: Any, status_code: int, renderer_context: dict
+    ) -> Iterator[bytes]:
+        object_label = self.get_object_label(renderer_context)
+        prefix = dumps({"status_code": status_code, object_label: None})[
+            : -len(b"null}")
+        ]
+
+        if isinstance(data, dict) and isinstance(data.get("results"), list):
+            items = data["results"]
+            head = {key: value for key, value in data.items() if key != "results"}
+            head_fields = dumps(head)[:-1] + b"," if head else b"{"
+            yield prefix + head_fields + b'"results":'
+            yield from self.iter_items(items)
+            yield b"}}"
+        else:
+            yield prefix
+            yield from self.iter_items(data)
+            yield b"}"
+
+    def iter_items(self, items: Iterable[Any]) -> Iterator[bytes]:
+        chunk_size = settings.JSON_STREAM_CHUNK_SIZE
+        separator = b"["
+        chunk = []
+        for item in items:
+            chunk.append(item)
+            if len(chunk) >= chunk_size:
+                yield separator + dumps(chunk)[1:-1]
+                separator = b","
+                chunk = []
+        if chunk:
+            yield separator + dumps(chunk)[1:-1]
+            separator = b","
+        yield b"[]" if separator == b"[" else b"]"
+
+
+class StreamingListMixin:
+    # Streams large list payloads instead of encoding them into one buffer
+    def finalize_response(
+        self, request: Request, response: Response, *args: Any, **kwargs: Any
+    ) -> Any:
+        response = super().finalize_response(request, response, *args, **kwargs)
+        renderer = getattr(request, "accepted_renderer", None)
+        data = getattr(response, "data", None)
+        items = data.get("results") if isinstance(data, dict) else data
+
+        if (
+            not isinstance(renderer, GenericJSONRenderer)
+            or not isinstance(items, list)
+            or len(items) < settings.JSON_STREAM_MIN_ITEMS
+            or response.exception
+        ):
+            return response
+
+        streaming_response = StreamingHttpResponse(
+            renderer.iter_render(data, response.status_code, {"view": self}),
+            status=response.status_code,
+            content_type=f"{renderer.media_type}; charset={renderer.charset}",
         )
+        for header, value in response.headers.items():
+            if header.lower() != "content-type":
+                streaming_response[header] = value
+        return streaming_response
@@ -0,0 +1,65 @@
+from collections import defaultdict
+
+from celery import shared_task
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from django.db.models import Case, Count, F, Value, When
+from django.utils.dateparse import parse_datetime
+from loguru import logger
+
+from .models import ContentView
+
+
+@shared_task(name="flush_content_views")
+def flush_content_views(views: list) -> int:
+    content_views = [
+        ContentView(
+            content_type_id=content_type_id,
+            object_id=object_id,
+            user_id=user_id,
+            viewer_ip=viewer_ip,
+            last_viewed=parse_datetime(last_viewed),
+        )
+        for content_type_id, object_id, user_id, viewer_ip, last_viewed in views
+    ]
+    viewed_objects = defaultdict(set)
+    for view in content_views:
+        viewed_objects[view.content_type_id].add(view.object_id)
+
+    with transaction.atomic():
+        ContentView.objects.bulk_create(
+            content_views,
+            update_conflicts=True,
+            unique_fields=["content_type", "object_id", "user", "viewer_ip"],
+            update_fields=["last_viewed", "updated_at"],
+        )
+        for content_type_id, object_ids in viewed_objects.items():
+            update_view_counts(content_type_id, object_ids)
+
+    logger.info(f"Flushed {len(content_views)} content views")
+    return len(content_views)
+
+
+def update_view_counts(content_type_id: int, object_ids: set) -> None:
+    model = ContentType.objects.get_for_id(content_type_id).model_class()
+    if model is None or not any(
+        field.name == "view_count" for field in model._meta.concrete_fields
+    ):
+        return
+
+    totals = (
+        ContentView.objects.filter(
+            content_type_id=content_type_id, object_id__in=object_ids
+        )
+        .values("object_id")
+        .annotate(total=Count("id"))
+    )
+    whens = [When(pk=row["object_id"], then=Value(row["total"])) for row in totals]
+    if whens:
+        model.objects.filter(pk__in=object_ids).update(
+            view_count=Case(
+                *whens,
+                default=F("view_count"),
+                output_field=model._meta.get_field("view_count"),
+            )
+        )
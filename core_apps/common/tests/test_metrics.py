@@ -0,0 +1,38 @@
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from core_apps.user_auth.models import User
+from core_apps.user_auth.tokens import ClaimsRefreshToken
+
+
+class ProcessMetricsTests(APITestCase):
+    def authenticate(self, **extra) -> None:
+        user = User.objects.create_user(
+            email="metrics@example.com",
+            password="pass12345!",
+            first_name="Test",
+            last_name="User",
+            id_no=1,
+            security_question="maiden_name",
+            security_answer="answer",
+            **extra,
+        )
+        token = ClaimsRefreshToken.for_user(user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+    def test_staff_can_read_metrics(self) -> None:
+        self.authenticate(is_staff=True)
+
+        response = self.client.get(reverse("process_metrics"))
+
+        self.assertEqual(response.status_code, 200, response.content)
+        metrics = response.json()["metrics"]
+        self.assertEqual(set(metrics), {"pid", "database_connections", "tiered_caches"})
+        self.assertIn("default", metrics["database_connections"])
+
+    def test_customers_cannot_read_metrics(self) -> None:
+        self.authenticate()
+
+        response = self.client.get(reverse("process_metrics"))
+
+        self.assertEqual(response.status_code, 403)
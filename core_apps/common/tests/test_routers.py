@@ -0,0 +1,108 @@
+from decimal import Decimal
+from unittest import skipUnless
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connections
+from django.http import HttpResponse
+from django.test import RequestFactory, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from core_apps.accounts.models import Transaction
+from core_apps.accounts.tests.base import LOCMEM_CACHES, AccountsTestMixin
+from core_apps.common.db.routers import (
+    PRIMARY,
+    PrimaryReplicaRouter,
+    PrimaryStickinessMiddleware,
+    get_read_alias,
+    is_pinned,
+)
+
+REPLICA = "replica_1"
+HAS_REPLICA = REPLICA in settings.DATABASES
+
+
+# make test sets DATABASE_REPLICA_HOSTS so replica_1 mirrors the test database
+@skipUnless(HAS_REPLICA, "DATABASE_REPLICA_HOSTS is not set")
+@override_settings(CACHES=LOCMEM_CACHES, DATABASE_REPLICAS=[REPLICA])
+class PrimaryReplicaRouterTests(AccountsTestMixin, TransactionTestCase):
+    client_class = APIClient
+    # The runner checks every alias a test class names, skipped or not
+    databases = {PRIMARY, REPLICA} if HAS_REPLICA else {PRIMARY}
+
+    def setUp(self) -> None:
+        caches["default"].clear()
+        self.customer = self.create_user("customer@example.com", "customer1", 1)
+        self.account = self.create_account(
+            self.customer, "1234100000000001", Decimal("100.00")
+        )
+        Transaction.objects.create(
+            user=self.customer,
+            receiver=self.customer,
+            receiver_account=self.account,
+            amount=Decimal("100.00"),
+            transaction_type=Transaction.TransactionType.DEPOSIT,
+            status=Transaction.TransactionStatus.COMPLETED,
+        )
+
+    def list_transactions(self):
+        self.authenticate(self.customer)
+        with CaptureQueriesContext(connections[PRIMARY]) as primary:
+            with CaptureQueriesContext(connections[REPLICA]) as replica:
+                response = self.client.get(reverse("transaction_list"))
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(response.json()["count"], 1)
+        return (
+            [query["sql"] for query in primary.captured_queries],
+            [query["sql"] for query in replica.captured_queries],
+        )
+
+    def transaction_reads(self, queries):
+        return [sql for sql in queries if '"accounts_transaction"' in sql]
+
+    def pin_with(self, method: str, status: int) -> None:
+        request = getattr(RequestFactory(), method)("/")
+        request.user = self.customer
+        PrimaryStickinessMiddleware(lambda request: HttpResponse(status=status))(
+            request
+        )
+
+    def test_reads_go_to_the_replica(self) -> None:
+        self.assertEqual(get_read_alias(self.customer.pk), REPLICA)
+
+        primary, replica = self.list_transactions()
+
+        self.assertTrue(self.transaction_reads(replica))
+        self.assertFalse(self.transaction_reads(primary))
+
+    def test_writes_go_to_the_primary(self) -> None:
+        self.assertEqual(PrimaryReplicaRouter().db_for_write(Transaction), PRIMARY)
+        with CaptureQueriesContext(connections[REPLICA]) as replica:
+            self.account.account_balance = Decimal("50.00")
+            self.account.save()
+        self.assertEqual(self.account._state.db, PRIMARY)
+        self.assertEqual(len(replica.captured_queries), 0)
+
+    def test_unsafe_request_pins_the_user_to_the_primary(self) -> None:
+        self.pin_with("get", 200)
+        self.pin_with("post", 400)
+        self.assertFalse(is_pinned(self.customer.pk))
+
+        self.pin_with("post", 201)
+
+        self.assertTrue(is_pinned(self.customer.pk))
+        self.assertEqual(get_read_alias(self.customer.pk), PRIMARY)
+        primary, replica = self.list_transactions()
+        self.assertTrue(self.transaction_reads(primary))
+        self.assertFalse(self.transaction_reads(replica))
+
+    @override_settings(DATABASE_REPLICAS=[])
+    def test_reads_fall_back_to_the_primary_without_replicas(self) -> None:
+        self.assertEqual(get_read_alias(self.customer.pk), PRIMARY)
+
+        primary, replica = self.list_transactions()
+
+        self.assertTrue(self.transaction_reads(primary))
+        self.assertFalse(self.transaction_reads(replica))
@@ -0,0 +1,7 @@
+from django.urls import path
+
+from .views import ProcessMetricsAPIView
+
+urlpatterns = [
+    path("", ProcessMetricsAPIView.as_view(), name="process_metrics"),
+]
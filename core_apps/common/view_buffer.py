@@ -0,0 +1,84 @@
+import atexit
+import os
+import threading
+import time
+from typing import Any, Optional
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.utils import timezone
+from loguru import logger
+
+
+class ContentViewBuffer:
+    # Collects content views in memory and hands them to Celery in batches
+    def __init__(self, flush_interval: int, max_size: int) -> None:
+        self.flush_interval = flush_interval
+        self.max_size = max_size
+        self._views: dict = {}
+        self._lock = threading.Lock()
+        self._last_flush = time.monotonic()
+        self._timer_pid: Optional[int] = None
+
+    def start_timer(self) -> None:
+        # Flushes idle workers too; started per process, since forked workers
+        # don't inherit the parent's threads. At most one interval of views is
+        # lost if the process is killed
+        with self._lock:
+            if self._timer_pid == os.getpid():
+                return
+            self._timer_pid = os.getpid()
+        threading.Thread(
+            target=self.run_timer, name="content-view-flush", daemon=True
+        ).start()
+
+    def run_timer(self) -> None:
+        while True:
+            since_flush = time.monotonic() - self._last_flush
+            time.sleep(max(self.flush_interval - since_flush, 1))
+            if time.monotonic() - self._last_flush >= self.flush_interval:
+                self.flush()
+
+    def record(
+        self, content_object: Any, user_id: Optional[Any], viewer_ip: Optional[str]
+    ) -> None:
+        self.start_timer()
+        content_type = ContentType.objects.get_for_model(content_object)
+        key = (
+            content_type.pk,
+            str(content_object.pk),
+            str(user_id) if user_id else None,
+            viewer_ip,
+        )
+        with self._lock:
+            self._views[key] = timezone.now().isoformat()
+            flush_due = (
+                len(self._views) >= self.max_size
+                or time.monotonic() - self._last_flush >= self.flush_interval
+            )
+        if flush_due:
+            self.flush()
+
+    def flush(self) -> None:
+        with self._lock:
+            views, self._views = self._views, {}
+            self._last_flush = time.monotonic()
+        if not views:
+            return
+
+        from .tasks import flush_content_views
+
+        try:
+            flush_content_views.delay(
+                [[*key, last_viewed] for key, last_viewed in views.items()]
+            )
+        except Exception as e:
+            logger.error(f"Failed to queue {len(views)} content views: {str(e)}")
+
+
+content_view_buffer = ContentViewBuffer(
+    flush_interval=settings.CONTENT_VIEW_FLUSH_INTERVAL,
+    max_size=settings.CONTENT_VIEW_BUFFER_SIZE,
+)
+
+atexit.register(content_view_buffer.flush)
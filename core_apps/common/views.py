@@ -0,0 +1,28 @@
+import os
+from typing import Any
+
+from rest_framework import permissions
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from core_apps.common.cache import tiered_cache_stats
+from core_apps.common.db.postgresql.base import connection_metrics
+from core_apps.common.renderers import GenericJSONRenderer
+
+
+class ProcessMetricsAPIView(APIView):
+    # Counters are kept per process, so each response covers only the worker
+    # that served it; the pid tells workers apart
+    permission_classes = [permissions.IsAdminUser]
+    renderer_classes = [GenericJSONRenderer]
+    object_label = "metrics"
+
+    def get(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        return Response(
+            {
+                "pid": os.getpid(),
+                "database_connections": connection_metrics.snapshot(),
+                "tiered_caches": tiered_cache_stats(),
+            }
+        )
@@ -0,0 +1,48 @@
+import time
+from pathlib import Path
+
+from django.apps import apps
+from django.contrib.contenttypes.models import ContentType
+from django.db import DatabaseError, connections
+from django.template import engines
+from django.urls import get_resolver
+from loguru import logger
+
+
+def warm_url_resolvers() -> int:
+    resolver = get_resolver()
+    # Populating the resolver imports every view module and compiles the patterns
+    return len(resolver.reverse_dict)
+
+
+def warm_content_types() -> int:
+    try:
+        content_types = ContentType.objects.get_for_models(*apps.get_models())
+    except DatabaseError as e:
+        logger.warning(f"Skipped ContentType warm-up: {str(e)}")
+        return 0
+    finally:
+        connections.close_all()
+    return len(content_types)
+
+
+def warm_templates() -> int:
+    loaded = 0
+    for engine in engines.all():
+        for template_dir in getattr(engine, "dirs", []):
+            for path in Path(template_dir).rglob("*.html"):
+                engine.get_template(path.relative_to(template_dir).as_posix())
+                loaded += 1
+    return loaded
+
+
+def warm_up() -> None:
+    started = time.perf_counter()
+    url_names = warm_url_resolvers()
+    content_types = warm_content_types()
+    templates = warm_templates()
+    logger.info(
+        f"Warm-up finished in {(time.perf_counter() - started) * 1000:.0f}ms: "
+        f"{url_names} url names, {content_types} content types, "
+        f"{templates} templates"
+    )
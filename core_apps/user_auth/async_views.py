@@ -0,0 +1,54 @@
+import asyncio
+from typing import Any
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from core_apps.common.async_views import AsyncAPIView
+from .views import CustomTokenCreateView, OTPVerifyView, User
+
+
+class AsyncCustomTokenCreateView(AsyncAPIView, CustomTokenCreateView):
+    # Under ASGI every request gets its own sync thread, and each Argon2 check
+    # allocates ~100MB, so a burst of logins would otherwise run them all at once
+    password_checks = asyncio.Semaphore(settings.ASYNC_PASSWORD_CHECKS)
+
+    async def post(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        serializer = self.get_serializer(data=request.data)
+
+        try:
+            async with self.password_checks:
+                await sync_to_async(serializer.is_valid)(raise_exception=True)
+        except Exception:
+            return await sync_to_async(self.login_failed_response)(request)
+        return await sync_to_async(self._action)(serializer)
+
+
+class AsyncOTPVerifyView(AsyncAPIView, OTPVerifyView):
+    async def post(self, request: Request) -> Response:
+        otp = request.data.get("otp")
+
+        if not otp:
+            return Response(
+                {"error": "OTP is required"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        user = await User.objects.filter(
+            otp=otp, otp_expiry_time__gt=timezone.now()
+        ).afirst()
+
+        if not user:
+            return Response(
+                {"error": "Invalid or expired OTP"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        if await sync_to_async(lambda: user.is_locked_out)():
+            return self.locked_out_response()
+
+        await sync_to_async(user.verify_otp)(otp)
+        return await sync_to_async(self.login_response)(user)
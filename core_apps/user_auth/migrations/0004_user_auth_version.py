@@ -0,0 +1,22 @@
+# Generated by Django 5.2.1 on 2026-10-19 12:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("user_auth", "0003_customlogentry"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="user",
+            name="auth_version",
+            field=models.PositiveIntegerField(
+                default=0,
+                help_text="Bumped whenever the role or status carried in access tokens changes",
+                verbose_name="Auth Version",
+            ),
+        ),
+    ]
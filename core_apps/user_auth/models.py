@@ -1,15 +1,19 @@
 import uuid
-from django.db import models
+from django.db import models, transaction
 from django.conf import settings
 from django.contrib.auth.models import AbstractUser
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
+from core_apps.common.mixins import DirtyFieldsMixin
 from .emails import send_account_locked_email
 from .managers import UserManager
+from .utils import publish_auth_version
 
+AUTH_STATE_FIELDS = {"role", "account_status", "is_active", "email"}
 
-class User(AbstractUser):
+
+class User(DirtyFieldsMixin, AbstractUser):
     # Custom user model for the banking system
     class SecurityQuestions(models.TextChoices):
         MAIDEN_NAME = (
@@ -67,6 +71,13 @@ class User(AbstractUser):
     last_failed_login = models.DateTimeField(null=True, blank=True)
     otp = models.CharField(_("OTP"), max_length=6, blank=True)
     otp_expiry_time = models.DateTimeField(_("OTP Expiry Time"), null=True, blank=True)
+    auth_version = models.PositiveIntegerField(
+        _("Auth Version"),
+        default=0,
+        help_text=_(
+            "Bumped whenever the role or status carried in access tokens changes"
+        ),
+    )
     groups = models.ManyToManyField(
         "auth.Group",
         verbose_name=_("groups"),
@@ -97,6 +108,24 @@ class User(AbstractUser):
         "security_answer",
     ]
 
+    def save(self, *args, **kwargs) -> None:
+        auth_state_changed = not self._state.adding and bool(
+            self.get_dirty_fields() & AUTH_STATE_FIELDS
+        )
+        if auth_state_changed:
+            self.auth_version += 1
+            update_fields = kwargs.get("update_fields")
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "auth_version"}
+        super().save(*args, **kwargs)
+
+        if auth_state_changed:
+            user_id, auth_version = self.pk, self.auth_version
+            transaction.on_commit(
+                lambda: publish_auth_version(user_id, auth_version),
+                using=kwargs.get("using"),
+            )
+
     def set_otp(self, otp: str) -> None:
         self.otp = otp
         self.otp_expiry_time = timezone.now() + settings.OTP_EXPIRATION
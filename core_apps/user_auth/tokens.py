@@ -0,0 +1,37 @@
+from django.contrib.auth import get_user_model
+from rest_framework_simplejwt.serializers import TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken, Token
+
+User = get_user_model()
+
+AUTH_VERSION_CLAIM = "ver"
+
+
+def add_user_claims(token: Token, user) -> Token:
+    token["role"] = user.role
+    token["account_status"] = user.account_status
+    token["email"] = user.email
+    token[AUTH_VERSION_CLAIM] = user.auth_version
+    return token
+
+
+def has_user_claims(token: Token) -> bool:
+    return AUTH_VERSION_CLAIM in token.payload and "role" in token.payload
+
+
+class ClaimsRefreshToken(RefreshToken):
+    @classmethod
+    def for_user(cls, user) -> "ClaimsRefreshToken":
+        return add_user_claims(super().for_user(user), user)
+
+
+class ClaimsTokenRefreshSerializer(TokenRefreshSerializer):
+    def validate(self, attrs: dict) -> dict:
+        refresh = self.token_class(attrs["refresh"])
+        user = User.objects.filter(
+            **{api_settings.USER_ID_FIELD: refresh[api_settings.USER_ID_CLAIM]}
+        ).first()
+        if user is not None:
+            attrs["refresh"] = str(add_user_claims(refresh, user))
+        return super().validate(attrs)
@@ -1,5 +1,7 @@
+from django.conf import settings
 from django.urls import path
 
+from .async_views import AsyncCustomTokenCreateView, AsyncOTPVerifyView
 from .views import (
     CustomTokenCreateView,
     CustomTokenRefreshView,
@@ -7,9 +9,14 @@ from .views import (
     OTPVerifyView,
 )
 
+if settings.ASYNC_VIEWS:
+    LoginView, OTPView = AsyncCustomTokenCreateView, AsyncOTPVerifyView
+else:
+    LoginView, OTPView = CustomTokenCreateView, OTPVerifyView
+
 urlpatterns = [
-    path("login/", CustomTokenCreateView.as_view(), name="login"),
-    path("verify-otp/", OTPVerifyView.as_view(), name="verify_otp"),
+    path("login/", LoginView.as_view(), name="login"),
+    path("verify-otp/", OTPView.as_view(), name="verify_otp"),
     path("refresh/", CustomTokenRefreshView.as_view(), name="refresh"),
     path("logout/", LogoutAPIView.as_view(), name="logout"),
 ]
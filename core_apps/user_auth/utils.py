@@ -1,6 +1,58 @@
 import random
 import string
+from typing import Optional
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from loguru import logger
 
 
 def generate_otp(length=6) -> str:
     return "".join(random.choices(string.digits, k=length))
+
+
+def auth_version_cache_key(user_id) -> str:
+    return f"user_auth:auth_version:{user_id}"
+
+
+def publish_auth_version(user_id, version: int) -> None:
+    timeout = settings.SIMPLE_JWT["REFRESH_TOKEN_LIFETIME"].total_seconds()
+    cache.set(auth_version_cache_key(user_id), version, timeout=timeout)
+
+
+def get_published_auth_version(user_id) -> Optional[int]:
+    try:
+        return cache.get(auth_version_cache_key(user_id))
+    except Exception as e:
+        logger.warning(f"Failed to read auth version for user {user_id}: {str(e)}")
+        return None
+
+
+def get_auth_version(user_id) -> Optional[int]:
+    # A missing published version is unknown, not current, so it is read from the
+    # database. It is re-published only briefly, since a per-process cache never
+    # sees versions published by other workers. None means the user is gone
+    version = get_published_auth_version(user_id)
+    if version is not None:
+        return version
+
+    # Sliced rather than .first(), which would sort by the model's ordering
+    versions = list(
+        get_user_model()
+        .objects.filter(pk=user_id)
+        .values_list("auth_version", flat=True)[:1]
+    )
+    version = versions[0] if versions else None
+    if version is not None:
+        try:
+            cache.set(
+                auth_version_cache_key(user_id),
+                version,
+                timeout=settings.AUTH_TOKEN_CACHE_TTL,
+            )
+        except Exception as e:
+            logger.warning(
+                f"Failed to publish auth version for user {user_id}: {str(e)}"
+            )
+    return version
@@ -9,10 +9,10 @@ from rest_framework import permissions, status
 from rest_framework.response import Response
 from rest_framework.request import Request
 from rest_framework.views import APIView
-from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.views import TokenRefreshView
 
 from .emails import send_otp_email
+from .tokens import ClaimsRefreshToken
 from .utils import generate_otp
 
 User = get_user_model()
@@ -46,10 +46,6 @@ def set_auth_cookies(
 
 class CustomTokenCreateView(TokenCreateView):
     def _action(self, serializer):
-        # Add test log message
-        logger.debug("=== TEST LOG MESSAGE: Login process started ===")
-        logger.error("=== TEST ERROR LOG MESSAGE: This should appear in error.log ===")
-        
         user = serializer.user
         if user.is_locked_out:
             return Response(
@@ -81,32 +77,33 @@ class CustomTokenCreateView(TokenCreateView):
         try:
             serializer.is_valid(raise_exception=True)
         except Exception:
-            email = request.data.get("email")
-            user = User.objects.filter(email=email).first()
-            if user:
-                user.handle_failed_login_attempts()
-                failed_attempts = user.failed_login_attempts
-                logger.error(
-                    f"Failed login attempts: {failed_attempts}  for user: {email}"
+            return self.login_failed_response(request)
+        return self._action(serializer)
+
+    def login_failed_response(self, request: Request) -> Response:
+        email = request.data.get("email")
+        user = User.objects.filter(email=email).first()
+        if user:
+            user.handle_failed_login_attempts()
+            failed_attempts = user.failed_login_attempts
+            logger.error(f"Failed login attempts: {failed_attempts}  for user: {email}")
+            if failed_attempts >= settings.LOGIN_ATTEMPTS:
+                return Response(
+                    {
+                        "error": f"You have exceeded the maximum number of login attempts. "
+                        f"Your account has been locked for "
+                        f"{settings.LOCKOUT_DURATION.total_seconds() / 60} minutes. "
+                        f"An email has been sent to you with further instructions",
+                    },
+                    status=status.HTTP_403_FORBIDDEN,
                 )
-                if failed_attempts >= settings.LOGIN_ATTEMPTS:
-                    return Response(
-                        {
-                            "error": f"You have exceeded the maximum number of login attempts. "
-                            f"Your account has been locked for "
-                            f"{settings.LOCKOUT_DURATION.total_seconds() / 60} minutes. "
-                            f"An email has been sent to you with further instructions",
-                        },
-                        status=status.HTTP_403_FORBIDDEN,
-                    )
-            else:
-                logger.error(f"Failed login attempt for non-existent user: {email}")
+        else:
+            logger.error(f"Failed login attempt for non-existent user: {email}")
 
-            return Response(
-                {"error": "Your Login Credentials are not correct"},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-        return self._action(serializer)
+        return Response(
+            {"error": "Your Login Credentials are not correct"},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
 
 
 class CustomTokenRefreshView(TokenRefreshView):
@@ -165,18 +162,23 @@ class OTPVerifyView(APIView):
             )
 
         if user.is_locked_out:
-            return Response(
-                {
-                    "error": f"Account is locked due to multiple failed login attempts. "
-                    f"Please try again after "
-                    f"{settings.LOCKOUT_DURATION.total_seconds() / 60} minutes "
-                },
-                status=status.HTTP_403_FORBIDDEN,
-            )
+            return self.locked_out_response()
 
         user.verify_otp(otp)
+        return self.login_response(user)
+
+    def locked_out_response(self) -> Response:
+        return Response(
+            {
+                "error": f"Account is locked due to multiple failed login attempts. "
+                f"Please try again after "
+                f"{settings.LOCKOUT_DURATION.total_seconds() / 60} minutes "
+            },
+            status=status.HTTP_403_FORBIDDEN,
+        )
 
-        refresh = RefreshToken.for_user(user)
+    def login_response(self, user: User) -> Response:
+        refresh = ClaimsRefreshToken.for_user(user)
         access_token = str(refresh.access_token)
         refresh_token = str(refresh)
 
@@ -0,0 +1,19 @@
+from typing import Any
+
+from asgiref.sync import sync_to_async
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from core_apps.common.async_views import AsyncAPIView
+from .views import ProfileDetailAPIView
+
+
+class AsyncProfileDetailAPIView(AsyncAPIView, ProfileDetailAPIView):
+    async def get(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        return Response(await sync_to_async(self.get_profile_data)())
+
+    async def put(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        return await sync_to_async(self.update)(request, *args, **kwargs)
+
+    async def patch(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        return await sync_to_async(self.partial_update)(request, *args, **kwargs)
@@ -0,0 +1,4 @@
+from core_apps.common.cache import get_tiered_cache
+
+# Serialized ProfileSerializer payloads keyed by user id
+profile_cache = get_tiered_cache("profile")
@@ -0,0 +1,53 @@
+from io import BytesIO
+from pathlib import Path
+from typing import Tuple
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from PIL import Image, ImageOps
+
+from .uploads import staging_storage
+
+
+def load_normalized_image(staged_name: str) -> Image.Image:
+    max_dimension = settings.PHOTO_MAX_DIMENSION
+    with staging_storage.open(staged_name, "rb") as image_file:
+        image = Image.open(image_file)
+        # Let the JPEG decoder downscale while reading instead of decoding full size
+        image.draft("RGB", (max_dimension, max_dimension))
+        image.load()
+    image = ImageOps.exif_transpose(image)
+
+    if image.mode in ("RGBA", "LA", "P"):
+        image = image.convert("RGBA")
+        background = Image.new("RGB", image.size, (255, 255, 255))
+        background.paste(image, mask=image.getchannel("A"))
+        image = background
+    elif image.mode != "RGB":
+        image = image.convert("RGB")
+
+    image.thumbnail((max_dimension, max_dimension), Image.Resampling.LANCZOS)
+    return image
+
+
+def save_staged_jpeg(image: Image.Image, name: str) -> str:
+    buffer = BytesIO()
+    image.save(
+        buffer,
+        "JPEG",
+        quality=settings.PHOTO_JPEG_QUALITY,
+        optimize=True,
+        progressive=True,
+    )
+    return staging_storage.save(name, ContentFile(buffer.getvalue()))
+
+
+def normalize_staged_photo(staged_name: str) -> Tuple[str, str]:
+    image = load_normalized_image(staged_name)
+    stem = Path(staged_name).with_suffix("").as_posix()
+
+    normalized_name = save_staged_jpeg(image, f"{stem}_normalized.jpg")
+    thumbnail_size = (settings.PHOTO_THUMBNAIL_SIZE, settings.PHOTO_THUMBNAIL_SIZE)
+    thumbnail = ImageOps.fit(image, thumbnail_size, Image.Resampling.LANCZOS)
+    thumbnail_name = save_staged_jpeg(thumbnail, f"{stem}_thumbnail.jpg")
+    return normalized_name, thumbnail_name
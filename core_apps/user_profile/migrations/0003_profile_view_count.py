@@ -0,0 +1,45 @@
+# Generated by Django 5.2.1 on 2026-10-19 13:01
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_view_counts(apps, schema_editor):
+    ContentType = apps.get_model("contenttypes", "ContentType")
+    ContentView = apps.get_model("common", "ContentView")
+    Profile = apps.get_model("user_profile", "Profile")
+
+    content_type = ContentType.objects.filter(
+        app_label="user_profile", model="profile"
+    ).first()
+    if content_type is None:
+        return
+
+    view_counts = (
+        ContentView.objects.filter(content_type=content_type, object_id=OuterRef("pk"))
+        .values("object_id")
+        .annotate(total=Count("id"))
+        .values("total")
+    )
+    Profile.objects.update(view_count=Coalesce(Subquery(view_counts), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("common", "0001_initial"),
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("user_profile", "0002_profile_account_currency_profile_account_type"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="profile",
+            name="view_count",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="View Count"
+            ),
+        ),
+        migrations.RunPython(backfill_view_counts, migrations.RunPython.noop),
+    ]
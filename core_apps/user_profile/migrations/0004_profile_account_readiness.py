@@ -0,0 +1,94 @@
+# Generated by Django 5.2.1 on 2026-10-19 13:06
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Exists, OuterRef, Q
+
+REQUIRED_PROFILE_FIELDS = [
+    "title",
+    "gender",
+    "date_of_birth",
+    "country_of_birth",
+    "place_of_birth",
+    "marital_status",
+    "means_of_identification",
+    "id_issue_date",
+    "id_expiry_date",
+    "nationality",
+    "phone_number",
+    "address",
+    "city",
+    "country",
+    "employment_status",
+    "photo",
+    "id_photo",
+    "signature_photo",
+]
+
+
+def backfill_account_readiness(apps, schema_editor):
+    BankAccount = apps.get_model("accounts", "BankAccount")
+    NextOfKin = apps.get_model("user_profile", "NextOfKin")
+    Profile = apps.get_model("user_profile", "Profile")
+
+    Profile.objects.update(
+        has_next_of_kin=Exists(NextOfKin.objects.filter(profile_id=OuterRef("pk")))
+    )
+
+    candidates = Profile.objects.filter(
+        has_next_of_kin=True,
+        account_currency__isnull=False,
+        account_type__isnull=False,
+    ).exclude(Q(account_currency="") | Q(account_type=""))
+    for profile in candidates.iterator():
+        if not all(getattr(profile, field) for field in REQUIRED_PROFILE_FIELDS):
+            continue
+        has_account = BankAccount.objects.filter(
+            user_id=profile.user_id,
+            currency=profile.account_currency,
+            account_type=profile.account_type,
+        ).exists()
+        Profile.objects.filter(pk=profile.pk).update(
+            account_readiness="opened" if has_account else "ready"
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0002_unique_primary_bank_account"),
+        ("user_profile", "0003_profile_view_count"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="profile",
+            name="account_readiness",
+            field=models.CharField(
+                choices=[
+                    ("incomplete", "Incomplete"),
+                    ("ready", "Ready to Open"),
+                    ("opened", "Account Opened"),
+                ],
+                default="incomplete",
+                editable=False,
+                max_length=10,
+                verbose_name="Account Readiness",
+            ),
+        ),
+        migrations.AddField(
+            model_name="profile",
+            name="has_next_of_kin",
+            field=models.BooleanField(
+                default=False, editable=False, verbose_name="Has Next of Kin"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="profile",
+            index=models.Index(
+                fields=["account_readiness", "updated_at"], name="profile_readiness_idx"
+            ),
+        ),
+        migrations.RunPython(backfill_account_readiness, migrations.RunPython.noop),
+    ]
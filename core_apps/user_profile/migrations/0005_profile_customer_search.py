@@ -0,0 +1,84 @@
+# Generated by Django 5.2.1 on 2026-10-19 13:08
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.conf import settings
+from django.contrib.postgres.operations import TrigramExtension
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations, models
+from django.db.models import Value
+
+
+def backfill_search_index(apps, schema_editor):
+    BankAccount = apps.get_model("accounts", "BankAccount")
+    Profile = apps.get_model("user_profile", "Profile")
+
+    account_numbers = {}
+    for user_id, account_number in BankAccount.objects.values_list(
+        "user_id", "account_number"
+    ).iterator():
+        account_numbers.setdefault(user_id, []).append(account_number)
+
+    for profile in Profile.objects.select_related("user").iterator(chunk_size=1000):
+        user = profile.user
+        names = " ".join(
+            filter(None, [user.first_name, user.middle_name, user.last_name])
+        )
+        identifiers = [
+            user.email,
+            str(user.id_no),
+            *account_numbers.get(profile.user_id, []),
+        ]
+        if profile.phone_number:
+            identifiers += [
+                str(profile.phone_number),
+                str(profile.phone_number.national_number),
+            ]
+        identifiers = " ".join(filter(None, identifiers))
+        Profile.objects.filter(pk=profile.pk).update(
+            search_document=f"{names} {identifiers}".lower(),
+            search_vector=SearchVector(Value(names), config="simple", weight="A")
+            + SearchVector(Value(identifiers), config="simple", weight="B"),
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0002_unique_primary_bank_account"),
+        ("user_profile", "0004_profile_account_readiness"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddField(
+            model_name="profile",
+            name="search_document",
+            field=models.TextField(
+                blank=True, default="", editable=False, verbose_name="Search Document"
+            ),
+        ),
+        migrations.AddField(
+            model_name="profile",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True, verbose_name="Search Vector"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="profile",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="profile_search_vector_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="profile",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_document"],
+                name="profile_search_trgm_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ),
+        migrations.RunPython(backfill_search_index, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.1 on 2026-10-19 13:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("user_profile", "0005_profile_customer_search"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="profile",
+            name="id_photo_thumbnail_url",
+            field=models.URLField(
+                blank=True, null=True, verbose_name="ID Photo Thumbnail URL"
+            ),
+        ),
+        migrations.AddField(
+            model_name="profile",
+            name="photo_thumbnail_url",
+            field=models.URLField(
+                blank=True, null=True, verbose_name="Photo Thumbnail URL"
+            ),
+        ),
+        migrations.AddField(
+            model_name="profile",
+            name="signature_photo_thumbnail_url",
+            field=models.URLField(
+                blank=True, null=True, verbose_name="Signature Photo Thumbnail URL"
+            ),
+        ),
+    ]
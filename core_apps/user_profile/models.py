@@ -3,20 +3,63 @@ from typing import Any
 from cloudinary.models import CloudinaryField
 from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.core.exceptions import ValidationError
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 from django_countries.fields import CountryField
 from phonenumber_field.modelfields import PhoneNumberField
 
+from core_apps.common.mixins import DirtyFieldsMixin
 from core_apps.common.models import TimeStampedModel
 from core_apps.accounts.models import BankAccount
 
 
 User = get_user_model()
 
+REQUIRED_PROFILE_FIELDS = {
+    "title",
+    "gender",
+    "date_of_birth",
+    "country_of_birth",
+    "place_of_birth",
+    "marital_status",
+    "means_of_identification",
+    "id_issue_date",
+    "id_expiry_date",
+    "nationality",
+    "phone_number",
+    "address",
+    "city",
+    "country",
+    "employment_status",
+    "photo",
+    "id_photo",
+    "signature_photo",
+}
+READINESS_FIELDS = REQUIRED_PROFILE_FIELDS | {
+    "has_next_of_kin",
+    "account_currency",
+    "account_type",
+}
+
+
+class Profile(DirtyFieldsMixin, TimeStampedModel):
+    class AccountReadiness(models.TextChoices):
+        INCOMPLETE = (
+            "incomplete",
+            _("Incomplete"),
+        )
+        READY = (
+            "ready",
+            _("Ready to Open"),
+        )
+        OPENED = (
+            "opened",
+            _("Account Opened"),
+        )
 
-class Profile(TimeStampedModel):
     class Salutation(models.TextChoices):
         MR = (
             "mr",
@@ -211,6 +254,9 @@ class Profile(TimeStampedModel):
         null=True,
     )
     photo_url = models.URLField(_("Photo URL"), blank=True, null=True)
+    photo_thumbnail_url = models.URLField(
+        _("Photo Thumbnail URL"), blank=True, null=True
+    )
 
     id_photo = CloudinaryField(
         _("ID Photo"),
@@ -218,6 +264,9 @@ class Profile(TimeStampedModel):
         null=True,
     )
     id_photo_url = models.URLField(_("ID Photo URL"), blank=True, null=True)
+    id_photo_thumbnail_url = models.URLField(
+        _("ID Photo Thumbnail URL"), blank=True, null=True
+    )
 
     signature_photo = CloudinaryField(
         _("Signature Photo"),
@@ -227,6 +276,38 @@ class Profile(TimeStampedModel):
     signature_photo_url = models.URLField(
         _("Signature Photo URL"), blank=True, null=True
     )
+    signature_photo_thumbnail_url = models.URLField(
+        _("Signature Photo Thumbnail URL"), blank=True, null=True
+    )
+    view_count = models.PositiveIntegerField(_("View Count"), default=0, editable=False)
+    has_next_of_kin = models.BooleanField(
+        _("Has Next of Kin"), default=False, editable=False
+    )
+    account_readiness = models.CharField(
+        _("Account Readiness"),
+        max_length=10,
+        choices=AccountReadiness.choices,
+        default=AccountReadiness.INCOMPLETE,
+        editable=False,
+    )
+    search_document = models.TextField(
+        _("Search Document"), blank=True, default="", editable=False
+    )
+    search_vector = SearchVectorField(_("Search Vector"), null=True, editable=False)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["account_readiness", "updated_at"],
+                name="profile_readiness_idx",
+            ),
+            GinIndex(fields=["search_vector"], name="profile_search_vector_idx"),
+            GinIndex(
+                fields=["search_document"],
+                opclasses=["gin_trgm_ops"],
+                name="profile_search_trgm_idx",
+            ),
+        ]
 
     def clean(self) -> None:
         super().clean()
@@ -235,32 +316,40 @@ class Profile(TimeStampedModel):
                 raise ValidationError(_("ID expiry date must come after issue date."))
 
     def save(self, *args: Any, **kwargs: Any) -> None:
-        self.full_clean()
+        dirty_fields = self.get_dirty_fields()
+        if dirty_fields:
+            self.full_clean(
+                exclude=[
+                    field.name
+                    for field in self._meta.fields
+                    if field.name not in dirty_fields
+                ]
+            )
+        if dirty_fields & READINESS_FIELDS:
+            self.refresh_account_readiness()
+            update_fields = kwargs.get("update_fields")
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "account_readiness"}
         super().save(*args, **kwargs)
 
-    def is_complete_with_next_of_kin(self):
-        required_fields = [
-            self.title,
-            self.gender,
-            self.date_of_birth,
-            self.country_of_birth,
-            self.place_of_birth,
-            self.marital_status,
-            self.means_of_identification,
-            self.id_issue_date,
-            self.id_expiry_date,
-            self.nationality,
-            self.phone_number,
-            self.address,
-            self.city,
-            self.country,
-            self.employment_status,
-            self.photo,
-            self.id_photo,
-            self.signature_photo,
-        ]
+    def refresh_account_readiness(self) -> None:
+        if not self.is_complete_with_next_of_kin():
+            self.account_readiness = self.AccountReadiness.INCOMPLETE
+        elif BankAccount.objects.filter(
+            user_id=self.user_id,
+            currency=self.account_currency,
+            account_type=self.account_type,
+        ).exists():
+            self.account_readiness = self.AccountReadiness.OPENED
+        else:
+            self.account_readiness = self.AccountReadiness.READY
 
-        return all(required_fields) and self.next_of_kin.exists()
+    def is_complete_with_next_of_kin(self) -> bool:
+        return (
+            self.has_next_of_kin
+            and bool(self.account_currency and self.account_type)
+            and all(getattr(self, field) for field in REQUIRED_PROFILE_FIELDS)
+        )
 
     def __str__(self) -> str:
         return f"{self.title} {self.user.first_name}'s Profile"
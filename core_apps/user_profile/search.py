@@ -0,0 +1,103 @@
+from typing import Any, Optional
+
+from django.conf import settings
+from django.contrib.postgres.expressions import ArraySubquery
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+    TrigramWordSimilarity,
+)
+from django.db.models import F, OuterRef, Q, QuerySet, Value
+from django.db.models.functions import Greatest
+from rest_framework import filters, serializers
+from rest_framework.request import Request
+from rest_framework.views import APIView
+
+from core_apps.accounts.models import BankAccount
+from .models import Profile
+
+SEARCH_CONFIG = "simple"
+
+SEARCH_USER_FIELDS = {"first_name", "middle_name", "last_name", "email", "id_no"}
+
+SEARCH_PROFILE_FIELDS = {"phone_number"}
+
+
+def update_customer_search_index(user_id: Any) -> None:
+    profile = Profile.objects.select_related("user").filter(user_id=user_id).first()
+    if profile is None:
+        return
+
+    user = profile.user
+    account_numbers = BankAccount.objects.filter(user_id=user_id).values_list(
+        "account_number", flat=True
+    )
+    names = " ".join(filter(None, [user.first_name, user.middle_name, user.last_name]))
+    identifiers = [user.email, str(user.id_no), *account_numbers]
+    if profile.phone_number:
+        identifiers += [
+            str(profile.phone_number),
+            str(profile.phone_number.national_number),
+        ]
+    identifiers = " ".join(filter(None, identifiers))
+
+    Profile.objects.filter(pk=profile.pk).update(
+        search_document=f"{names} {identifiers}".lower(),
+        search_vector=SearchVector(Value(names), config=SEARCH_CONFIG, weight="A")
+        + SearchVector(Value(identifiers), config=SEARCH_CONFIG, weight="B"),
+    )
+
+
+def search_customers(queryset: QuerySet, term: str) -> QuerySet:
+    term = term.strip().lower()
+    query = SearchQuery(term, config=SEARCH_CONFIG, search_type="websearch")
+    return (
+        queryset.filter(
+            Q(search_vector=query)
+            | Q(search_document__contains=term)
+            | Q(search_document__trigram_word_similar=term)
+        )
+        .annotate(
+            search_rank=Greatest(
+                SearchRank(F("search_vector"), query),
+                TrigramWordSimilarity(term, "search_document"),
+            )
+        )
+        .order_by("-search_rank", "pk")
+    )
+
+
+def with_account_numbers(queryset: QuerySet) -> QuerySet:
+    return queryset.annotate(
+        account_numbers=ArraySubquery(
+            BankAccount.objects.filter(user_id=OuterRef("user_id"))
+            .order_by("-is_primary", "created_at")
+            .values("account_number")
+        )
+    )
+
+
+class CustomerSearchFilter(filters.BaseFilterBackend):
+    search_param = "search"
+
+    def get_search_term(self, request: Request) -> Optional[str]:
+        term = request.query_params.get(self.search_param, "").strip()
+        if not term:
+            return None
+        if len(term) < settings.CUSTOMER_SEARCH_MIN_LENGTH:
+            raise serializers.ValidationError(
+                {
+                    self.search_param: f"Search term must be at least "
+                    f"{settings.CUSTOMER_SEARCH_MIN_LENGTH} characters long."
+                }
+            )
+        return term
+
+    def filter_queryset(
+        self, request: Request, queryset: QuerySet, view: APIView
+    ) -> QuerySet:
+        term = self.get_search_term(request)
+        if term is None:
+            return queryset
+        return search_customers(queryset, term)
@@ -1,30 +1,20 @@
-import base64
 from typing import Any, Dict
 
-from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.contrib.contenttypes.models import ContentType
-from django.core.files.base import ContentFile
-from django.core.files.storage import default_storage
 from django_countries.serializer_fields import CountryField
 from phonenumber_field.serializerfields import PhoneNumberField
 from rest_framework import serializers
 
-from core_apps.common.models import ContentView
+from core_apps.common.read_serializers import ValuesSerializer, full_name
 from .models import Profile, NextOfKin
 from .tasks import upload_photos_to_cloudinary
+from .uploads import stage_photo
 from core_apps.accounts.models import BankAccount
 
 User = get_user_model()
 
 
-class UUIDField(serializers.Field):
-    def to_representation(self, value: str) -> str:
-        return str(value)
-
-
 class NextOfKinSerializer(serializers.ModelSerializer):
-    id = UUIDField(read_only=True)
     country = CountryField(name_only=True)
     phone_number = PhoneNumberField()
 
@@ -40,7 +30,6 @@ class NextOfKinSerializer(serializers.ModelSerializer):
 
 
 class ProfileSerializer(serializers.ModelSerializer):
-    id = UUIDField(read_only=True)
     first_name = serializers.CharField(source="user.first_name")
     middle_name = serializers.CharField(
         source="user.middle_name", required=False, allow_blank=True
@@ -62,7 +51,11 @@ class ProfileSerializer(serializers.ModelSerializer):
     photo_url = serializers.URLField(read_only=True)
     id_photo_url = serializers.URLField(read_only=True)
     signature_photo_url = serializers.URLField(read_only=True)
-    view_count = serializers.SerializerMethodField()
+    photo_thumbnail_url = serializers.URLField(read_only=True)
+    id_photo_thumbnail_url = serializers.URLField(read_only=True)
+    signature_photo_thumbnail_url = serializers.URLField(read_only=True)
+    view_count = serializers.IntegerField(read_only=True)
+    account_readiness = serializers.CharField(read_only=True)
     account_currency = serializers.ChoiceField(
         choices=BankAccount.AccountCurrency.choices
     )
@@ -107,11 +100,15 @@ class ProfileSerializer(serializers.ModelSerializer):
             "updated_at",
             "photo",
             "photo_url",
+            "photo_thumbnail_url",
             "id_photo",
             "id_photo_url",
+            "id_photo_thumbnail_url",
             "signature_photo",
             "signature_photo_url",
+            "signature_photo_thumbnail_url",
             "view_count",
+            "account_readiness",
             "account_currency",
             "account_type",
         ]
@@ -122,6 +119,8 @@ class ProfileSerializer(serializers.ModelSerializer):
             "email",
             "created_at",
             "updated_at",
+            "view_count",
+            "account_readiness",
         ]
 
     def validate(self, attrs: Dict[str, Any]) -> Dict[str, Any]:
@@ -158,16 +157,7 @@ class ProfileSerializer(serializers.ModelSerializer):
         for field in ["photo", "id_photo", "signature_photo"]:
             if field in validated_data:
                 photo = validated_data.pop(field)
-                if photo.size > settings.MAX_UPLOAD_SIZE:
-                    temp_file = default_storage.save(
-                        f"temp_{instance.id}_{field}.jpg", ContentFile(photo.read())
-                    )
-                    temp_file_path = default_storage.path(temp_file)
-                    photos_to_upload[field] = {"type": "file", "path": temp_file_path}
-                else:
-                    image_content = photo.read()
-                    encoded_image = base64.b64encode(image_content).decode("utf-8")
-                    photos_to_upload[field] = {"type": "base64", "data": encoded_image}
+                photos_to_upload[field] = stage_photo(instance.id, field, photo)
 
         for attr, value in validated_data.items():
             setattr(instance, attr, value)
@@ -179,12 +169,6 @@ class ProfileSerializer(serializers.ModelSerializer):
 
         return instance
 
-    def get_view_count(self, obj: Profile) -> int:
-        content_type = ContentType.objects.get_for_model(obj)
-        return ContentView.objects.filter(
-            content_type=content_type, object_id=obj.id
-        ).count()
-
 
 class ProfileListSerializer(serializers.ModelSerializer):
     full_name = serializers.ReadOnlyField(source="user.full_name")
@@ -206,7 +190,60 @@ class ProfileListSerializer(serializers.ModelSerializer):
         ]
 
     def get_photo(self, obj: Profile) -> str | None:
+        if obj.photo_thumbnail_url:
+            return obj.photo_thumbnail_url
         try:
             return obj.photo.url
         except AttributeError:
             return None
+
+
+class ProfileListValuesSerializer(ValuesSerializer):
+    serializer_class = ProfileListSerializer
+    computed_fields = {
+        "full_name": (("user__first_name", "user__last_name"), full_name),
+        "photo": (
+            ("photo_thumbnail_url", "photo"),
+            lambda thumbnail_url, photo: thumbnail_url or getattr(photo, "url", None),
+        ),
+    }
+
+
+class ReadyProfileSerializer(ProfileListSerializer):
+    id_no = serializers.ReadOnlyField(source="user.id_no")
+
+    class Meta(ProfileListSerializer.Meta):
+        fields = [
+            "id",
+            "id_no",
+            *ProfileListSerializer.Meta.fields,
+            "account_currency",
+            "account_type",
+            "updated_at",
+        ]
+
+
+class CustomerSearchSerializer(serializers.ModelSerializer):
+    full_name = serializers.ReadOnlyField(source="user.full_name")
+    email = serializers.EmailField(source="user.email", read_only=True)
+    id_no = serializers.ReadOnlyField(source="user.id_no")
+    phone_number = PhoneNumberField(read_only=True)
+    photo_url = serializers.SerializerMethodField()
+    account_numbers = serializers.ListField(
+        child=serializers.CharField(), read_only=True
+    )
+
+    class Meta:
+        model = Profile
+        fields = [
+            "id",
+            "full_name",
+            "email",
+            "id_no",
+            "phone_number",
+            "photo_url",
+            "account_numbers",
+        ]
+
+    def get_photo_url(self, obj: Profile) -> str | None:
+        return obj.photo_thumbnail_url or obj.photo_url
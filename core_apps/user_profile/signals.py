@@ -1,12 +1,20 @@
 from typing import Any, Type
 from django.db.models.base import Model
 
-from django.db.models.signals import post_save
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from loguru import logger
 
 from config.settings.base import AUTH_USER_MODEL
-from core_apps.user_profile.models import Profile
+from core_apps.accounts.models import BankAccount
+from core_apps.user_profile.caches import profile_cache
+from core_apps.user_profile.models import NextOfKin, Profile
+from core_apps.user_profile.search import (
+    SEARCH_PROFILE_FIELDS,
+    SEARCH_USER_FIELDS,
+    update_customer_search_index,
+)
 
 
 @receiver(post_save, sender=AUTH_USER_MODEL)
@@ -20,5 +28,116 @@ def create_user_profile(
 
 
 @receiver(post_save, sender=AUTH_USER_MODEL)
-def save_user_profile(sender: Type[Model], instance: Model, **kwargs: Any) -> None:
-    instance.profile.save()
+def save_user_profile(
+    sender: Type[Model], instance: Model, created: bool, **kwargs: Any
+) -> None:
+    if created or not sender.profile.is_cached(instance):
+        return
+    if instance.profile.get_dirty_fields():
+        instance.profile.save()
+
+
+@receiver(post_save, sender=NextOfKin)
+def mark_profile_has_next_of_kin(
+    sender: Type[Model], instance: NextOfKin, created: bool, **kwargs: Any
+) -> None:
+    if not created:
+        return
+    profile = instance.profile
+    if not profile.has_next_of_kin:
+        profile.has_next_of_kin = True
+        profile.save()
+
+
+@receiver(post_delete, sender=NextOfKin)
+def unmark_profile_has_next_of_kin(
+    sender: Type[Model], instance: NextOfKin, **kwargs: Any
+) -> None:
+    if NextOfKin.objects.filter(profile_id=instance.profile_id).exists():
+        return
+    profile = Profile.objects.filter(
+        pk=instance.profile_id, has_next_of_kin=True
+    ).first()
+    if profile is not None:
+        profile.has_next_of_kin = False
+        profile.save()
+
+
+@receiver(post_save, sender=BankAccount)
+def mark_profile_account_opened(
+    sender: Type[Model], instance: BankAccount, created: bool, **kwargs: Any
+) -> None:
+    if not created:
+        return
+    Profile.objects.filter(
+        user_id=instance.user_id,
+        account_currency=instance.currency,
+        account_type=instance.account_type,
+        account_readiness=Profile.AccountReadiness.READY,
+    ).update(account_readiness=Profile.AccountReadiness.OPENED)
+    schedule_profile_cache_invalidation(instance.user_id)
+
+
+def schedule_search_index_update(user_id: Any) -> None:
+    transaction.on_commit(lambda: update_customer_search_index(user_id))
+
+
+@receiver(post_save, sender=AUTH_USER_MODEL)
+def refresh_user_search_index(
+    sender: Type[Model], instance: Model, created: bool, **kwargs: Any
+) -> None:
+    update_fields = kwargs.get("update_fields")
+    if created:
+        return
+    if update_fields is None or SEARCH_USER_FIELDS & set(update_fields):
+        schedule_search_index_update(instance.pk)
+
+
+@receiver(post_save, sender=Profile)
+def refresh_profile_search_index(
+    sender: Type[Model], instance: Profile, created: bool, **kwargs: Any
+) -> None:
+    update_fields = kwargs.get("update_fields")
+    if created or update_fields is None or SEARCH_PROFILE_FIELDS & set(update_fields):
+        schedule_search_index_update(instance.user_id)
+
+
+@receiver(post_save, sender=BankAccount)
+def refresh_account_search_index(
+    sender: Type[Model], instance: BankAccount, created: bool, **kwargs: Any
+) -> None:
+    if created:
+        schedule_search_index_update(instance.user_id)
+
+
+def schedule_profile_cache_invalidation(user_id: Any) -> None:
+    transaction.on_commit(lambda: profile_cache.invalidate(user_id))
+
+
+@receiver(post_save, sender=AUTH_USER_MODEL)
+def invalidate_user_profile_cache(
+    sender: Type[Model], instance: Model, created: bool, **kwargs: Any
+) -> None:
+    if not created:
+        schedule_profile_cache_invalidation(instance.pk)
+
+
+@receiver(post_save, sender=Profile)
+def invalidate_profile_cache(
+    sender: Type[Model], instance: Profile, **kwargs: Any
+) -> None:
+    schedule_profile_cache_invalidation(instance.user_id)
+
+
+@receiver(post_save, sender=NextOfKin)
+@receiver(post_delete, sender=NextOfKin)
+def invalidate_next_of_kin_profile_cache(
+    sender: Type[Model], instance: NextOfKin, **kwargs: Any
+) -> None:
+    user_id = (
+        Profile.objects.filter(pk=instance.profile_id)
+        .values_list("user_id", flat=True)
+        .first()
+    )
+    if user_id is not None:
+        schedule_profile_cache_invalidation(user_id)
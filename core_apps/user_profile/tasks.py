@@ -1,38 +1,70 @@
-import base64
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict
 from uuid import UUID
 
-import cloudinary.uploader
 from celery import shared_task
 from django.apps import apps
-from django.core.files.storage import default_storage
+from django.conf import settings
 from loguru import logger
 
+from .uploads import (
+    PhotoUploader,
+    discard_staged_photo,
+    get_photo_uploader,
+    upload_staged_photo,
+)
+
+
+def publish_staged_photo(uploader: PhotoUploader, staged_name: str) -> Dict[str, str]:
+    from .images import normalize_staged_photo
+
+    normalized_name, thumbnail_name = normalize_staged_photo(staged_name)
+    try:
+        response = upload_staged_photo(uploader, normalized_name)
+        thumbnail = upload_staged_photo(uploader, thumbnail_name)
+        response["thumbnail_url"] = thumbnail["url"]
+        return response
+    finally:
+        discard_staged_photo(normalized_name)
+        discard_staged_photo(thumbnail_name)
+
 
 @shared_task(name="upload_photos_to_cloudinary")
-def upload_photos_to_cloudinary(profile_id: UUID, photos: dict) -> None:
+def upload_photos_to_cloudinary(profile_id: UUID, photos: Dict[str, str]) -> None:
     try:
         profile_model = apps.get_model("user_profile", "Profile")
-        profile = profile_model.objects.get(id=profile_id)
-
-        for field_name, photo_data in photos.items():
-            if photo_data["type"] == "base64":
-                image_content = base64.b64decode(photo_data["data"])
-                response = cloudinary.uploader.upload(image_content)
-            else:
-                with open(photo_data["data"], "rb") as image_file:
-                    response = cloudinary.uploader.upload(image_file)
-                default_storage.delete(photo_data["path"])
+        profile = profile_model.objects.select_related("user").get(id=profile_id)
+        uploader = get_photo_uploader()
+
+        uploaded = {}
+        max_workers = min(settings.PHOTO_UPLOAD_WORKERS, len(photos))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(publish_staged_photo, uploader, staged_name): field_name
+                for field_name, staged_name in photos.items()
+            }
+            for future in as_completed(futures):
+                field_name = futures[future]
+                try:
+                    uploaded[field_name] = future.result()
+                except Exception as e:
+                    logger.error(
+                        f"Failed to upload {field_name} for profile {profile_id}: {str(e)}"
+                    )
+
+        for field_name, response in uploaded.items():
             setattr(profile, field_name, response["public_id"])
             setattr(profile, f"{field_name}_url", response["url"])
-        profile.save()
-
-        logger.info(f"Photos for  {profile.user.email}'s uploaded successfully")
+            setattr(profile, f"{field_name}_thumbnail_url", response["thumbnail_url"])
+        if uploaded:
+            profile.save()
+            logger.info(
+                f"Photos {sorted(uploaded)} for {profile.user.email} uploaded successfully"
+            )
 
     except Exception as e:
         logger.error(f"Failed to upload photos for profile {profile_id}: {str(e)} ")
 
-        for photo_data in photos.values():
-            if photo_data["type"] == "file" and default_storage.exists(
-                photo_data["path"]
-            ):
-                default_storage.delete(photo_data["path"])
+    finally:
+        for staged_name in photos.values():
+            discard_staged_photo(staged_name)
@@ -0,0 +1,74 @@
+from datetime import date
+
+from django.core.cache import caches
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from core_apps.user_auth.models import User
+from core_apps.user_auth.tokens import ClaimsRefreshToken
+from core_apps.user_profile.models import NextOfKin
+
+LOCMEM_CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+}
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class NextOfKinDetailTests(APITestCase):
+    def setUp(self) -> None:
+        caches["default"].clear()
+        self.user = User.objects.create_user(
+            email="customer@example.com",
+            password="pass12345!",
+            first_name="Test",
+            last_name="User",
+            id_no=1,
+            security_question="maiden_name",
+            security_answer="answer",
+        )
+        self.next_of_kin = NextOfKin.objects.create(
+            profile=self.user.profile,
+            title=NextOfKin.Salutation.MRS,
+            first_name="Jane",
+            last_name="User",
+            date_of_birth=date(1970, 1, 1),
+            gender=NextOfKin.Gender.FEMALE,
+            relationship="Mother",
+            email_address="jane@example.com",
+            phone_number="+254712345678",
+            address="1 Main Street",
+            city="Nairobi",
+            country="KE",
+        )
+        token = ClaimsRefreshToken.for_user(self.user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+    def test_retrieve(self) -> None:
+        response = self.client.get(
+            reverse("next-of-kin-detail", kwargs={"pk": self.next_of_kin.pk})
+        )
+
+        self.assertEqual(response.status_code, 200, response.content)
+        data = response.json()["next_of_kin"]
+        self.assertEqual(data["id"], str(self.next_of_kin.pk))
+        self.assertEqual(data["first_name"], "Jane")
+
+    def test_retrieve_other_users_next_of_kin(self) -> None:
+        other = User.objects.create_user(
+            email="other@example.com",
+            password="pass12345!",
+            first_name="Other",
+            last_name="User",
+            id_no=2,
+            security_question="maiden_name",
+            security_answer="answer",
+        )
+        token = ClaimsRefreshToken.for_user(other).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+        response = self.client.get(
+            reverse("next-of-kin-detail", kwargs={"pk": self.next_of_kin.pk})
+        )
+
+        self.assertEqual(response.status_code, 404)
@@ -0,0 +1,76 @@
+import cloudinary
+from django.test import TestCase
+
+from core_apps.user_auth.models import User
+from core_apps.user_profile.models import Profile
+from core_apps.user_profile.serializers import (
+    ProfileListSerializer,
+    ProfileListValuesSerializer,
+)
+
+
+class ProfileListValuesSerializerTests(TestCase):
+    # The profile list renders .values() rows; they must match the model
+    # serializer for every combination of photo and thumbnail
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cases = [
+            # first name, last name, thumbnail, photo, country of birth, phone
+            ("jane", "doe", "https://cdn.example.com/t/1.jpg", "photos/1", "KE", ""),
+            ("JOHN", "o'neil", None, "photos/2", "GB", "+254712345678"),
+            ("émile", "zola", "", None, "CI", "+447911123456"),
+            ("ann", "lee", None, None, "US", ""),
+        ]
+        for index, (first, last, thumbnail, photo, country, phone) in enumerate(
+            cases, start=1
+        ):
+            user = User.objects.create_user(
+                email=f"customer{index}@example.com",
+                password="pass12345!",
+                first_name=first,
+                last_name=last,
+                id_no=index,
+                security_question="maiden_name",
+                security_answer="answer",
+            )
+            Profile.objects.filter(user=user).update(
+                photo_thumbnail_url=thumbnail,
+                photo=photo,
+                country_of_birth=country,
+                nationality="Kenyan" if country == "KE" else "Unknown",
+                phone_number=phone,
+                gender=Profile.Gender.FEMALE if index % 2 else Profile.Gender.MALE,
+            )
+
+    def setUp(self) -> None:
+        cloud_name = cloudinary.config().cloud_name
+        cloudinary.config(cloud_name="demo")
+        self.addCleanup(cloudinary.config, cloud_name=cloud_name)
+
+    def test_matches_model_serializer(self) -> None:
+        queryset = Profile.objects.order_by("user__id_no")
+        expected = ProfileListSerializer(
+            queryset.select_related("user"), many=True
+        ).data
+        actual = ProfileListValuesSerializer(
+            ProfileListValuesSerializer.get_values_queryset(queryset)
+        ).data
+
+        self.assertEqual(len(actual), 4)
+        self.assertEqual(
+            [row["photo"] for row in actual],
+            [
+                "https://cdn.example.com/t/1.jpg",
+                expected[1]["photo"],
+                None,
+                None,
+            ],
+        )
+        self.assertIn("photos/2", actual[1]["photo"])
+        self.assertEqual(
+            [row["country_of_birth"] for row in actual], ["KE", "GB", "CI", "US"]
+        )
+        for expected_row, actual_row in zip(expected, actual):
+            self.assertEqual(list(actual_row), list(expected_row))
+            self.assertEqual(actual_row, dict(expected_row))
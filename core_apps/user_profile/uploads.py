@@ -0,0 +1,74 @@
+import time
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, BinaryIO, Dict
+from urllib.parse import urljoin
+
+from django.conf import settings
+from django.core.files.storage import FileSystemStorage
+from django.core.files.uploadedfile import UploadedFile
+from django.utils.module_loading import import_string
+from loguru import logger
+
+staging_storage = FileSystemStorage(location=settings.PHOTO_STAGING_ROOT)
+
+
+class PhotoUploader(ABC):
+    @abstractmethod
+    def upload(self, image_file: BinaryIO, **options: Any) -> Dict[str, str]:
+        pass
+
+
+class CloudinaryUploader(PhotoUploader):
+    def upload(self, image_file: BinaryIO, **options: Any) -> Dict[str, str]:
+        import cloudinary.uploader
+
+        response = cloudinary.uploader.upload(image_file, **options)
+        return {"public_id": response["public_id"], "url": response["url"]}
+
+
+class LocalUploader(PhotoUploader):
+    # Stand-in for Cloudinary in tests and offline development
+    storage = FileSystemStorage()
+
+    def upload(self, image_file: BinaryIO, **options: Any) -> Dict[str, str]:
+        name = self.storage.save(f"uploads/{Path(image_file.name).name}", image_file)
+        url = urljoin(f"http://{settings.DOMAIN}", self.storage.url(name))
+        return {"public_id": name, "url": url}
+
+
+@lru_cache
+def load_photo_uploader(uploader_path: str) -> PhotoUploader:
+    return import_string(uploader_path)()
+
+
+def get_photo_uploader() -> PhotoUploader:
+    return load_photo_uploader(settings.PHOTO_UPLOADER)
+
+
+def stage_photo(profile_id: Any, field_name: str, photo: UploadedFile) -> str:
+    suffix = Path(photo.name).suffix.lower()
+    return staging_storage.save(f"{profile_id}/{field_name}{suffix}", photo)
+
+
+def upload_staged_photo(uploader: PhotoUploader, staged_name: str) -> Dict[str, str]:
+    max_retries = settings.PHOTO_UPLOAD_MAX_RETRIES
+    for attempt in range(max_retries + 1):
+        try:
+            with staging_storage.open(staged_name, "rb") as image_file:
+                return uploader.upload(image_file)
+        except Exception as e:
+            if attempt == max_retries:
+                raise
+            delay = settings.PHOTO_UPLOAD_RETRY_BACKOFF * 2**attempt
+            logger.warning(
+                f"Upload of {staged_name} failed (attempt {attempt + 1}): {e}. "
+                f"Retrying in {delay}s"
+            )
+            time.sleep(delay)
+
+
+def discard_staged_photo(staged_name: str) -> None:
+    if staging_storage.exists(staged_name):
+        staging_storage.delete(staged_name)
@@ -1,15 +1,25 @@
+from django.conf import settings
 from django.urls import path
 
+from .async_views import AsyncProfileDetailAPIView
 from .views import (
+    CustomerSearchAPIView,
     NextOfKinAPIView,
     NextOfKinDetailAPIView,
     ProfileDetailAPIView,
     ProfileListAPIView,
+    ReadyProfileListAPIView,
+)
+
+ProfileDetailView = (
+    AsyncProfileDetailAPIView if settings.ASYNC_VIEWS else ProfileDetailAPIView
 )
 
 urlpatterns = [
     path("all/", ProfileListAPIView.as_view(), name="all_profiles"),
-    path("my-profile/", ProfileDetailAPIView.as_view(), name="profile_detail"),
+    path("ready-to-open/", ReadyProfileListAPIView.as_view(), name="ready_profiles"),
+    path("search/", CustomerSearchAPIView.as_view(), name="customer_search"),
+    path("my-profile/", ProfileDetailView.as_view(), name="profile_detail"),
     path(
         "my-profile/next-of-kin/", NextOfKinAPIView.as_view(), name="next-of-kin-list"
     ),
@@ -1,25 +1,33 @@
 from typing import Any, List
 
-from django.contrib.contenttypes.models import ContentType
 from django.db import transaction
 from django.http import Http404
 from django.shortcuts import get_object_or_404
-from django.utils import timezone
 from django_filters.rest_framework import DjangoFilterBackend
-from rest_framework import status, filters, generics
+from rest_framework import status, generics
 from rest_framework import serializers
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.parsers import FormParser, JSONParser, MultiPartParser
 from rest_framework.response import Response
 from rest_framework.request import Request
 
-from core_apps.common.models import ContentView
-from core_apps.common.permissions import IsBranchManager
+from core_apps.common.db.routers import ReplicaReadMixin
+from core_apps.common.permissions import IsAccountExecutive, IsBranchManager, IsTeller
 from core_apps.accounts.utils import create_bank_account
-from core_apps.accounts.models import BankAccount
-from core_apps.common.renderers import GenericJSONRenderer
+from core_apps.common.read_serializers import ValuesListMixin
+from core_apps.common.renderers import GenericJSONRenderer, StreamingListMixin
+from core_apps.common.view_buffer import content_view_buffer
+from .caches import profile_cache
 from .models import NextOfKin, Profile
-from .serializers import NextOfKinSerializer, ProfileListSerializer, ProfileSerializer
+from .search import CustomerSearchFilter, with_account_numbers
+from .serializers import (
+    CustomerSearchSerializer,
+    NextOfKinSerializer,
+    ProfileListSerializer,
+    ProfileListValuesSerializer,
+    ProfileSerializer,
+    ReadyProfileSerializer,
+)
 
 
 class StandardResultsSetPagination(PageNumberPagination):
@@ -28,14 +36,16 @@ class StandardResultsSetPagination(PageNumberPagination):
     max_page_size = 100
 
 
-class ProfileListAPIView(generics.ListAPIView):
+class ProfileListAPIView(
+    ReplicaReadMixin, StreamingListMixin, ValuesListMixin, generics.ListAPIView
+):
     serializer_class = ProfileListSerializer
+    values_serializer_class = ProfileListValuesSerializer
     renderer_classes = [GenericJSONRenderer]
     pagination_class = StandardResultsSetPagination
     object_label = "profiles"
     permission_classes = [IsBranchManager]
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter]
-    search_fields = ["user__first_name", "user__last_name", "user__id_no"]
+    filter_backends = [DjangoFilterBackend, CustomerSearchFilter]
     filterset_fields = ["user__first_name", "user__last_name", "user__id_no"]
 
     def get_queryset(self) -> List[Profile]:
@@ -44,34 +54,68 @@ class ProfileListAPIView(generics.ListAPIView):
         )
 
 
+class CustomerSearchAPIView(StreamingListMixin, generics.ListAPIView):
+    serializer_class = CustomerSearchSerializer
+    renderer_classes = [GenericJSONRenderer]
+    pagination_class = StandardResultsSetPagination
+    object_label = "customers"
+    permission_classes = [IsBranchManager | IsTeller]
+    filter_backends = [CustomerSearchFilter]
+
+    def get_queryset(self) -> List[Profile]:
+        queryset = (
+            Profile.objects.exclude(user__is_staff=True)
+            .exclude(user__is_superuser=True)
+            .select_related("user")
+            .defer("search_document", "search_vector")
+        )
+        return with_account_numbers(queryset)
+
+    def filter_queryset(self, queryset: List[Profile]) -> List[Profile]:
+        search_param = CustomerSearchFilter.search_param
+        if not self.request.query_params.get(search_param, "").strip():
+            return queryset.none()
+        return super().filter_queryset(queryset)
+
+
+class ReadyProfileListAPIView(StreamingListMixin, generics.ListAPIView):
+    serializer_class = ReadyProfileSerializer
+    renderer_classes = [GenericJSONRenderer]
+    pagination_class = StandardResultsSetPagination
+    object_label = "profiles"
+    permission_classes = [IsAccountExecutive]
+
+    def get_queryset(self) -> List[Profile]:
+        return (
+            Profile.objects.filter(account_readiness=Profile.AccountReadiness.READY)
+            .select_related("user")
+            .order_by("updated_at")
+        )
+
+
 class ProfileDetailAPIView(generics.RetrieveUpdateAPIView):
     serializer_class = ProfileSerializer
     parser_classes = [MultiPartParser, FormParser, JSONParser]
     renderer_classes = [GenericJSONRenderer]
     object_label = "profile"
 
-    def get_object(self) -> Profile:
+    def get_profile(self) -> Profile:
         try:
-            profile = Profile.objects.get(user=self.request.user)
-            self.record_profile_view(profile)
-            return profile
+            return (
+                Profile.objects.select_related("user")
+                .prefetch_related("next_of_kin")
+                .get(user_id=self.request.user.pk)
+            )
         except Profile.DoesNotExist:
             raise Http404("Profile does not exist")
 
+    def get_object(self) -> Profile:
+        profile = self.get_profile()
+        self.record_profile_view(profile)
+        return profile
+
     def record_profile_view(self, profile: Profile) -> None:
-        content_type = ContentType.objects.get_for_model(profile)
-        viewer_ip = self.get_client_ip()
-        user = self.request.user
-
-        obj, created = ContentView.objects.update_or_create(
-            content_type=content_type,
-            object_id=profile.id,
-            user=user,
-            viewer_ip=viewer_ip,
-            defaults={
-                "last_viewed": timezone.now(),
-            },
-        )
+        content_view_buffer.record(profile, self.request.user.pk, self.get_client_ip())
 
     def get_client_ip(self) -> str:
         x_forwarded_for = self.request.META.get("HTTP_X_FORWARDED_FOR")
@@ -81,10 +125,17 @@ class ProfileDetailAPIView(generics.RetrieveUpdateAPIView):
             ip = self.request.META.get("REMOTE_ADDR")
         return ip
 
+    def get_profile_data(self) -> dict:
+        # Cached per user; Profile, User and NextOfKin saves invalidate it
+        data = profile_cache.get_or_set(
+            self.request.user.pk,
+            lambda: dict(self.get_serializer(self.get_profile()).data),
+        )
+        self.record_profile_view(Profile(pk=data["id"]))
+        return data
+
     def retrieve(self, request: Request, *args: Any, **kwargs: Any) -> Response:
-        instance = self.get_object()
-        serializer = self.get_serializer(instance)
-        return Response(serializer.data)
+        return Response(self.get_profile_data())
 
     def update(self, request: Request, *args: Any, **kwargs: Any) -> Response:
         partial = kwargs.pop("partial", False)
@@ -96,36 +147,9 @@ class ProfileDetailAPIView(generics.RetrieveUpdateAPIView):
             with transaction.atomic():
                 updated_instance = serializer.save()
 
-                if updated_instance.is_complete_with_next_of_kin():
-                    existing_account = BankAccount.objects.filter(
-                        user=request.user,
-                        currency=updated_instance.account_currency,
-                        account_type=updated_instance.account_type,
-                    ).first()
-
-                    if not existing_account:
-                        bank_account = create_bank_account(
-                            request.user,
-                            currency=updated_instance.account_currency,
-                            account_type=updated_instance.account_type,
-                        )
-                        message = (
-                            "Profile updated and new bank account created successfully. An email "
-                            "has been sent to you with further instructions"
-                        )
-                    else:
-                        message = (
-                            "Profile updated successfully. No new account created as one already "
-                            "exists for this currency and type."
-                        )
-                    return Response(
-                        {
-                            "message": message,
-                            "data": serializer.data,
-                        },
-                        status=status.HTTP_200_OK,
-                    )
-                else:
+                readiness = updated_instance.account_readiness
+
+                if readiness == Profile.AccountReadiness.INCOMPLETE:
                     return Response(
                         {
                             "message": "Profile updated successfully. Please complete all "
@@ -136,6 +160,30 @@ class ProfileDetailAPIView(generics.RetrieveUpdateAPIView):
                         status=status.HTTP_200_OK,
                     )
 
+                if readiness == Profile.AccountReadiness.READY:
+                    create_bank_account(
+                        request.user,
+                        currency=updated_instance.account_currency,
+                        account_type=updated_instance.account_type,
+                    )
+                    updated_instance.account_readiness = Profile.AccountReadiness.OPENED
+                    message = (
+                        "Profile updated and new bank account created successfully. An email "
+                        "has been sent to you with further instructions"
+                    )
+                else:
+                    message = (
+                        "Profile updated successfully. No new account created as one already "
+                        "exists for this currency and type."
+                    )
+                return Response(
+                    {
+                        "message": message,
+                        "data": serializer.data,
+                    },
+                    status=status.HTTP_200_OK,
+                )
+
         except serializers.ValidationError as e:
             return Response({"errors": e.detail}, status=status.HTTP_400_BAD_REQUEST)
         except Exception as e:
@@ -200,11 +248,6 @@ class NextOfKinDetailAPIView(generics.RetrieveUpdateDestroyAPIView):
         self.check_object_permissions(self.request, obj)
         return obj
 
-    def retrieve(self, request: Request, *args: Any, **kwargs: Any) -> Response:
-        instance = self.get_object()
-        serializer = self.get_serializer(instance)
-        return Response(serializer.data)
-
     def update(self, request: Request, *args: Any, **kwargs: Any) -> Response:
         partial = kwargs.pop("partial", False)
         instance = self.get_object()
@@ -0,0 +1,11 @@
+#!/bin/bash
+
+set -o errexit
+
+
+set -o pipefail
+
+set -o nounset
+
+python manage.py migrate --no-input
+python manage.py collectstatic --no-input
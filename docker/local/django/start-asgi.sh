@@ -0,0 +1,13 @@
+#!/bin/bash
+
+set -o errexit
+
+
+set -o pipefail
+
+set -o nounset
+
+# Async views help I/O-bound flows; the transaction list is slower than under
+# gunicorn (see ASYNC_VIEWS in config/settings/base.py)
+export ASYNC_VIEWS=True
+exec uvicorn config.asgi:application --host 0.0.0.0 --port 8000
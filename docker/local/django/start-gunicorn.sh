@@ -0,0 +1,10 @@
+#!/bin/bash
+
+set -o errexit
+
+
+set -o pipefail
+
+set -o nounset
+
+exec gunicorn config.wsgi:application --config config/gunicorn.py
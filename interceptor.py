@@ -10,11 +10,12 @@ class InterceptHandler(logging.Handler):
         except ValueError:
             level = record.levelno
 
-        frame, depth = logging.currentframe(), 2
+        # Take the call site from the record instead of walking stack frames
+        def patch_call_site(log_record):
+            log_record.update(
+                name=record.name, function=record.funcName, line=record.lineno
+            )
 
-        while frame.f_code.co_filename == logging.__file__:
-            frame = frame.f_back
-            depth += 1
-        logger.opt(depth=depth, exception=record.exc_info).log(
+        logger.patch(patch_call_site).opt(exception=record.exc_info).log(
             level, record.getMessage()
         )